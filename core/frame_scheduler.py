@@ -0,0 +1,156 @@
+import time
+import threading
+from collections import deque
+from typing import Any, Dict, Optional
+import dearpygui.dearpygui as dpg
+from config.config import config
+from core.ui_update_queue import UIUpdateQueue, ui_queue
+
+
+class FrameScheduler:
+    """
+    Paces the main render loop.
+
+    - Caps the frame rate to `target_fps` while the GUI is active.
+    - Drops to `idle_fps` once nothing changed (no input, no UI update) for `idle_delay` seconds.
+    - Wakes up immediately when a UI update is posted or an input event is received.
+
+    Render-loop timing is collected and exposed through `get_metrics()`.
+    Background renderers can synchronise on displayed frames with `wait_for_frame()`,
+    so they only convert data that will actually be shown.
+    """
+
+    def __init__(self,
+                target_fps: float = 60,
+                idle_fps: float = 10,
+                idle_delay: float = 1.0,
+                queue: Optional[UIUpdateQueue] = None,
+                smoothing_window: int = 60) -> None:
+        """
+        Args:
+            target_fps: Frame rate cap while active.
+            idle_fps: Frame rate used once the GUI is idle.
+            idle_delay: Seconds without activity before entering idle mode.
+            queue: UI update queue used as wake-up source (defaults to the global `ui_queue`).
+            smoothing_window: Number of frames averaged in the metrics.
+        """
+        self.target_fps = max(1.0, float(target_fps))
+        self.idle_fps = max(0.5, min(float(idle_fps), self.target_fps))
+        self.idle_delay = idle_delay
+        self._queue = queue or ui_queue
+
+        now = time.perf_counter()
+        self._last_activity = now
+        self._frame_start = now
+        self._render_start = now
+
+        self.frame_count = 0
+        self.idle = False
+        self._tick = threading.Condition()
+        self._frame_times = deque(maxlen=smoothing_window)
+        self._render_times = deque(maxlen=smoothing_window)
+        self._wait_times = deque(maxlen=smoothing_window)
+        self._updates = deque(maxlen=smoothing_window)
+
+    def wake(self, *args: Any) -> None:
+        """
+        Leave idle mode and render the next frame as soon as the FPS cap allows.
+        Compatible with DearPyGui handler callback signature.
+        """
+        self._last_activity = time.perf_counter()
+        self._queue.request_frame()
+
+    def register_input_handlers(self) -> None:
+        """Wake the scheduler on any mouse or keyboard event."""
+        with dpg.handler_registry():
+            dpg.add_mouse_move_handler(callback=self.wake)
+            dpg.add_mouse_wheel_handler(callback=self.wake)
+            dpg.add_mouse_click_handler(callback=self.wake)
+            dpg.add_mouse_drag_handler(callback=self.wake)
+            dpg.add_key_press_handler(callback=self.wake)
+            dpg.add_key_down_handler(callback=self.wake)
+
+    def wait_next_frame(self) -> None:
+        """
+        Sleep until the next frame is due.
+        In idle mode, returns early as soon as a UI update or an input is posted.
+        """
+        wait_start = time.perf_counter()
+        min_interval = 1.0 / self.target_fps
+        self.idle = (wait_start - self._last_activity) > self.idle_delay
+
+        if self.idle:
+            remaining = self._frame_start + 1.0 / self.idle_fps - time.perf_counter()
+            if remaining > 0 and self._queue.wait(remaining):
+                self._last_activity = time.perf_counter()
+                self.idle = False
+
+        remaining = self._frame_start + min_interval - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+        now = time.perf_counter()
+        self._wait_times.append(now - wait_start)
+        self._frame_times.append(now - self._frame_start)
+        self._frame_start = now
+
+    def begin_frame(self, applied_updates: int = 0) -> None:
+        """
+        Mark the start of the DearPyGui render call.
+
+        Args:
+            applied_updates: Number of UI updates applied for this frame. Any update keeps the loop active.
+        """
+        if applied_updates:
+            self._last_activity = time.perf_counter()
+        self._updates.append(applied_updates)
+        self._render_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """Mark the end of the DearPyGui render call."""
+        self._render_times.append(time.perf_counter() - self._render_start)
+        with self._tick:
+            self.frame_count += 1
+            self._tick.notify_all()
+
+    def wait_for_frame(self, last_frame: int, timeout: Optional[float] = None) -> int:
+        """
+        Block until a frame newer than `last_frame` has been rendered.
+
+        Args:
+            last_frame: Frame count previously returned by this method (or `frame_count`).
+            timeout: Maximum wait in seconds.
+
+        Returns:
+            The current frame count (unchanged on timeout).
+        """
+        with self._tick:
+            self._tick.wait_for(lambda: self.frame_count > last_frame, timeout)
+            return self.frame_count
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Smoothed render-loop metrics (fps, frame/render/wait time in ms, UI updates per frame, idle flag).
+        """
+        def avg(values):
+            return sum(values) / len(values) if values else 0.0
+
+        frame_time = avg(self._frame_times)
+        return {
+            "fps": 1.0 / frame_time if frame_time > 0 else 0.0,
+            "frame_ms": frame_time * 1000,
+            "render_ms": avg(self._render_times) * 1000,
+            "wait_ms": avg(self._wait_times) * 1000,
+            "updates_per_frame": avg(self._updates),
+            "frame_count": self.frame_count,
+            "idle": self.idle,
+        }
+
+
+_render_config: Dict[str, Any] = config.get("Render", {})
+frame_scheduler: FrameScheduler = FrameScheduler(
+    target_fps=_render_config.get("target_fps", 60),
+    idle_fps=_render_config.get("idle_fps", 10),
+    idle_delay=_render_config.get("idle_delay", 1.0),
+)
@@ -34,3 +34,4 @@ class IOTypes(str, Enum):
     POSITION = ("position", "int-float", "1D position, e.g., 100 or 100.5")
     POINT_LIST = ("point_list", "list", "List of points, e.g., [[x1, y1], [x2, y2]]")
     TRACKING = ("tracking", "dict", "Tracking data, e.g., {id: {'points': [(x,y)], 'dim': [(w,h)], 'color': (r,g,b)}}")
+    OVERLAY = ("overlay", "dict", "Vector annotations drawn over a frame, e.g., {'boxes': (N,4,2), 'points': (N,2), 'polylines': [(M,2)], 'labels': [(x, y, text)]}")
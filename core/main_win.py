@@ -2,6 +2,7 @@ import dearpygui.dearpygui as dpg
 from core.module_registry import export_workspace, MODULES_REGISTRY
 from core.fusion_manager import FusionManager
 from core.node_editor import NodeEditor
+from core.render_metrics import RenderMetrics
 
 
 class Main_win:
@@ -30,6 +31,7 @@ class Main_win:
                     dpg.add_menu_item(label="Show Font Manager", callback=lambda: dpg.show_tool(dpg.mvTool_Font))
                     dpg.add_menu_item(label="Show Item Registry", callback=lambda: dpg.show_tool(dpg.mvTool_ItemRegistry))
                     dpg.add_menu_item(label="Show Metrics", callback=lambda: dpg.show_tool(dpg.mvTool_Metrics))
+                    dpg.add_menu_item(label="Show Render Metrics", callback=lambda: render_metrics.show())
                     dpg.add_menu_item(label="Toggle Fullscreen", callback=lambda: dpg.toggle_viewport_fullscreen())
                     dpg.add_menu_item(label="Show About", callback=lambda: dpg.show_tool(dpg.mvTool_About))
 
@@ -50,4 +52,5 @@ class Main_win:
 # Instantiate global components
 fusion_manager: FusionManager = FusionManager()
 node_editor: NodeEditor = NodeEditor()
+render_metrics: RenderMetrics = RenderMetrics()
 main_win: Main_win = Main_win()
@@ -104,15 +104,20 @@ class ProcessingBase:
 			else:
 				raise ValueError(f"Invalid drop_policy: {self._drop_policy}")
 
-	def get(self) -> Optional[Any]:
+	def get(self, timeout: Optional[float] = None) -> Optional[Any]:
 		"""
 		Get the next processed result from the output queue, if available.
 
+		Args:
+			timeout: Seconds to wait for a result. None returns immediately.
+
 		Returns:
 			The processed result or None if no result is available.
 		"""
 		try:
-			return self._out_queue.get_nowait()
+			if timeout is None:
+				return self._out_queue.get_nowait()
+			return self._out_queue.get(timeout=timeout)
 		except queue.Empty:
 			return None
 
@@ -0,0 +1,48 @@
+import dearpygui.dearpygui as dpg
+from core.frame_scheduler import FrameScheduler, frame_scheduler
+from typing import Any, Optional
+
+
+class RenderMetrics:
+    """
+    UI window displaying the render-loop timing collected by the FrameScheduler.
+    Values are refreshed every frame while the window is visible.
+    """
+
+    def __init__(self, scheduler: Optional[FrameScheduler] = None, label: str = "Render Metrics") -> None:
+        """
+        Initialize the RenderMetrics window (hidden by default).
+        """
+        self.label: str = label
+        self.scheduler: FrameScheduler = scheduler or frame_scheduler
+        self.winID: str = f"render_metrics_{label}"
+        self.text_tag: str = f"{self.winID}_text"
+        self.handler_tag: str = f"{self.winID}_handler"
+
+        with dpg.window(label=self.label, width=300, height=180, tag=self.winID, pos=(25, 25), show=False):
+            dpg.add_text("", tag=self.text_tag)
+
+        with dpg.item_handler_registry(tag=self.handler_tag):
+            dpg.add_item_visible_handler(callback=self.refresh)
+        dpg.bind_item_handler_registry(self.winID, self.handler_tag)
+
+    def show(self) -> None:
+        """
+        Show and focus the RenderMetrics window.
+        """
+        dpg.show_item(self.winID)
+        dpg.focus_item(self.winID)
+
+    def refresh(self, sender: Optional[int] = None, app_data: Optional[Any] = None) -> None:
+        """
+        Update the displayed metrics. Compatible with DearPyGui callback signature.
+        """
+        m = self.scheduler.get_metrics()
+        dpg.set_value(self.text_tag,
+                    f"Mode : {'idle' if m['idle'] else 'active'}\n"
+                    f"FPS : {m['fps']:.1f} (cap {self.scheduler.target_fps:.0f} / idle {self.scheduler.idle_fps:.0f})\n"
+                    f"Frame : {m['frame_ms']:.2f} ms\n"
+                    f"Render : {m['render_ms']:.2f} ms\n"
+                    f"Wait : {m['wait_ms']:.2f} ms\n"
+                    f"UI updates/frame : {m['updates_per_frame']:.1f}\n"
+                    f"Frames : {m['frame_count']}")
@@ -0,0 +1,91 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+import dearpygui.dearpygui as dpg
+from loguru import logger
+
+
+class UIUpdateQueue:
+    """
+    Thread-safe queue of pending GUI updates, drained once per render frame.
+
+    Background threads (viewers, camera loops, sequence runners...) post their
+    updates here instead of calling DearPyGui directly. Updates are coalesced
+    by key: only the latest value posted for a given tag (or call key) is
+    applied, so a widget is written at most once per displayed frame.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, Tuple[Callable[..., Any], tuple, dict]] = {}
+        self._event = threading.Event()
+
+    def set_value(self, tag: Any, value: Any) -> None:
+        """
+        Schedule `dpg.set_value(tag, value)` for the next frame.
+
+        Args:
+            tag: DearPyGui item tag.
+            value: Value to apply. Replaces any value already pending for this tag.
+        """
+        self.submit(("set_value", tag), dpg.set_value, tag, value)
+
+    def configure_item(self, tag: Any, **kwargs: Any) -> None:
+        """
+        Schedule `dpg.configure_item(tag, **kwargs)` for the next frame.
+        Pending configuration for the same tag is replaced, not merged.
+        """
+        self.submit(("configure_item", tag), dpg.configure_item, tag, **kwargs)
+
+    def submit(self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Schedule an arbitrary call for the next frame, coalesced by `key`.
+
+        Args:
+            key: Coalescing key. A later submit with the same key replaces the earlier one.
+            func: Callable executed on the render thread.
+            *args, **kwargs: Arguments forwarded to `func`.
+        """
+        with self._lock:
+            self._pending.pop(key, None)  # Re-insert so the latest update is applied last
+            self._pending[key] = (func, args, kwargs)
+        self._event.set()
+
+    def request_frame(self) -> None:
+        """Wake up the render loop without posting any update (e.g. on user input)."""
+        self._event.set()
+
+    def has_pending(self) -> bool:
+        """Return True if updates (or a frame request) are waiting to be applied."""
+        return self._event.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Block until an update is submitted, a frame is requested or the timeout expires.
+
+        Returns:
+            True if the render loop should run a frame now.
+        """
+        return self._event.wait(timeout)
+
+    def drain(self) -> int:
+        """
+        Apply all pending updates. Must be called from the render loop.
+
+        Returns:
+            Number of updates applied.
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._event.clear()
+
+        for key, (func, args, kwargs) in pending.items():
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                logger.warning(f"UI update {key} failed: {e}")
+
+        return len(pending)
+
+
+ui_queue: UIUpdateQueue = UIUpdateQueue()
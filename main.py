@@ -43,6 +43,8 @@ if __name__ == '__main__' :
 
     from core.module_registry import export_workspace,load_workspace
     from core import manual_layout
+    from core.ui_update_queue import ui_queue
+    from core.frame_scheduler import frame_scheduler
 
     dpg.show_viewport()
     logger.info("Starting the app")
@@ -53,8 +55,13 @@ if __name__ == '__main__' :
     node_editor.rebuild_from_instances(MODULES_REGISTRY)
 
 
+    frame_scheduler.register_input_handlers()
+
     while dpg.is_dearpygui_running():
+        frame_scheduler.wait_next_frame()
+        frame_scheduler.begin_frame(ui_queue.drain())
         dpg.render_dearpygui_frame()
+        frame_scheduler.end_frame()
 
     dpg_running = False
     dpg.destroy_context()
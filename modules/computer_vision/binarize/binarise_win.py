@@ -112,9 +112,9 @@ class Binarize_win(WindowBase):
 					connected_modules = self.connections.get(output_key, [])
 					for module in connected_modules:
 						if idx == 0:
-							module.input_cb(data = result[0], data_type = IOTypes.FRAME) #Frame
+							module.input_cb(data = result[0], data_type = IOTypes.FRAME, source = self.UUID) #Frame
 						elif idx == 1:  # sortie "TXT"
-							module.input_cb(data = result[1], data_type = IOTypes.MASK) #Mask
+							module.input_cb(data = result[1], data_type = IOTypes.MASK, source = self.UUID) #Mask
 						elif idx == 2: 
 							module.input_cb(data = result[self.custom_output.index(dpg.get_value(self.output_format_tag))]) #Custom output
 						elif idx == 3:
@@ -2,6 +2,7 @@ import numpy as np
 import cv2
 from typing import Any, Dict, Optional, Tuple
 from core.processing_base import ProcessingBase
+from tools.overlay.overlay import make_overlay
 
 class Contour_detection(ProcessingBase):
 	def __init__(
@@ -23,7 +24,11 @@ class Contour_detection(ProcessingBase):
 
 	def _process_data(self, data: Tuple[np.ndarray, np.ndarray], p: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
 		frame, mask = data
-		return self._detect_contours(frame, mask, p)
+		result = self._detect_contours(frame, mask, p)
+		# Numbers the results so viewers can pair the overlay with its frame (both are sent with frame_id=)
+		self.frame_id = getattr(self, "frame_id", -1) + 1
+		result[3]["frame_id"] = self.frame_id
+		return result
 
 	def _detect_contours(self, frame: np.ndarray, mask: np.ndarray, params: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
 		lower_surface_thresh = int(params.get('lower_surface_thresh', 25))
@@ -33,9 +38,11 @@ class Contour_detection(ProcessingBase):
 		show_boxes = params.get('show_boxes', True)
 		show_centroids = params.get('show_centroids', True)
 		visu_format = params.get('visu_format', 'Frame')
+		vector_overlay = params.get('vector_overlay', False)
 
 		calibration = 1.0
 		detections = []
+		boxes = []
 
 		if visu_format == 'Mask' and isolate_selection:
 			orig_frame = frame.copy()
@@ -47,7 +54,7 @@ class Contour_detection(ProcessingBase):
 		calib_areas = [(box[1][0]) * (box[1][1]) for box in calib_bounding_boxes]
 
 		if len(calib_areas) < 1:
-			return frame, mask
+			return frame, mask, detections, make_overlay(frame.shape)
 
 		left_thresh = np.percentile(calib_areas, lower_surface_thresh)
 		right_thresh = np.percentile(calib_areas, upper_surface_thresh)
@@ -56,7 +63,7 @@ class Contour_detection(ProcessingBase):
 			if left_thresh <= area <= right_thresh
 		]
 
-		if show_blobs and mask is not None:
+		if show_blobs and mask is not None and not vector_overlay:
 			frame[mask > 0] = (0, 0, 255)
 
 		if isolate_selection and mask is not None:
@@ -77,6 +84,11 @@ class Contour_detection(ProcessingBase):
 				if isolate_selection:
 					cv2.fillPoly(selection_mask, [box], 255)
 
+				if vector_overlay:
+					if show_boxes:
+						boxes.append(cv2.boxPoints(bounding_box))
+					continue
+
 				if show_boxes:
 					cv2.drawContours(frame, [box.astype('int')], -1, (0, 255, 0), 1, cv2.LINE_AA)
 
@@ -89,4 +101,10 @@ class Contour_detection(ProcessingBase):
 			else:
 				frame[selection_mask != 255] = 0
 
-		return frame, mask, detections
+		# Vector mode: boxes and centroids are sent as an overlay instead of being drawn into the frame
+		overlay = make_overlay(frame.shape)
+		if vector_overlay:
+			overlay = make_overlay(frame.shape, boxes=boxes, points=detections if show_centroids else None,
+				box_color=(0, 255, 0), point_color=(255, 0, 0))
+
+		return frame, mask, detections, overlay
\ No newline at end of file
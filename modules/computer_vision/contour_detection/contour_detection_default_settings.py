@@ -6,5 +6,6 @@ class DEFAULT_SETTINGS() :
 	SHOW_CENTROIDS = True
 	ISOLATE_SELECTION = False
 	VISU_FORMAT = "Frame"
+	VECTOR_OVERLAY = False
 	BUFFER_SIZE = 1
 	DROP_POLICY = 'drop_new'
\ No newline at end of file
@@ -29,7 +29,8 @@ class Contour_detection_win(WindowBase):
 			"Mask" : IOTypes.MASK,
 			"Custom" : IOTypes.FRAME,
 			"Pair" : IOTypes.FRAME_MASK_PAIR,
-			"Detections" : IOTypes.POINT_LIST
+			"Detections" : IOTypes.POINT_LIST,
+			"Overlay" : IOTypes.OVERLAY
 		}
 		self.connections = {k: [] for k in self.outputs}
 
@@ -41,7 +42,8 @@ class Contour_detection_win(WindowBase):
 				"show_boxes": DS.SHOW_BOXES, 
 				"show_centroids": DS.SHOW_CENTROIDS, 
 				"isolate_selection": DS.ISOLATE_SELECTION,
-				"visu_format": DS.VISU_FORMAT
+				"visu_format": DS.VISU_FORMAT,
+				"vector_overlay": DS.VECTOR_OVERLAY
 			},
 			buffer_size=DS.BUFFER_SIZE,
 			drop_policy=DS.DROP_POLICY
@@ -55,6 +57,7 @@ class Contour_detection_win(WindowBase):
 		self.isolate_selection_tag = f"isolate_show_selection_{self.UUID}"
 		self.show_boxes_tag = f"contour_show_boxes_{self.UUID}"
 		self.show_centroids_tag = f"contour_show_centroids_{self.UUID}"
+		self.vector_overlay_tag = f"contour_vector_overlay_{self.UUID}"
 		
 		self.output_format_tag = f"contour_output_format_{self.UUID}"
 		self.visu_format_tag = f"contour_visu_format_{self.UUID}"
@@ -77,6 +80,7 @@ class Contour_detection_win(WindowBase):
 			dpg.add_checkbox(label="Isolate selection", default_value=DS.ISOLATE_SELECTION, callback=self._update_param_cb, tag=self.isolate_selection_tag)
 			dpg.add_checkbox(label="Show boxes", default_value=DS.SHOW_BOXES, callback=self._update_param_cb, tag=self.show_boxes_tag)
 			dpg.add_checkbox(label="Show centroids", default_value=DS.SHOW_CENTROIDS, callback=self._update_param_cb, tag=self.show_centroids_tag)
+			dpg.add_checkbox(label="Vector overlay", default_value=DS.VECTOR_OVERLAY, callback=self._update_param_cb, tag=self.vector_overlay_tag)
 
 			with dpg.group(horizontal=True):
 				dpg.add_text("Visu format") 
@@ -97,7 +101,8 @@ class Contour_detection_win(WindowBase):
 			"show_boxes": dpg.get_value(self.show_boxes_tag),
 			"show_centroids": dpg.get_value(self.show_centroids_tag),
 			"isolate_selection": dpg.get_value(self.isolate_selection_tag),
-			"visu_format": dpg.get_value(self.visu_format_tag)
+			"visu_format": dpg.get_value(self.visu_format_tag),
+			"vector_overlay": dpg.get_value(self.vector_overlay_tag)
 		}
 		self.processor.update_params(**params)
 
@@ -132,15 +137,17 @@ class Contour_detection_win(WindowBase):
 					connected_modules = self.connections.get(output_key, [])
 					for module in connected_modules:
 						if idx == 0:
-							module.input_cb(data = result[0], data_type = IOTypes.FRAME) #Frame
+							module.input_cb(data = result[0], data_type = IOTypes.FRAME, source = self.UUID, frame_id = result[3]["frame_id"]) #Frame
 						elif idx == 1:
-							module.input_cb(data = result[1], data_type = IOTypes.MASK) #Mask
+							module.input_cb(data = result[1], data_type = IOTypes.MASK, source = self.UUID) #Mask
 						elif idx == 2: 
 							module.input_cb(data = result[self.custom_output.index(dpg.get_value(self.output_format_tag))]) #Custom output
 						elif idx == 3:
-							module.input_cb(data = [result[0],result[1]], data_type = IOTypes.FRAME_MASK_PAIR)
+							module.input_cb(data = [result[0],result[1]], data_type = IOTypes.FRAME_MASK_PAIR, source = self.UUID, frame_id = result[3]["frame_id"])
 						elif idx == 4:
 							module.input_cb(data = [result[0],result[2]], data_type = IOTypes.POINT_LIST)
+						elif idx == 5:
+							module.input_cb(data = result[3], data_type = IOTypes.OVERLAY, source = self.UUID)
 
 EXPORTED_CLASS = Contour_detection_win
 EXPORTED_NAME = "Contour Detection"
@@ -89,7 +89,7 @@ class Image_processing_win(WindowBase):
 			connected_modules = self.connections.get(output_key, [])
 			for module in connected_modules:
 				if idx == 0:
-					module.input_cb(data=frame, data_type=IOTypes.FRAME)
+					module.input_cb(data=frame, data_type=IOTypes.FRAME, source=self.UUID)
 
 EXPORTED_CLASS = Image_processing_win
 EXPORTED_NAME = "Image Processing"
\ No newline at end of file
@@ -3,6 +3,7 @@ import cv2
 from typing import Any, Dict, Optional
 from core.processing_base import ProcessingBase
 from norfair import Tracker, Detection
+from tools.overlay.overlay import make_overlay
 import random 
 
 class Point_tracker(ProcessingBase):
@@ -35,7 +36,11 @@ class Point_tracker(ProcessingBase):
 	
 	def _process_data(self, data, p: Dict[str, Any]) -> Any:
 		frame, point_list = data
-		return self._track_points(frame,point_list, p)
+		result = self._track_points(frame,point_list, p)
+		# Numbers the results so viewers can pair the overlay with its frame (both are sent with frame_id=)
+		self.frame_id = getattr(self, "frame_id", -1) + 1
+		result[2]["frame_id"] = self.frame_id
+		return result
 
 	# def _track_points(self, frame: np.ndarray, point_list: list, p: Dict[str, Any]) -> tuple[np.ndarray, np.ndarray]:
 	# 	detections = [Detection(np.array(center)) for center in point_list]
@@ -85,6 +90,8 @@ class Point_tracker(ProcessingBase):
 		show_age = p.get("show_age", False)
 		show_distance = p.get("show_distance", False)
 		show_speed = p.get("show_speed", False)
+		vector_overlay = p.get("vector_overlay", False)
+		trails, trail_colors, labels = [], [], []
 
 		for obj in tracked_objects:
 			cx, cy = map(int, obj.estimate[0])
@@ -106,7 +113,10 @@ class Point_tracker(ProcessingBase):
 			# Trail
 			if show_trail:
 				trail = self.tracking[obj.id]["points"][-trail_length:]
-				if len(trail) >= 2:
+				if vector_overlay:
+					trails.append(trail)
+					trail_colors.append(self.tracking[obj.id]["color"][::-1])
+				elif len(trail) >= 2:
 					for i in range(1, len(trail)):
 						pt1 = trail[i - 1]
 						pt2 = trail[i]
@@ -124,10 +134,17 @@ class Point_tracker(ProcessingBase):
 				speed = self.tracking[obj.id]['distance'] / obj.age
 				text_lines.append(f"Speed:{speed:.2f}")
 
+			if vector_overlay:
+				if text_lines:
+					labels.append((cx + 4, cy, " ".join(text_lines)))
+				continue
+
 			for i, line in enumerate(text_lines):
 				cv2.putText(
 					frame, line, (cx + 4, cy + 12 + i * 12),
 					cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 0), 1, cv2.LINE_AA
 				)
 
-		return frame, self.tracking
\ No newline at end of file
+		# Vector mode: trails and texts are sent as an overlay instead of being drawn into the frame
+		overlay = make_overlay(frame.shape, polylines=trails, polyline_colors=trail_colors, labels=labels)
+		return frame, self.tracking, overlay
\ No newline at end of file
@@ -2,5 +2,6 @@ class DEFAULT_SETTINGS() :
 	DISTANCE_FUNCTION = "euclidean"
 	DISTANCE_TRESHOLD = 30
 	TRAIL_LENGTH = 30
+	VECTOR_OVERLAY = False
 	BUFFER_SIZE = 1
 	DROP_POLICY = 'drop_new'
\ No newline at end of file
@@ -27,6 +27,7 @@ class Tracker_win(WindowBase):
 		self.outputs = {
 			"Frame" : IOTypes.FRAME,
 			"Tracking" : IOTypes.TRACKING,
+			"Overlay" : IOTypes.OVERLAY,
 		}
 		self.connections = {k: [] for k in self.outputs}
 
@@ -35,6 +36,7 @@ class Tracker_win(WindowBase):
 				"trail_length": DS.TRAIL_LENGTH,
 				"distance_function": DS.DISTANCE_FUNCTION, 
 				"distance_threshold": DS.DISTANCE_TRESHOLD,
+				"vector_overlay": DS.VECTOR_OVERLAY,
 			},
 			buffer_size=DS.BUFFER_SIZE,
 			drop_policy=DS.DROP_POLICY
@@ -49,6 +51,7 @@ class Tracker_win(WindowBase):
 		self.show_age_tag = f"tracker_show_age_{self.UUID}"
 		self.show_distance_tag = f"tracker_show_distance_{self.UUID}"
 		self.show_speed_tag = f"tracker_show_speed_{self.UUID}"
+		self.vector_overlay_tag = f"tracker_vector_overlay_{self.UUID}"
 
 		self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
 		self._monitor_thread_running = True
@@ -67,6 +70,7 @@ class Tracker_win(WindowBase):
 			dpg.add_checkbox(label="Show age", default_value=False, callback=self._update_param_cb, tag=self.show_age_tag)
 			dpg.add_checkbox(label="Show distance", default_value=False, callback=self._update_param_cb, tag=self.show_distance_tag)
 			dpg.add_checkbox(label="Show speed", default_value=False, callback=self._update_param_cb, tag=self.show_speed_tag)
+			dpg.add_checkbox(label="Vector overlay", default_value=DS.VECTOR_OVERLAY, callback=self._update_param_cb, tag=self.vector_overlay_tag)
 
 	def _update_param_cb(self, sender, app_data):
 		"""Callback to update parameters when sliders or checkboxes are changed."""
@@ -77,7 +81,8 @@ class Tracker_win(WindowBase):
 			"show_id": dpg.get_value(self.show_id_tag),
 			"show_age": dpg.get_value(self.show_age_tag),
 			"show_distance": dpg.get_value(self.show_distance_tag),		
-			"show_speed": dpg.get_value(self.show_speed_tag)
+			"show_speed": dpg.get_value(self.show_speed_tag),
+			"vector_overlay": dpg.get_value(self.vector_overlay_tag)
 		}
 		self.processor.update_params(**params)
 
@@ -117,9 +122,11 @@ class Tracker_win(WindowBase):
 					connected_modules = self.connections.get(output_key, [])
 					for module in connected_modules:
 						if idx == 0:
-							module.input_cb(data = result[0], data_type = IOTypes.FRAME) #Frame
+							module.input_cb(data = result[0], data_type = IOTypes.FRAME, source = self.UUID, frame_id = result[2]["frame_id"]) #Frame
 						elif idx == 1:
 							module.input_cb(data = result[1], data_type = IOTypes.TRACKING) #Tracking
+						elif idx == 2:
+							module.input_cb(data = result[2], data_type = IOTypes.OVERLAY, source = self.UUID) #Overlay
 
 EXPORTED_CLASS = Tracker_win
 EXPORTED_NAME = "Tracker"
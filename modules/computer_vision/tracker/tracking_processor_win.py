@@ -184,7 +184,7 @@ class Tracking_processor_win(WindowBase):
 			connected_modules = self.connections.get(output_key, [])
 			for module in connected_modules:
 				if idx == 0:
-					module.input_cb(data=frame, data_type=IOTypes.FRAME)
+					module.input_cb(data=frame, data_type=IOTypes.FRAME, source=self.UUID)
 				if idx == 1:
 					module.input_cb(tracking, data_type=IOTypes.TRACKING)
 
@@ -93,9 +93,9 @@ class Binarize_demo_win(WindowBase):
 					connected_modules = self.connections.get(output_key, [])
 					for module in connected_modules:
 						if idx == 0: 
-							module.input_cb(data = result[0], data_type = IOTypes.FRAME)
+							module.input_cb(data = result[0], data_type = IOTypes.FRAME, source = self.UUID)
 						elif idx == 1:
-							module.input_cb(data = result[1], data_type = IOTypes.MASK)
+							module.input_cb(data = result[1], data_type = IOTypes.MASK, source = self.UUID)
 							
 
 EXPORTED_CLASS = Binarize_demo_win
\ No newline at end of file
@@ -0,0 +1,150 @@
+import dearpygui.dearpygui as dpg
+from core.window_base import WindowBase
+from core.input_ouput_types import IOTypes
+from core.ui_update_queue import ui_queue
+from tools.folder_index.folder_index import FolderIndex
+import threading, os, time
+from loguru import logger
+
+class Folder_watcher_win(WindowBase):
+	"""
+	Watches a folder and sends only the new or changed files downstream.
+
+	The folder is polled with an incremental FolderIndex (one scandir per interval,
+	cached stats), so growing acquisition folders are never re-listed as a whole.
+	With "Wait until complete", a file is sent once its size stopped changing for one
+	interval, which makes "process files as they arrive" pipelines safe.
+	"""
+
+	def __init__(self,
+				label="Folder Watcher",
+				win_width=300,
+				win_height=180,
+				pos=(10, 10),
+				uuid=None,
+				outputs=None,
+				visible=True,
+				folder="",
+				extensions="mp4,avi,tif,tiff,npy,png",
+				interval=1.0,
+				settle=True,
+				send_existing=False):
+
+		super().__init__(label=label, pos=pos, win_width=win_width, win_height=win_height, uuid=uuid, outputs=outputs, visible=visible)
+
+		self.folder = folder
+		self.extensions = extensions
+		self.interval = interval
+		self.settle = settle
+		self.send_existing = send_existing
+		self._persistent_fields = ["label", "folder", "extensions", "interval", "settle", "send_existing"]
+		self.accepted_input_types = [IOTypes.FOLDER_PATH, IOTypes.TRIGGER]
+
+		self.outputs = {
+			"New file": IOTypes.FILE_PATH,
+			"Changed file": IOTypes.FILE_PATH,
+		}
+		self.connections = {k: [] for k in self.outputs}
+
+		self.winID = f"folder_watcher_win_{self.UUID}"
+		self.folder_tag = f"folder_watcher_folder_{self.UUID}"
+		self.watch_tag = f"folder_watcher_watch_{self.UUID}"
+		self.stats_tag = f"folder_watcher_stats_{self.UUID}"
+
+		self.index = None
+		self.watching = False
+		self.watch_thread = None
+		self.sent = 0
+
+		with dpg.window(label=self.label, width=self.win_width, height=self.win_height,
+						pos=self.pos, tag=self.winID, show=self.visible):
+
+			dpg.add_input_text(label="Folder", tag=self.folder_tag, default_value=self.folder, width=-80,
+				callback=lambda s, a: setattr(self, "folder", a))
+			dpg.add_input_text(label="Extensions", default_value=self.extensions, width=-80,
+				callback=lambda s, a: setattr(self, "extensions", a))
+			dpg.add_input_float(label="Interval (s)", default_value=self.interval, min_value=0.05, min_clamped=True, step=0, format="%.2f",
+				width=80, callback=lambda s, a: setattr(self, "interval", a))
+			dpg.add_checkbox(label="Wait until complete", default_value=self.settle, callback=lambda s, a: setattr(self, "settle", a))
+			dpg.add_checkbox(label="Send existing files", default_value=self.send_existing, callback=lambda s, a: setattr(self, "send_existing", a))
+			dpg.add_button(label="WATCH", tag=self.watch_tag, callback=self.toggle_watch)
+			dpg.add_text("", tag=self.stats_tag)
+
+	def toggle_watch(self, sender=None, app_data=None):
+		if self.watching:
+			self.stop_watch()
+		else:
+			self.start_watch()
+
+	def start_watch(self):
+		if self.watching:
+			return
+		if not os.path.isdir(self.folder):
+			logger.warning(f"{self.winID} Not a folder: {self.folder}")
+			return
+		self.index = FolderIndex(self.folder, self.extensions, settle=self.settle)
+		if not self.send_existing:
+			self.index.settle = False
+			self.index.scan()  # Files already there are indexed, not sent
+			self.index.settle = self.settle
+		self.sent = 0
+		self.watching = True
+		ui_queue.configure_item(self.watch_tag, label="STOP")
+		self.watch_thread = threading.Thread(target=self.watch_loop, daemon=True)
+		self.watch_thread.start()
+
+	def stop_watch(self):
+		self.watching = False
+		if self.watch_thread is not None and self.watch_thread is not threading.current_thread():
+			self.watch_thread.join(timeout=max(1.0, self.interval * 2))
+		self.watch_thread = None
+		ui_queue.configure_item(self.watch_tag, label="WATCH")
+
+	def watch_loop(self):
+		"""Polls the folder and sends the added and changed files."""
+		while self.watching:
+			start = time.perf_counter()
+			try:
+				added, changed, removed = self.index.scan()
+			except OSError as e:
+				logger.warning(f"{self.winID} Could not scan {self.index.folder}: {e}")
+				added, changed = [], []
+			scan_ms = (time.perf_counter() - start) * 1000
+
+			for path in added:
+				self.output_cb(0, path)
+			for path in changed:
+				self.output_cb(1, path)
+			self.sent += len(added) + len(changed)
+			ui_queue.set_value(self.stats_tag, f"Indexed: {len(self.index.entries)} | Sent: {self.sent} | Scan: {scan_ms:.1f} ms")
+
+			deadline = start + self.interval
+			while self.watching and time.perf_counter() < deadline:
+				time.sleep(min(0.1, max(0.0, deadline - time.perf_counter())))
+
+	def input_cb(self, *args, **kwargs):
+		data = kwargs.get("data") or (args[0] if args else None)
+		if isinstance(data, str) and os.path.isdir(data):
+			self.stop_watch()
+			self.folder = data
+			ui_queue.set_value(self.folder_tag, data)
+			self.start_watch()
+		elif data == "START":
+			self.start_watch()
+		elif data == "STOP":
+			self.stop_watch()
+
+	def output_cb(self, output_index, path):
+		for idx, output_key in enumerate(self.outputs):
+			if idx != output_index:
+				continue
+			for module in self.connections.get(output_key, []):
+				module.input_cb(data=path)
+
+	def close(self):
+		"""Stops watching before closing the window."""
+		self.watching = False
+		super().close()
+
+EXPORTED_CLASS = Folder_watcher_win
+EXPORTED_NAME = "Folder Watcher"
@@ -0,0 +1,106 @@
+import copy
+import numpy as np
+import cv2
+
+
+class AutoLevels:
+	"""
+	Histogram-based intensity statistics for auto-levels.
+
+	A single histogram is computed per frame (optionally on a strided subsample),
+	then any percentile is read from its cumulative sum instead of sorting the frame.
+	Min and max are exact: one cv2.minMaxLoc pass over the whole frame, since a
+	subsample can miss isolated extreme pixels. Levels can be smoothed over time to avoid flickering; the smoothing
+	state is reset when the frame shape or dtype changes (a new source).
+	"""
+
+	def __init__(self, max_samples: int | None = 262144, smoothing: float = 0.5):
+		"""
+		Args:
+			max_samples: Approximate number of pixels used for the histogram (None = whole frame).
+			smoothing: Exponential smoothing factor in [0, 1). 0 disables temporal smoothing.
+		"""
+		self.max_samples = max_samples
+		self.smoothing = smoothing
+		self.hist = None
+		self.cdf = None
+		self.total = 0
+		self.min = 0
+		self.max = 0
+		self._frame = None         # Last frame, kept for the non-zero minimum when the histogram is subsampled
+		self._nonzero_min = None   # Cached non-zero minimum of the last frame
+		self._smoothed = {}
+		self._signature = None  # (shape, dtype) of the last frame
+
+	def compute(self, frame: np.ndarray) -> np.ndarray:
+		"""
+		Computes the histogram of a single-channel uint8/uint16 frame.
+
+		Returns:
+			Histogram with one bin per possible value (256 or 65536 bins).
+		"""
+		bins = 256 if frame.dtype == np.uint8 else 65536
+		step = 1
+		if self.max_samples and frame.size > self.max_samples:
+			step = int(np.sqrt(frame.size / self.max_samples))
+		sample = frame if step <= 1 else np.ascontiguousarray(frame[::step, ::step])
+
+		hist = cv2.calcHist([sample], [0], None, [bins], [0, bins]).ravel()
+		signature = (frame.shape, frame.dtype)
+		if signature != self._signature:
+			self.reset()
+			self._signature = signature
+		self.hist = hist
+		low, high, _, _ = cv2.minMaxLoc(frame)
+		self.min, self.max = int(low), int(high)
+		self._frame = frame if step > 1 else None
+		self._nonzero_min = None
+		self.cdf = np.cumsum(hist)
+		self.total = self.cdf[-1]
+		return hist
+
+	def percentile(self, p: float) -> int:
+		"""Returns the p-th percentile (0-100) of the last computed histogram."""
+		if not self.total:
+			return 0
+		target = max(1.0, np.ceil(p / 100.0 * self.total))
+		return int(np.searchsorted(self.cdf, target, side="left"))
+
+	def min_max(self, ignore_zero: bool = False) -> tuple[int, int]:
+		"""
+		Returns the exact (min, max) values of the last frame.
+
+		Args:
+			ignore_zero: Ignore zero-valued pixels (e.g. masked or dead areas).
+		"""
+		if self.hist is None or (ignore_zero and self.max == 0):
+			return 0, 0
+		if not ignore_zero or self.min > 0:
+			return self.min, self.max
+		if self._nonzero_min is None:
+			if self._frame is None:
+				self._nonzero_min = int(np.flatnonzero(self.hist[1:])[0]) + 1  # Histogram of the whole frame: exact
+			else:
+				self._nonzero_min = int(cv2.minMaxLoc(self._frame, mask=(self._frame > 0).view(np.uint8))[0])
+		return self._nonzero_min, self.max
+
+	def smooth(self, key: str, value: float) -> float:
+		"""Temporally smooths a level (exponential moving average, one state per key)."""
+		previous = self._smoothed.get(key)
+		if previous is not None and self.smoothing > 0:
+			value = self.smoothing * previous + (1 - self.smoothing) * value
+		self._smoothed[key] = value
+		return value
+
+	def reset(self) -> None:
+		"""Forgets the smoothing state (e.g. when the source changes)."""
+		self._smoothed.clear()
+
+	def detached(self) -> "AutoLevels":
+		"""
+		Returns a copy starting from the current smoothing state, for one-off renders (exports):
+		computing and smoothing on it leaves this instance untouched.
+		"""
+		levels = copy.copy(self)
+		levels._smoothed = dict(self._smoothed)
+		return levels
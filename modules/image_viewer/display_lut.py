@@ -0,0 +1,133 @@
+import numpy as np
+import cv2
+
+PALETTES = {
+	"B&W": None,
+	"Inferno": cv2.COLORMAP_INFERNO,
+	"Jet": cv2.COLORMAP_JET,
+	"HSV": cv2.COLORMAP_HSV,
+}
+
+
+class DisplayLUT:
+	"""
+	Single lookup table display pipeline for 8/12/16-bit grayscale frames.
+
+	The whole chain (bit-depth reduction, [inf, sup] intensity remap, negative and
+	color palette) is folded into one table mapping every possible raw value to an
+	RGB float triplet. A frame is then rendered with a single indexed gather into a
+	preallocated texture buffer. The table is only rebuilt when a setting changes.
+	"""
+
+	def __init__(self):
+		self.lut = None
+		self.palette_rgb = None
+		self._lut_key = None
+		self._palette_key = None
+		self._buffer = None
+		self._scale_cache = {}
+
+	@staticmethod
+	def prepare_frame(frame: np.ndarray) -> np.ndarray:
+		"""Returns a single-channel uint8/uint16 view of the frame usable as LUT indices."""
+		if frame.ndim == 3:
+			frame = frame[..., 0] if frame.shape[2] == 1 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+		if frame.dtype not in (np.uint8, np.uint16):
+			frame = np.clip(frame, 0, 65535).astype(np.uint16)
+		return frame
+
+	@staticmethod
+	def compute_levels(depth: str, inf: float, sup: float, size: int, norm_range=None) -> np.ndarray:
+		"""
+		Computes the 8-bit display level of every raw value in [0, size).
+
+		Args:
+			depth: "8bit", "12bit", "16bit_abs" or "16bit_norm".
+			inf, sup: Display range, expressed in 8-bit levels after depth reduction.
+			size: Number of raw values (256 for uint8 frames, 65536 for uint16).
+			norm_range: (min, max) of the frame, used by "16bit_norm".
+		"""
+		low = DisplayLUT.reduce_depth(depth, np.arange(size, dtype=np.float32), norm_range)
+		return (np.clip((low - inf) / max(sup - inf, 1e-6), 0, 1) * 255).astype(np.uint8)
+
+	@staticmethod
+	def reduce_depth(depth: str, values, norm_range=None):
+		"""Maps raw intensities (scalar or array) to 8-bit levels according to the image depth."""
+		match depth:
+			case "12bit":
+				low = np.floor(values / 16)
+			case "16bit_abs":
+				low = np.floor(values / 256)
+			case "16bit_norm":
+				vmin, vmax = norm_range if norm_range is not None else (0, 65535)
+				low = np.floor((values - vmin) * (255.0 / max(vmax - vmin, 1)))
+			case _:
+				low = values
+		return np.clip(low, 0, 255)
+
+	def get_palette(self, negative: bool, palette: str) -> np.ndarray:
+		"""Returns the 256-entry RGB float palette, negative included."""
+		key = (negative, palette)
+		if key != self._palette_key:
+			levels = np.arange(256, dtype=np.uint8)
+			if negative:
+				levels = 255 - levels
+			colormap = PALETTES.get(palette)
+			if colormap is None:
+				rgb = np.repeat(levels[:, None], 3, axis=1)
+			else:
+				rgb = cv2.applyColorMap(levels.reshape(256, 1), colormap).reshape(256, 3)[:, ::-1]
+			self.palette_rgb = np.ascontiguousarray(rgb, dtype=np.float32) / 255.0
+			self._palette_key = key
+			self._scale_cache.clear()
+		return self.palette_rgb
+
+	def update(self, depth: str, inf: float, sup: float, negative: bool, palette: str, size: int, norm_range=None) -> bool:
+		"""
+		Rebuilds the LUT if any setting changed.
+
+		Returns:
+			True if the table was rebuilt.
+		"""
+		key = (depth, inf, sup, negative, palette, size, norm_range if depth == "16bit_norm" else None)
+		if key == self._lut_key:
+			return False
+		palette_rgb = self.get_palette(negative, palette)
+		self.lut = palette_rgb[self.compute_levels(depth, inf, sup, size, norm_range)]
+		self._lut_key = key
+		return True
+
+	def render(self, frame: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+		"""
+		Gathers the LUT into a preallocated texture buffer.
+
+		Args:
+			frame: Prepared frame (see `prepare_frame`), matching the current LUT size.
+			out: (h, w, 3) float32 destination. Defaults to an internal buffer reused between calls.
+
+		Returns:
+			The filled (h, w, 3) float32 RGB buffer.
+		"""
+		shape = frame.shape + (3,)
+		if out is None or out.shape != shape:
+			if self._buffer is None or self._buffer.shape != shape:
+				self._buffer = np.empty(shape, dtype=np.float32)
+			out = self._buffer
+		np.take(self.lut, frame, axis=0, out=out, mode='clip')
+		return out
+
+	def add_intensity_scale(self, buffer: np.ndarray, scale_width: int = 30) -> np.ndarray:
+		"""Draws the vertical palette scale bar on the left of the rendered buffer."""
+		h = buffer.shape[0]
+		scale = self._scale_cache.get(h)
+		if scale is None:
+			gradient = np.linspace(255, 0, h).astype(np.uint8)
+			scale = self.palette_rgb[gradient][:, None, :]
+			self._scale_cache[h] = scale
+		buffer[:, :scale_width] = scale
+		return buffer
+
+	@staticmethod
+	def to_bgr8(buffer: np.ndarray) -> np.ndarray:
+		"""Converts a rendered float RGB buffer to an 8-bit BGR image (for export)."""
+		return np.ascontiguousarray((buffer[..., ::-1] * 255 + 0.5).astype(np.uint8))
@@ -0,0 +1,56 @@
+import threading
+from typing import Any, Optional
+
+
+class FrameMailbox:
+	"""
+	Single-slot, latest-wins exchange between a frame producer and a render thread.
+
+	Posting never blocks: a frame that has not been consumed yet is simply replaced
+	(and counted as dropped), so skipped frames cost nothing on the producer side.
+	"""
+
+	def __init__(self):
+		self._cond = threading.Condition()
+		self._item = None
+		self._has_item = False
+		self._closed = False
+		self.dropped = 0
+
+	def put(self, item: Any) -> None:
+		"""Post an item, replacing any item not yet consumed."""
+		with self._cond:
+			if self._has_item:
+				self.dropped += 1
+			self._item = item
+			self._has_item = True
+			self._cond.notify()
+
+	def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+		"""
+		Wait for the next item.
+
+		Returns:
+			The latest posted item, or None on timeout or once the mailbox is closed.
+		"""
+		with self._cond:
+			if not self._cond.wait_for(lambda: self._has_item or self._closed, timeout):
+				return None
+			return self._take()
+
+	def get_nowait(self) -> Optional[Any]:
+		"""Return the latest posted item without waiting, or None if the slot is empty."""
+		with self._cond:
+			return self._take()
+
+	def close(self) -> None:
+		"""Wake up any waiting consumer and refuse to wait from now on."""
+		with self._cond:
+			self._closed = True
+			self._cond.notify_all()
+
+	def _take(self) -> Optional[Any]:
+		item = self._item
+		self._item = None
+		self._has_item = False
+		return item
@@ -0,0 +1,258 @@
+import dearpygui.dearpygui as dpg
+import numpy as np
+import threading
+import time
+import cv2
+
+from core.window_base import WindowBase
+from core.input_ouput_types import IOTypes
+from core.module_registry import MODULES_REGISTRY
+from core.ui_update_queue import ui_queue
+from core.frame_scheduler import frame_scheduler
+from modules.video_reader.fps_counter import FPSCounter
+from modules.image_viewer.texture_pool import TexturePool
+from modules.image_viewer.texture_converter import TextureConverter
+from loguru import logger
+
+
+class GridTile:
+	"""Latest frame and statistics of one source stream of the grid."""
+
+	def __init__(self, key: str, name: str):
+		self.key = key
+		self.name = name
+		self.frame = None
+		self.version = 0
+		self.last_seen = 0.0
+		self.fps_counter = FPSCounter(smoothing_window=10)
+		self.fps = 0.0
+
+
+class Grid_viewer_win(WindowBase):
+	"""
+	Grid_viewer_win:
+	Displays several FRAME streams side by side in a single plot.
+	Each connected source gets a tile; tiles are downscaled and composited into one
+	atlas texture, uploaded at most once per displayed frame (capped to `display_fps`)
+	whatever the number of streams.
+	"""
+
+	def __init__(self,
+				label="Grid Viewer",
+				win_width=1000,
+				win_height=800,
+				pos=(100, 100),
+				uuid=None,
+				outputs=None,
+				visible=True,
+				tile_width=320,
+				tile_height=240,
+				display_fps=30,
+				fps_counter=True):
+
+		super().__init__(label=label, pos=pos, win_width=win_width, win_height=win_height,
+			uuid=uuid, outputs=outputs or [], visible=visible)
+
+		self.tile_width = tile_width
+		self.tile_height = tile_height
+		self.display_fps = display_fps
+		self.fps_counter = fps_counter
+		self._persistent_fields = ["label", "tile_width", "tile_height", "display_fps", "fps_counter"]
+
+		self.plot_tag = f"grid_viewer_plot_{self.UUID}"
+		self.x_axis_tag = f"grid_viewer_x_axis_{self.UUID}"
+		self.y_axis_tag = f"grid_viewer_y_axis_{self.UUID}"
+		self.display_fps_tag = f"grid_viewer_display_fps_{self.UUID}"
+		self.streams_tag = f"grid_viewer_streams_{self.UUID}"
+
+		self.accepted_input_types = [IOTypes.FRAME, IOTypes.MASK]
+		self.outputs = {}
+		self.connections = {k: [] for k in self.outputs}
+
+		# Tiles and atlas state
+		self.lock = threading.Lock()
+		self.tiles: dict[str, GridTile] = {}
+		self.layout: list[str] = []
+		self.columns = 0
+		self.rows = 0
+		self.atlas_pool = TexturePool(f"grid_viewer_atlas_{self.UUID}", self.y_axis_tag)
+		self.converter = TextureConverter()
+		self._slot_versions = {}
+		self._annotation_tags = []
+		self.display_fps_counter = FPSCounter(smoothing_window=10)
+
+		self._build_interface(win_width, win_height, pos)
+
+		self._render_running = True
+		self.render_thread = threading.Thread(target=self._render_loop, daemon=True)
+		self.render_thread.start()
+
+	def _build_interface(self, width, height, pos):
+		with dpg.window(label=self.label, width=width, height=height, pos=pos, tag=self.winID, show=self.visible):
+			with dpg.group(horizontal=True):
+				dpg.add_text("Streams: ")
+				dpg.add_text("0", tag=self.streams_tag)
+				dpg.add_text("Display FPS: ")
+				dpg.add_text("0", tag=self.display_fps_tag)
+			with dpg.plot(tag=self.plot_tag, no_menus=True, no_title=True, width=-1, height=-1, equal_aspects=True):
+				dpg.add_plot_axis(dpg.mvXAxis, no_gridlines=True, no_tick_labels=True, no_tick_marks=True, tag=self.x_axis_tag)
+				dpg.add_plot_axis(dpg.mvYAxis, no_gridlines=True, no_tick_labels=True, no_tick_marks=True, tag=self.y_axis_tag)
+
+	def input_cb(self, *args, **kwargs):
+		"""
+		Stores the latest frame of the sending stream.
+		Senders identify themselves with `source=` (their UUID, or the module itself);
+		frames without a source share a single "Input" tile.
+		"""
+		frame = kwargs.get("data") if "data" in kwargs else (args[0] if args else None)
+		if not isinstance(frame, np.ndarray):
+			return
+
+		source = kwargs.get("source")
+		key = getattr(source, "UUID", source) or "input"
+		with self.lock:
+			tile = self.tiles.get(key)
+			if tile is None:
+				tile = GridTile(key, self._source_name(key))
+				self.tiles[key] = tile
+			tile.frame = frame
+			tile.version += 1
+			tile.last_seen = time.time()
+			tile.fps = tile.fps_counter.get_fps()[1]
+		frame_scheduler.wake()
+
+	@staticmethod
+	def _source_name(key: str) -> str:
+		"""Returns the label of the module with this UUID, or the key itself."""
+		for module in list(MODULES_REGISTRY):
+			if module.UUID == key:
+				return module.label
+		return "Input" if key == "input" else str(key)
+
+	def get_sources(self) -> list[str]:
+		"""
+		Returns the tile keys to display, in order: connected modules first (registry order),
+		then streams that sent frames recently without being connected (e.g. explicit `source=`).
+		"""
+		connected = [module.UUID for module in list(MODULES_REGISTRY)
+			if any(self in targets for targets in module.connections.values())]
+		now = time.time()
+		with self.lock:
+			recent = [key for key, tile in self.tiles.items() if key not in connected and now - tile.last_seen < 2.0]
+		return connected + recent
+
+	def _update_layout(self, sources: list[str]) -> None:
+		"""Recomputes the grid when streams are added or removed."""
+		self.layout = sources
+		count = max(1, len(sources))
+		self.columns = int(np.ceil(np.sqrt(count)))
+		self.rows = int(np.ceil(count / self.columns))
+		self._slot_versions.clear()
+		self.atlas_pool.clear_buffers()
+		ui_queue.set_value(self.streams_tag, str(len(sources)))
+		ui_queue.submit((self.plot_tag, "fit"), self.fit_plot)
+
+	def fit_plot(self):
+		"""Fits the plot axes to the atlas."""
+		dpg.fit_axis_data(self.x_axis_tag)
+		dpg.fit_axis_data(self.y_axis_tag)
+
+	def _render_loop(self):
+		"""
+		Composites and uploads the atlas after displayed GUI frames, at most `display_fps` times per second.
+		Tiles are only converted when they will be shown.
+		"""
+		last_tick = frame_scheduler.frame_count
+		next_frame = time.perf_counter()
+		while self._render_running:
+			last_tick = frame_scheduler.wait_for_frame(last_tick, timeout=0.1)
+			now = time.perf_counter()
+			if now < next_frame:
+				continue
+			next_frame = max(next_frame + 1.0 / max(1, self.display_fps), now)
+
+			try:
+				self._render_atlas()
+			except Exception as e:
+				logger.warning(f"{self.winID} failed to render grid: {e}")
+
+	def _render_atlas(self):
+		sources = self.get_sources()
+		if sources != self.layout:
+			self._update_layout(sources)
+
+		atlas_w, atlas_h = self.columns * self.tile_width, self.rows * self.tile_height
+		slot = self.atlas_pool.acquire(atlas_w, atlas_h)
+		versions = self._slot_versions.setdefault(id(slot), {})
+
+		drawn = False
+		for index, key in enumerate(self.layout):
+			with self.lock:
+				tile = self.tiles.get(key)
+				frame, version = (tile.frame, tile.version) if tile is not None else (None, 0)
+			if frame is None or versions.get(key) == version:
+				continue
+
+			row, col = divmod(index, self.columns)
+			x0, y0 = col * self.tile_width, row * self.tile_height
+			self._draw_tile(frame, slot.buffer[y0:y0 + self.tile_height, x0:x0 + self.tile_width])
+			versions[key] = version
+			drawn = True
+
+		if not drawn:
+			return
+
+		self.atlas_pool.present(slot, [0, 0], [atlas_w, atlas_h])
+		ui_queue.submit((self.plot_tag, "annotations"), self._update_annotations, self._tile_labels(), atlas_h)
+		ui_queue.set_value(self.display_fps_tag, f"{self.display_fps_counter.get_fps()[1]:.1f}")
+
+	def _draw_tile(self, frame: np.ndarray, cell: np.ndarray) -> None:
+		"""Fits the frame in its cell (aspect ratio kept, INTER_AREA) and converts it in place."""
+		h, w = frame.shape[:2]
+		cell_h, cell_w = cell.shape[:2]
+		scale = min(cell_w / w, cell_h / h)
+		fit_w, fit_h = max(1, int(w * scale)), max(1, int(h * scale))
+		if (fit_w, fit_h) != (w, h):
+			frame = cv2.resize(frame, (fit_w, fit_h), interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_NEAREST)
+
+		ox, oy = (cell_w - fit_w) // 2, (cell_h - fit_h) // 2
+		if (fit_w, fit_h) != (cell_w, cell_h):
+			cell.fill(0)
+		self.converter.convert(frame, cell[oy:oy + fit_h, ox:ox + fit_w])
+
+	def _tile_labels(self) -> list[tuple[str, float, float]]:
+		"""Returns (text, x, y) of every tile label, in plot coordinates."""
+		labels = []
+		atlas_h = self.rows * self.tile_height
+		for index, key in enumerate(self.layout):
+			row, col = divmod(index, self.columns)
+			tile = self.tiles.get(key)
+			if tile is None:
+				continue
+			text = f"{tile.name} | {tile.fps:.1f} FPS" if self.fps_counter else tile.name
+			labels.append((text, col * self.tile_width, atlas_h - row * self.tile_height))
+		return labels
+
+	def _update_annotations(self, labels, atlas_h):
+		"""Runs on the render loop: draws the tile labels as plot annotations (no raster work)."""
+		for i, (text, x, y) in enumerate(labels):
+			if i < len(self._annotation_tags):
+				dpg.configure_item(self._annotation_tags[i], label=text, show=True)
+				dpg.set_value(self._annotation_tags[i], (x, y))
+			else:
+				tag = f"grid_viewer_label_{self.UUID}_{i}"
+				dpg.add_plot_annotation(label=text, default_value=(x, y), offset=(4, 4), color=(0, 0, 0, 160), tag=tag, parent=self.plot_tag)
+				self._annotation_tags.append(tag)
+		for tag in self._annotation_tags[len(labels):]:
+			dpg.configure_item(tag, show=False)
+
+	def close(self):
+		"""Stops the render thread and releases the atlas textures before closing the window."""
+		self._render_running = False
+		self.render_thread.join(timeout=1)
+		self.atlas_pool.clear()
+		super().close()
+
+
+EXPORTED_CLASS = Grid_viewer_win
+EXPORTED_NAME = "Grid Viewer"
@@ -0,0 +1,122 @@
+import os
+import queue
+import threading
+from typing import Callable, Optional, Union
+import numpy as np
+import cv2
+from loguru import logger
+
+EXPORT_FORMATS = {
+	"PNG": ".png",
+	"TIFF": ".tif",
+	"NPY": ".npy",
+}
+
+
+class ImageExporter:
+	"""
+	Background image writer.
+
+	Images are encoded and written by a small pool of worker threads (cv2 and numpy
+	release the GIL while encoding), fed by a bounded queue. Submitting never blocks
+	the GUI for encoding; when the queue is full, `submit` refuses the image, or waits
+	for room with `block=True` (never from a producer thread).
+	"""
+
+	def __init__(self, workers: int = 2, max_pending: int = 32, on_done: Optional[Callable[["ImageExporter"], None]] = None):
+		"""
+		Args:
+			workers: Number of encoder threads.
+			max_pending: Maximum number of queued images.
+			on_done: Called from a worker after each written image (e.g. to refresh a counter).
+		"""
+		self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+		self._on_done = on_done
+		self._lock = threading.Lock()
+		self.written = 0
+		self.failed = 0
+		self._workers = [threading.Thread(target=self._worker, daemon=True) for _ in range(max(1, workers))]
+		for worker in self._workers:
+			worker.start()
+
+	@staticmethod
+	def write(path_base: str, image: np.ndarray, fmt: str = "PNG", png_compression: int = 3) -> str:
+		"""
+		Encodes and writes an image synchronously.
+
+		Args:
+			path_base: Destination path without extension.
+			fmt: "PNG", "TIFF" or "NPY".
+			png_compression: PNG compression level (0 = fastest, 9 = smallest).
+
+		Returns:
+			The written file path.
+		"""
+		path = path_base + EXPORT_FORMATS.get(fmt, ".png")
+		match fmt:
+			case "NPY":
+				np.save(path, image)
+			case "TIFF":
+				if not cv2.imwrite(path, image):
+					raise IOError(f"Could not write {path}")
+			case _:
+				if not cv2.imwrite(path, image, [cv2.IMWRITE_PNG_COMPRESSION, int(png_compression)]):
+					raise IOError(f"Could not write {path}")
+		return path
+
+	def submit(self, path_base: str, image: Union[np.ndarray, Callable[[], np.ndarray]], fmt: str = "PNG",
+			png_compression: int = 3, block: bool = False) -> bool:
+		"""
+		Queues an image for writing.
+
+		Args:
+			image: The image, or a callable producing it on the worker (e.g. a full-resolution render).
+			block: Wait for room in the queue instead of refusing the image.
+
+		Returns:
+			True if queued, False if the queue is full (non-blocking mode).
+		"""
+		try:
+			self._queue.put((path_base, image, fmt, png_compression), block=block)
+			return True
+		except queue.Full:
+			logger.warning(f"Export queue full, {path_base} not saved")
+			return False
+
+	def pending(self) -> int:
+		"""Returns the number of images waiting to be written."""
+		return self._queue.qsize()
+
+	def flush(self) -> None:
+		"""Blocks until every queued image has been written."""
+		self._queue.join()
+
+	def close(self) -> None:
+		"""Writes the queued images, then stops the workers."""
+		for _ in self._workers:
+			self._queue.put(None)
+		for worker in self._workers:
+			worker.join(timeout=5)
+
+	def _worker(self) -> None:
+		while True:
+			job = self._queue.get()
+			try:
+				if job is None:
+					return
+				path_base, image, fmt, png_compression = job
+				if callable(image):
+					image = image()
+				os.makedirs(os.path.dirname(path_base) or ".", exist_ok=True)
+				self.write(path_base, image, fmt, png_compression)
+				with self._lock:
+					self.written += 1
+			except Exception as e:
+				with self._lock:
+					self.failed += 1
+				logger.warning(f"Image export failed: {e}")
+			finally:
+				self._queue.task_done()
+
+			if self._on_done is not None:
+				self._on_done(self)
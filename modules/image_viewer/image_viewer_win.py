@@ -4,10 +4,22 @@ import threading
 import time
 import cv2
 import os
+from loguru import logger
 
 from core.window_base import WindowBase
 from modules.image_viewer.clipboard_injector import clipboardinjector
+from modules.image_viewer.frame_mailbox import FrameMailbox
+from modules.image_viewer.display_lut import DisplayLUT
+from modules.image_viewer.auto_levels import AutoLevels
+from modules.image_viewer.viewport_lod import ViewportLOD
+from modules.image_viewer.texture_pool import TexturePool
+from modules.image_viewer.overlay_layer import OverlayLayer
+from modules.image_viewer.mask_compositor import MaskCompositor
+from modules.image_viewer.image_exporter import ImageExporter, EXPORT_FORMATS
 from core.input_ouput_types import IOTypes
+from core.ui_update_queue import ui_queue
+from core.frame_scheduler import frame_scheduler
+from modules.video_reader.fps_counter import FPSCounter
 
 
 class Image_viewer_win(WindowBase):
@@ -34,7 +46,13 @@ class Image_viewer_win(WindowBase):
 				intensity_rescaling=True,
 				fps_counter=True,
 				image_export=True,
-				image_depth="12bit"):
+				image_depth="12bit",
+				auto_percentile=100.0,
+				levels_smoothing=0.5,
+				viewport_lod=True,
+				mask_alpha=0.4,
+				export_format="PNG",
+				png_compression=3):
 
 		super().__init__(label=label, pos=pos, win_width=win_width, win_height=win_height,
 			uuid=uuid, outputs=outputs or [], visible=visible)
@@ -43,32 +61,60 @@ class Image_viewer_win(WindowBase):
 		self.fps = 0
 		self.now = time.time()
 		self.last = self.now
+		self.received_fps_counter = FPSCounter(smoothing_window=10)
 
 		# Lock for threaded updates
 		self.lock = threading.Lock()
 
-		# Last image reference
+		# Latest-frame slot consumed by the render thread
+		self.mailbox = FrameMailbox()
+		self._render_running = True
+
+		# Last image (and optional mask) reference
 		self.last_image = None
+		self.last_mask = None
 
 		# Display options
+		self.display = DisplayLUT()
+		self.levels = AutoLevels(smoothing=levels_smoothing)
+		self.compositor = MaskCompositor(alpha=mask_alpha)
 		self.negative = False
 		self.palette = "Inferno"
 		self.imgcount = 0
 
+		# Background export
+		self.exporter = ImageExporter(on_done=self._export_done)
+		self.burst_remaining = 0
+		self.burst_index = 0
+		self.burst_dropped = 0
+		self.burst_name = None
+		self.last_rendered = None
+
 		# Texture state
-		self.texture_width = 0
-		self.texture_height = 0
+		self.lod = ViewportLOD()
+		self.frame_width = 0
+		self.frame_height = 0
+		self.detail_size = None
+		self.last_roi = None
 
 		# DPG element tags
-		self.texture_tag = f"viewer_texture_{self.UUID}"
 		self.plot_tag = f"viewer_plot_{self.UUID}"
+		self.x_axis_tag = f"viewer_x_axis_{self.UUID}"
+		self.y_axis_tag = f"viewer_y_axis_{self.UUID}"
+		self.max_label_tag = f"viewer_max_label_{self.UUID}"
+		self.min_label_tag = f"viewer_min_label_{self.UUID}"
 		self.fps_tag = f"viewer_fps_{self.UUID}"
+		self.received_fps_tag = f"viewer_received_fps_{self.UUID}"
 		self.name_tag = f"viewer_name_{self.UUID}"
 		self.count_tag = f"viewer_count_{self.UUID}"
 		self.save_btn = f"viewer_save_{self.UUID}"
 		self.auto_remap_tag = f"viewer_autoremap_{self.UUID}"
 		self.inf_tag = f"viewer_inf_{self.UUID}"
 		self.sup_tag = f"viewer_sup_{self.UUID}"
+		self.mask_alpha_tag = f"viewer_mask_alpha_{self.UUID}"
+		self.format_tag = f"viewer_format_{self.UUID}"
+		self.compression_tag = f"viewer_compression_{self.UUID}"
+		self.burst_count_tag = f"viewer_burst_count_{self.UUID}"
 
 		# Config flags
 		self.colorize = colorize
@@ -76,13 +122,21 @@ class Image_viewer_win(WindowBase):
 		self.fps_counter = fps_counter
 		self.image_export = image_export
 		self.image_depth = image_depth
+		self.auto_percentile = auto_percentile
+		self.levels_smoothing = levels_smoothing
+		self.viewport_lod = viewport_lod
+		self.mask_alpha = mask_alpha
+		self.export_format = export_format
+		self.png_compression = png_compression
 
 		# Persistence and IO setup
 		self._persistent_fields = [
 			"label", "colorize", "intensity_rescaling",
-			"fps_counter", "image_export", "image_depth"
+			"fps_counter", "image_export", "image_depth",
+			"auto_percentile", "levels_smoothing", "viewport_lod",
+			"mask_alpha", "export_format", "png_compression"
 		]
-		self.accepted_input_types = [IOTypes.FRAME, IOTypes.FILE_PATH]
+		self.accepted_input_types = [IOTypes.FRAME, IOTypes.FILE_PATH, IOTypes.FRAME_MASK_PAIR, IOTypes.OVERLAY]
 		self.output_types = [IOTypes.FRAME]
 
 		self.outputs = {
@@ -90,8 +144,16 @@ class Image_viewer_win(WindowBase):
 		}
 		self.connections = {k: [] for k in self.outputs}
 
+		# Double-buffered textures, reused across frame and plot sizes
+		self.overview_pool = TexturePool(f"viewer_overview_{self.UUID}", self.y_axis_tag)
+		self.detail_pool = TexturePool(f"viewer_detail_{self.UUID}", self.y_axis_tag)
+		self.overlay = OverlayLayer(f"viewer_{self.UUID}", self.plot_tag)
+
 		self._build_interface(win_width, win_height, pos)
 
+		self.render_thread = threading.Thread(target=self._render_loop, daemon=True)
+		self.render_thread.start()
+
 	def _build_interface(self, win_width, win_height, pos):
 		"""Creates the DearPyGui layout."""
 		with dpg.window(label=self.label, width=win_width, height=win_height,
@@ -101,6 +163,8 @@ class Image_viewer_win(WindowBase):
 				if self.colorize:
 					dpg.add_combo(("Normal", "Negative"), width=120, default_value="Normal", callback=self.set_mode)
 					dpg.add_combo(("B&W", "Inferno", "Jet", "HSV"), width=120, default_value=self.palette, callback=self.set_mode)
+					dpg.add_text("Mask:")
+					dpg.add_drag_float(default_value=self.mask_alpha, min_value=0, max_value=1, speed=0.01, format="%.2f", width=60, tag=self.mask_alpha_tag, callback=self.set_mask_alpha)
 
 				if self.intensity_rescaling:
 					dpg.add_text("Auto:")
@@ -111,7 +175,9 @@ class Image_viewer_win(WindowBase):
 					dpg.add_drag_int(default_value=255, min_value=0, max_value=255, width=100, tag=self.sup_tag, callback=self.update_image_callback)
 
 				if self.fps_counter:
-					dpg.add_text("| FPS:")
+					dpg.add_text("| Received FPS:")
+					dpg.add_text("0", tag=self.received_fps_tag)
+					dpg.add_text("Displayed FPS:")
 					dpg.add_text("0", tag=self.fps_tag)
 
 			if self.image_export:
@@ -120,12 +186,24 @@ class Image_viewer_win(WindowBase):
 					dpg.add_input_text(default_value="Image", width=150, tag=self.name_tag, callback=self.reset_counter)
 					dpg.add_text("count: 0", tag=self.count_tag)
 					dpg.add_button(label="Save", tag=self.save_btn, callback=self.save_image)
+					dpg.add_combo(tuple(EXPORT_FORMATS), default_value=self.export_format, width=70, tag=self.format_tag, callback=self.set_export_options)
+					dpg.add_text("PNG level:")
+					dpg.add_drag_int(default_value=self.png_compression, min_value=0, max_value=9, width=40, tag=self.compression_tag, callback=self.set_export_options)
+					dpg.add_button(label="Burst", callback=self.start_burst)
+					dpg.add_input_int(default_value=10, min_value=1, min_clamped=True, step=0, width=60, tag=self.burst_count_tag)
 
-			self.init_viewer(1000, 1000)
+			self.init_viewer()
 
 	def input_cb(self, *args, **kwargs):
-		"""Receives and processes image input from args or kwargs (supports ndarray or filepath)."""
+		"""Receives and processes image input from args or kwargs (supports ndarray, filepath, frame/mask pair or overlay)."""
 		frame = kwargs["data"] if "data" in kwargs else (args[0] if args else None) #Numpy compatible evaluation
+		mask = None
+
+		if kwargs.get("data_type") == IOTypes.OVERLAY:
+			self.overlay.update(frame, kwargs.get("source"))
+			return
+		if kwargs.get("data_type") == IOTypes.FRAME_MASK_PAIR:
+			frame, mask = frame[0], frame[1]
 
 		if isinstance(frame, str) and os.path.exists(frame):
 			frame = cv2.imread(frame, cv2.IMREAD_UNCHANGED)
@@ -133,52 +211,42 @@ class Image_viewer_win(WindowBase):
 				frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
 		if isinstance(frame, np.ndarray):
-			self.update_image(frame)
-
-	def convert_to_lowdepth(self, frame: np.ndarray) -> np.ndarray:
-		"""Converts high bit-depth image to 8-bit based on image_depth."""
-		match self.image_depth:
-			case "8bit":
-				return frame
-			case "12bit":
-				return (frame >> 4).astype(np.uint8)
-			case "16bit_norm":
-				return cv2.normalize(frame, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-			case "16bit_abs":
-				return (frame >> 8).astype(np.uint8)
-
-	def get_minmax_values(self, frame: np.ndarray) -> tuple[int, int]:
-		"""Returns min and max intensity values from non-zero pixels."""
-		non_zero = frame[frame > 0]
-		min_val = np.min(non_zero) if non_zero.size else 0
-		match self.image_depth:
-			case "8bit":
-				max_val = np.max(non_zero) if non_zero.size else 255
-			case "12bit":
-				max_val = np.max(non_zero) if non_zero.size else 4096
-			case _:
-				max_val = np.max(non_zero) if non_zero.size else 65535
+			if self.burst_remaining > 0:
+				self._burst_capture(frame)
+			if self.fps_counter:
+				ui_queue.set_value(self.received_fps_tag, f"{self.received_fps_counter.get_fps()[1]:.1f}")
+			self.update_image(frame, mask, kwargs.get("frame_id"), kwargs.get("source"))
+
+	def get_minmax_values(self, levels: AutoLevels | None = None) -> tuple[int, int]:
+		"""Returns the exact min and max intensity values of the non-zero pixels of the last frame."""
+		min_val, max_val = (levels or self.levels).min_max(ignore_zero=True)
+		if max_val == 0:
+			match self.image_depth:
+				case "8bit":
+					max_val = 255
+				case "12bit":
+					max_val = 4096
+				case _:
+					max_val = 65535
 		return min_val, max_val
 
-	def remap_pixel_intensity(self, frame: np.ndarray, low: float, high: float) -> np.ndarray:
-		"""Normalizes frame between [low, high] and scales to 8-bit."""
-		normalized = np.clip((frame.astype(np.float32) - low) / (high - low), 0, 1)
-		return (normalized * 255).astype(np.uint8)
-
-	def add_intensity_scale(self, img: np.ndarray, scale_width=30, position='left') -> np.ndarray:
-		"""Adds vertical or horizontal intensity scale bar to image."""
-		h = img.shape[0]
-		gradient = np.linspace(255, 0, h).reshape((h, 1)).astype(np.uint8)
-		scale = np.tile(gradient, (1, scale_width))
-		overlay = img.copy()
+	def get_display_range(self, norm_range=None, levels: AutoLevels | None = None) -> tuple[int, int]:
+		"""
+		Returns the [inf, sup] display range in 8-bit levels. In auto mode, Sup follows the smoothed high percentile.
+		The Sup slider is only updated for the displayed levels, not for detached ones (exports).
+		"""
+		if not self.intensity_rescaling:
+			return 0, 255
 
-		match position:
-			case 'right': overlay[:, -scale_width:] = scale
-			case 'left': overlay[:, :scale_width] = scale
-			case 'top': overlay[:scale_width, :] = scale.T
-			case 'bottom': overlay[-scale_width:, :] = scale.T
-
-		return overlay
+		inf = dpg.get_value(self.inf_tag)
+		sup = dpg.get_value(self.sup_tag)
+		if dpg.get_value(self.auto_remap_tag):
+			levels = levels or self.levels
+			high = levels.smooth("high", levels.percentile(self.auto_percentile))
+			sup = int(self.display.reduce_depth(self.image_depth, high, norm_range))
+			if levels is self.levels:
+				ui_queue.set_value(self.sup_tag, sup)
+		return inf, sup
 
 	def calc_fps(self) -> float:
 		"""Computes current FPS from timestamps."""
@@ -189,90 +257,157 @@ class Image_viewer_win(WindowBase):
 			self.last = self.now
 		return self.fps
 
-	def convert_to_texture(self, frame: np.ndarray) -> list:
-		"""Converts 3-channel image to flattened RGB float array for DearPyGui."""
-		return (np.flip(frame, 2).ravel() / 255.0).astype('f')
-
-	def init_viewer(self, width: int, height: int):
-		"""Initializes DearPyGui image display area."""
-		if dpg.does_item_exist(self.texture_tag):
-			dpg.delete_item(self.texture_tag)
-		if dpg.does_item_exist(self.plot_tag):
-			dpg.delete_item(self.plot_tag)
-
-		default_img = np.zeros((height, width, 3), dtype=np.uint8)
-		texture = self.convert_to_texture(default_img)
-
-		dpg.push_container_stack(self.winID)
+	def init_viewer(self):
+		"""Creates the plot once. Its textures and image series come from the texture pools."""
 		with dpg.plot(tag=self.plot_tag, no_menus=True, no_title=True, width=-1, height=-1):
-			with dpg.texture_registry(show=False):
-				dpg.add_raw_texture(width, height, default_value=texture, tag=self.texture_tag, format=dpg.mvFormat_Float_rgb)
 			dpg.add_plot_legend()
-			dpg.add_plot_axis(dpg.mvXAxis, no_gridlines=True, no_tick_labels=True, no_tick_marks=True)
-			with dpg.plot_axis(dpg.mvYAxis, no_gridlines=True, no_tick_labels=True, no_tick_marks=True):
-				dpg.add_image_series(self.texture_tag, [0, 0], [width, height])
-		dpg.pop_container_stack()
-		self.texture_width = width
-		self.texture_height = height
-
-	def colorize_frame(self, frame: np.ndarray) -> np.ndarray:
-		"""Applies negative or colormap to the 8-bit image."""
-		if self.negative:
-			frame = 255 - frame
-		match self.palette:
-			case 'B&W': return cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-			case 'Inferno': return cv2.applyColorMap(frame, cv2.COLORMAP_INFERNO)
-			case 'Jet': return cv2.applyColorMap(frame, cv2.COLORMAP_JET)
-			case 'HSV': return cv2.applyColorMap(frame, cv2.COLORMAP_HSV)
-		return frame
-
-	def remap_and_annotate(self, frame, min_val=None, max_val=None):
-		"""Remaps intensities, adds scale bar and min/max text."""
-		if dpg.get_value(self.auto_remap_tag):
-			min_val = np.percentile(frame, 1)
-			max_val = np.percentile(frame, 100)
-			dpg.set_value(self.sup_tag, max_val)
+			dpg.add_plot_axis(dpg.mvXAxis, no_gridlines=True, no_tick_labels=True, no_tick_marks=True, tag=self.x_axis_tag)
+			dpg.add_plot_axis(dpg.mvYAxis, no_gridlines=True, no_tick_labels=True, no_tick_marks=True, tag=self.y_axis_tag)
+			# Min/max levels, clamped to the visible area
+			dpg.add_plot_annotation(label="", default_value=(0, 0), offset=(34, 4), color=(0, 0, 0, 160), tag=self.max_label_tag, show=False)
+			dpg.add_plot_annotation(label="", default_value=(0, 0), offset=(34, -4), color=(0, 0, 0, 160), tag=self.min_label_tag, show=False)
+
+	def update_level_labels(self, min_val: int, max_val: int, height: int):
+		"""Runs on the render loop: shows min/max levels at the top and bottom left of the frame."""
+		dpg.configure_item(self.max_label_tag, label=f"{max_val:.0f}", show=True)
+		dpg.set_value(self.max_label_tag, (0, height))
+		dpg.configure_item(self.min_label_tag, label=f"{min_val:.0f}", show=True)
+		dpg.set_value(self.min_label_tag, (0, 0))
+
+	def fit_plot(self):
+		"""Fits the plot axes to the displayed frame."""
+		dpg.fit_axis_data(self.x_axis_tag)
+		dpg.fit_axis_data(self.y_axis_tag)
+
+	def get_visible_roi(self) -> tuple[int, int, int, int] | None:
+		"""Returns the zoomed pixel region currently shown by the plot, or None if the whole frame is visible."""
+		if self.detail_size is None or not dpg.does_item_exist(self.x_axis_tag):
+			return None
+		return self.lod.visible_roi(self.frame_width, self.frame_height,
+			dpg.get_axis_limits(self.x_axis_tag), dpg.get_axis_limits(self.y_axis_tag))
+
+	def render_frame(self, frame: np.ndarray, size=None, roi=None, out=None, mask=None, levels: AutoLevels | None = None) -> np.ndarray:
+		"""
+		Renders a raw frame into a display buffer: a single LUT gather (depth, remap,
+		negative, palette), then the scale bar and optional mask overlay.
+
+		Args:
+			size: (w, h) output size. The frame (or ROI) is resampled before the LUT gather. None = native.
+			roi: (x0, y0, x1, y1) region of the frame to render. None = whole frame.
+			out: Destination float32 buffer of shape (h, w, 3).
+			levels: Levels state to use; None for the display's (updates its smoothing), a detached copy for exports.
+
+		Returns:
+			(h, w, 3) float32 RGB buffer.
+		"""
+		frame = self.display.prepare_frame(frame)
+		lut_size = 256 if frame.dtype == np.uint8 else 65536
+		levels = levels or self.levels
+		levels.compute(frame)
+
+		norm_range = None
+		if self.image_depth == "16bit_norm":
+			frame_min, frame_max = levels.min_max()
+			norm_range = (round(levels.smooth("min", frame_min)), round(levels.smooth("max", frame_max)))
+
+		inf, sup = self.get_display_range(norm_range, levels)
+		self.display.update(self.image_depth, inf, sup, self.negative, self.palette, lut_size, norm_range)
+
+		if size is not None:
+			frame = self.lod.resample(frame, size, roi)
+			if mask is not None:
+				mask = self.lod.resample(mask, size, roi, cv2.INTER_NEAREST)
+
+		buffer = self.display.render(frame, out)
+		self.display.add_intensity_scale(buffer)
 
-		frame = self.remap_pixel_intensity(frame, dpg.get_value(self.inf_tag), dpg.get_value(self.sup_tag))
-		frame = self.add_intensity_scale(frame)
-
-		if min_val is None or max_val is None:
-			min_val, max_val = self.get_minmax_values(frame)
-
-		frame = self.colorize_frame(frame)
-		cv2.putText(frame, f"{max_val:.0f}", (30, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
-		cv2.putText(frame, f"{min_val:.0f}", (30, frame.shape[0]-15), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
-
-		return frame
-
-	def process_lowdepth(self, frame, min_val=None, max_val=None, mask=None):
-		"""Processes image before rendering and adds overlay if mask is provided."""
-		frame = self.remap_and_annotate(frame, min_val, max_val)
 		if mask is not None:
-			frame[mask] = [0, 0, 255]
-		return frame
-
-	def update_image(self, frame):
-		"""Triggers image display update in a background thread."""
+			self.compositor.composite(buffer, mask)
+		return buffer
+
+	def update_image(self, frame, mask=None, frame_id=None, source=None):
+		"""
+		Posts the frame (and optional mask) to the render thread. Frames arriving between two displayed frames replace each other.
+		`source` and `frame_id` pair the frame with the overlay computed from it (see OverlayLayer).
+		"""
 		self.last_image = frame
-		lowdepth = self.convert_to_lowdepth(self.last_image)
+		self.last_mask = mask
+		if frame is not None:
+			self.mailbox.put((frame, mask, source, frame_id))
+			frame_scheduler.wake()
+
+	def _render_loop(self):
+		"""
+		Long-lived render thread, paced by the GUI: after each displayed frame it takes the
+		latest posted frame (if any) and converts it, so frames that would never be shown are skipped.
+		"""
+		last_tick = frame_scheduler.frame_count
+		while self._render_running:
+			last_tick = frame_scheduler.wait_for_frame(last_tick, timeout=0.1)
+			item = self.mailbox.get_nowait()
+			redraw = item is None
+			if redraw:
+				# No new frame: re-render the last one if the user zoomed or panned the plot
+				if self.last_image is None or self.get_visible_roi() == self.last_roi:
+					continue
+				item = (self.last_image, self.last_mask, None, None)
+
+			frame, mask, source, frame_id = item
+			with self.lock:
+				try:
+					self._render_to_textures(frame, mask)
+					if not redraw:
+						self.overlay.show_frame(frame_id, source)  # Re-renders (zoom, pan) keep the pairing
+					if self.fps_counter:
+						ui_queue.set_value(self.fps_tag, f"{self.calc_fps():.1f}")
+				except Exception as e:
+					logger.warning(f"{self.winID} failed to render frame: {e}")
+
+	def _render_to_textures(self, frame: np.ndarray, mask: np.ndarray | None = None):
+		"""
+		Renders the frame at plot resolution (the whole frame when unzoomed, the visible ROI otherwise)
+		into a back texture of the pools, then presents it. Widgets are never rebuilt.
+		"""
+		h, w = frame.shape[:2]
+		resized = (w, h) != (self.frame_width, self.frame_height)
+		self.frame_width, self.frame_height = w, h
+
+		if self.viewport_lod:
+			plot_w, plot_h = dpg.get_item_rect_size(self.plot_tag)
+			overview_size = self.lod.overview_size(w, h, plot_w, plot_h)
+			self.detail_size = self.lod.detail_size(plot_w, plot_h)
+		else:
+			overview_size, self.detail_size = (w, h), None
+
+		roi = None if resized else self.get_visible_roi()
+		if roi is None:
+			slot = self.overview_pool.acquire(*overview_size)
+			self.render_frame(frame, overview_size, out=slot.buffer, mask=mask)
+			self.overview_pool.present(slot, [0, 0], [w, h])
+			self.last_rendered = (frame, mask, slot) if overview_size == (w, h) else None
+			if self.last_roi is not None or resized:
+				self.detail_pool.hide()
+		else:
+			slot = self.detail_pool.acquire(*self.detail_size)
+			self.render_frame(frame, self.detail_size, roi, out=slot.buffer, mask=mask)
+			bounds_min, bounds_max = self.lod.roi_bounds(h, roi)
+			self.detail_pool.present(slot, bounds_min, bounds_max, on_top=True)
 
-		if frame is not None and not self.lock.locked():
-			def task():
-				with self.lock:
-					if frame.shape[0] != self.texture_height or frame.shape[1] != self.texture_width:
-						self.init_viewer(frame.shape[1], frame.shape[0])
+		min_val, max_val = self.get_minmax_values()
+		ui_queue.submit((self.plot_tag, "levels"), self.update_level_labels, min_val, max_val, h)
 
-					minval, maxval = self.get_minmax_values(frame)
-					processed = self.process_lowdepth(lowdepth, minval, maxval)
-					texture = self.convert_to_texture(processed)
-					dpg.set_value(self.texture_tag, texture)
-					dpg.set_value(self.fps_tag, str(int(self.calc_fps())))
-			threading.Thread(target=task).start()
+		if resized:
+			ui_queue.submit((self.plot_tag, "fit"), self.fit_plot)
+		self.last_roi = roi
 
 	def update_image_callback(self):
 		"""Callback to trigger update from UI."""
-		self.update_image(self.last_image)
+		self.update_image(self.last_image, self.last_mask)
+
+	def set_mask_alpha(self, sender, app_data):
+		"""Sets the opacity of the mask composited over the frame."""
+		self.mask_alpha = self.compositor.alpha = float(app_data)
+		self.update_image(self.last_image, self.last_mask)
 
 	def set_mode(self, sender, app_data):
 		"""Handles UI mode changes (negative toggle or palette switch)."""
@@ -280,30 +415,100 @@ class Image_viewer_win(WindowBase):
 			self.negative = (app_data == "Negative")
 		else:
 			self.palette = app_data
-		self.update_image(self.last_image)
+		self.update_image(self.last_image, self.last_mask)
+
+	def put_level_text(self, image: np.ndarray, levels: AutoLevels | None = None) -> np.ndarray:
+		"""Burns the min/max levels into an exported 8-bit BGR image."""
+		min_val, max_val = self.get_minmax_values(levels)
+		cv2.putText(image, f"{max_val:.0f}", (30, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
+		cv2.putText(image, f"{min_val:.0f}", (30, image.shape[0]-15), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
+		return image
+
+	def get_processed_image(self, frame: np.ndarray, mask=None) -> np.ndarray:
+		"""
+		Returns the processed 8-bit BGR image of a frame. The texture already rendered for
+		display is reused when it is at native resolution; otherwise the frame is rendered.
+		"""
+		with self.lock:
+			rendered = self.last_rendered
+			if rendered is not None and rendered[0] is frame and rendered[1] is mask:
+				return self.put_level_text(self.display.to_bgr8(rendered[2].buffer))
+			# Exports never feed the display's level smoothing
+			levels = self.levels.detached()
+			buffer = self.render_frame(frame, mask=mask, levels=levels)
+			return self.put_level_text(self.display.to_bgr8(buffer), levels)
 
 	def copy_to_clipboard(self):
 		"""Copies the processed image to clipboard using the custom injector."""
 		if self.last_image is not None:
-			minval, maxval = self.get_minmax_values(self.last_image)
-			lowdepth = self.convert_to_lowdepth(self.last_image)
-			image = self.remap_and_annotate(lowdepth, minval, maxval)
+			image = self.get_processed_image(self.last_image, self.last_mask)
 			clipboardinjector.send_image(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
 
 	def save_image(self):
-		"""Saves both raw and processed images to PNG with indexed names."""
-		if self.last_image is not None:
-			minval, maxval = self.get_minmax_values(self.last_image)
-			raw = self.last_image
-			lowdepth = self.convert_to_lowdepth(raw)
-			processed = self.remap_and_annotate(lowdepth, minval, maxval)
-
-			name = dpg.get_value(self.name_tag)
-			cv2.imwrite(f"{name}_RAW_{self.imgcount}.png", raw)
-			cv2.imwrite(f"{name}_Processed_{self.imgcount}.png", processed)
-
-			dpg.set_value(self.count_tag, f"count : {self.imgcount}")
-			self.imgcount += 1
+		"""Queues the raw and processed images for background writing, with indexed names."""
+		if self.last_image is None:
+			return
+		raw, mask = self.last_image, self.last_mask
+		name = dpg.get_value(self.name_tag)
+
+		# Reuse the displayed texture now (it is recycled by the render thread), else render on the writer
+		rendered = self.last_rendered
+		if rendered is not None and rendered[0] is raw:
+			processed = self.get_processed_image(raw, mask)
+		else:
+			processed = lambda: self.get_processed_image(raw, mask)
+
+		self.exporter.submit(f"{name}_RAW_{self.imgcount}", raw, self.export_format, self.png_compression)
+		self.exporter.submit(f"{name}_Processed_{self.imgcount}", processed, self.export_format, self.png_compression)
+		self.imgcount += 1
+		self._export_done(self.exporter)
+
+	def start_burst(self):
+		"""Saves the raw version of the next N received frames (frames arriving while the export queue is full are dropped and counted)."""
+		self.burst_name = f"{dpg.get_value(self.name_tag)}_burst{self.imgcount}"
+		self.burst_index = 0
+		self.burst_dropped = 0
+		self.burst_remaining = max(1, dpg.get_value(self.burst_count_tag))
+		self.imgcount += 1
+
+	def _burst_capture(self, frame: np.ndarray):
+		"""
+		Called from the producer thread, so it never waits for the disk: when the export queue is full
+		the frame is dropped and counted (its index is skipped in the file names).
+		The frame is copied, as sources may reuse their buffer (memmap views, recorder ring) before it is written.
+		"""
+		if not self.exporter.submit(f"{self.burst_name}_{self.burst_index:05d}", frame.copy(), self.export_format, self.png_compression):
+			self.burst_dropped += 1
+		self.burst_index += 1
+		self.burst_remaining -= 1
+		if self.burst_remaining == 0 or self.burst_dropped:
+			self._export_done(self.exporter)
+
+	def _export_done(self, exporter: ImageExporter):
+		"""Refreshes the export counter (any thread)."""
+		status = f"count: {self.imgcount}"
+		if exporter.pending():
+			status += f" | queued: {exporter.pending()}"
+		if self.burst_remaining > 0:
+			status += f" | burst: {self.burst_remaining}"
+		if self.burst_dropped:
+			status += f" | burst dropped: {self.burst_dropped}"
+		ui_queue.set_value(self.count_tag, status)
+
+	def set_export_options(self):
+		"""Reads the export format and PNG compression level from the UI."""
+		self.export_format = dpg.get_value(self.format_tag)
+		self.png_compression = dpg.get_value(self.compression_tag)
+
+	def close(self):
+		"""Stops the render thread before closing the window."""
+		self._render_running = False
+		self.mailbox.close()
+		self.render_thread.join(timeout=1)
+		self.overview_pool.clear()
+		self.detail_pool.clear()
+		self.exporter.close()
+		super().close()
 
 	def reset_counter(self):
 		"""Resets the saved image counter to zero."""
@@ -0,0 +1,48 @@
+import numpy as np
+
+
+class MaskCompositor:
+	"""
+	Alpha-blends a colored mask over a rendered float RGB buffer, in place.
+
+	The blend is fully vectorized and uses buffers kept between frames (one
+	blended image and one boolean selection per display size), so compositing
+	a mask allocates nothing per frame.
+	"""
+
+	def __init__(self, color=(255, 0, 0), alpha: float = 0.4):
+		"""
+		Args:
+			color: Mask color, RGB 0-255.
+			alpha: Mask opacity in [0, 1].
+		"""
+		self.color = color
+		self.alpha = alpha
+		self._blend = None
+		self._where = None
+
+	def composite(self, buffer: np.ndarray, mask: np.ndarray) -> np.ndarray:
+		"""
+		Blends the color over the pixels where the mask is non-zero.
+
+		Args:
+			buffer: (h, w, 3) float32 RGB buffer in [0, 1], modified in place.
+			mask: (h, w) mask with the same height and width.
+
+		Returns:
+			`buffer`.
+		"""
+		if mask.ndim == 3:
+			mask = mask[..., 0]
+		if mask.shape != buffer.shape[:2] or self.alpha <= 0:
+			return buffer
+
+		if self._blend is None or self._blend.shape != buffer.shape:
+			self._blend = np.empty_like(buffer)
+			self._where = np.empty(buffer.shape[:2] + (1,), dtype=bool)
+
+		np.greater(mask, 0, out=self._where[..., 0])
+		np.multiply(buffer, 1.0 - self.alpha, out=self._blend)
+		self._blend += np.asarray(self.color, dtype=np.float32) * (self.alpha / 255.0)
+		np.copyto(buffer, self._blend, where=self._where)
+		return buffer
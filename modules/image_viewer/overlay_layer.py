@@ -0,0 +1,160 @@
+import threading
+from collections import OrderedDict
+import dearpygui.dearpygui as dpg
+import numpy as np
+
+from core.ui_update_queue import ui_queue
+
+
+class OverlayLayer:
+	"""
+	Draws OVERLAY payloads (see tools/overlay) on top of a plot image.
+
+	Boxes, points and polylines become DearPyGui drawing items of a draw layer in plot
+	coordinates, so they follow zoom and pan. Labels are plot annotations (constant text size).
+	The raw frame is never touched. Items are pooled: an update reconfigures the existing
+	items and hides the unused ones on the render loop, at most once per displayed frame
+	(overlays posted in between replace each other), instead of deleting and recreating them.
+
+	Overlays carrying a `frame_id` are held until the viewer shows the frame with the same
+	(source, frame_id) (`show_frame`), so they are drawn on the frame they were computed from.
+	They are drawn at once when they have no id, or when the frame on screen has no id or comes
+	from another source (e.g. raw reader frames annotated by a Contour Detection overlay).
+	Ids are per-source counters that may restart at 0 (processor restart), so a lower id is
+	never treated as stale on arrival: it waits like any other until pruned or shown.
+	"""
+
+	MAX_PENDING = 16  # Overlays waiting for their frame, oldest dropped first
+
+	def __init__(self, name: str, plot_tag: str, max_items: int = 2000, max_labels: int = 200):
+		"""
+		Args:
+			name: Unique prefix used for the DearPyGui tags.
+			plot_tag: Plot hosting the image series.
+			max_items: Maximum number of boxes, points and polylines drawn.
+			max_labels: Maximum number of text labels drawn.
+		"""
+		self.name = name
+		self.plot_tag = plot_tag
+		self.layer_tag = f"{name}_overlay_layer"
+		self.max_items = max_items
+		self.max_labels = max_labels
+		self._label_tags = []
+		self._pools = {"boxes": [], "points": [], "polylines": []}  # Draw item tags, reused across updates
+		self._shown = {"boxes": 0, "points": 0, "polylines": 0}
+
+		self._lock = threading.Lock()
+		self._pending: OrderedDict = OrderedDict()  # (source, frame_id) -> prepared overlay
+		self._shown_frame = (None, None)  # (source, frame_id) of the frame last shown by the viewer
+
+	def update(self, overlay: dict, source=None) -> None:
+		"""
+		Schedules an overlay, for the next frame or for the frame it was computed from.
+
+		Args:
+			source: UUID of the sending module, the same one sent with its frames.
+		"""
+		prepared = self._prepare(overlay)
+		key = (source, overlay.get("frame_id"))
+		with self._lock:
+			shown_source, shown_id = self._shown_frame
+			if key[1] is not None and shown_id is not None and shown_source == source and key != self._shown_frame:
+				self._pending[key] = prepared
+				while len(self._pending) > self.MAX_PENDING:
+					self._pending.popitem(last=False)
+				return
+		ui_queue.submit((self.name, "overlay"), self._apply, prepared)
+
+	def show_frame(self, frame_id, source=None) -> None:
+		"""Called by the viewer when it presents a frame: draws the overlay computed from it, if already received."""
+		with self._lock:
+			self._shown_frame = (source, frame_id)
+			if frame_id is None:
+				return
+			prepared = self._pending.pop((source, frame_id), None)
+			for stale in [key for key in self._pending if key[0] == source and key[1] < frame_id]:
+				del self._pending[stale]
+		if prepared is not None:
+			ui_queue.submit((self.name, "overlay"), self._apply, prepared)
+
+	def clear(self) -> None:
+		"""Schedules the removal of the current overlay."""
+		with self._lock:
+			self._pending.clear()
+		ui_queue.submit((self.name, "overlay"), self._apply, None)
+
+	def _prepare(self, overlay: dict) -> dict:
+		"""Flips rows to plot coordinates and converts to lists, off the GUI thread."""
+		height = overlay.get("shape", (0, 0))[0]
+
+		def to_plot(points):
+			points = np.asarray(points, dtype=np.float32).copy()
+			points[..., 1] = height - points[..., 1]
+			return points
+
+		return {
+			"boxes": to_plot(overlay.get("boxes", np.empty((0, 4, 2))))[:self.max_items].tolist(),
+			"points": to_plot(overlay.get("points", np.empty((0, 2))))[:self.max_items].tolist(),
+			"polylines": [to_plot(line).tolist() for line in overlay.get("polylines", [])[:self.max_items] if len(line) >= 2],
+			"labels": [(float(x), float(height - y), str(text)) for x, y, text in overlay.get("labels", [])[:self.max_labels]],
+			"box_color": overlay.get("box_color", (0, 255, 0)),
+			"point_color": overlay.get("point_color", (255, 0, 0)),
+			"polyline_colors": overlay.get("polyline_colors", []),
+			"label_color": overlay.get("label_color", (0, 255, 0)),
+		}
+
+	def _apply(self, prepared) -> None:
+		"""Runs on the render loop: reconfigures the pooled drawing items."""
+		if not dpg.does_item_exist(self.plot_tag):
+			return
+		if not dpg.does_item_exist(self.layer_tag):
+			dpg.add_draw_layer(tag=self.layer_tag, parent=self.plot_tag)
+
+		if prepared is None:
+			for kind in self._pools:
+				self._sync(kind, [], None, None)
+			labels = []
+		else:
+			box_color, point_color = prepared["box_color"], prepared["point_color"]
+			polyline_colors = prepared["polyline_colors"]
+
+			self._sync("boxes", prepared["boxes"],
+				lambda tag, box, i: dpg.configure_item(tag, points=box, color=box_color, show=True),
+				lambda tag, box, i: dpg.draw_polyline(box, closed=True, color=box_color, thickness=1, tag=tag, parent=self.layer_tag))
+			self._sync("points", prepared["points"],
+				lambda tag, point, i: dpg.configure_item(tag, center=point, color=point_color, fill=point_color, show=True),
+				lambda tag, point, i: dpg.draw_circle(point, 2, color=point_color, fill=point_color, tag=tag, parent=self.layer_tag))
+
+			def line_color(i):
+				return polyline_colors[i] if i < len(polyline_colors) else box_color
+
+			self._sync("polylines", prepared["polylines"],
+				lambda tag, line, i: dpg.configure_item(tag, points=line, color=line_color(i), show=True),
+				lambda tag, line, i: dpg.draw_polyline(line, color=line_color(i), thickness=2, tag=tag, parent=self.layer_tag))
+			labels = prepared["labels"]
+
+		for tag in self._label_tags[len(labels):]:
+			dpg.configure_item(tag, show=False)
+		for i, (x, y, text) in enumerate(labels):
+			if i < len(self._label_tags):
+				dpg.configure_item(self._label_tags[i], label=text, show=True)
+				dpg.set_value(self._label_tags[i], (x, y))
+			else:
+				tag = f"{self.name}_overlay_label_{i}"
+				dpg.add_plot_annotation(label=text, default_value=(x, y), offset=(4, 4), color=(*prepared["label_color"], 160),
+					tag=tag, parent=self.plot_tag)
+				self._label_tags.append(tag)
+
+	def _sync(self, kind: str, items: list, configure, create) -> None:
+		"""Reconfigures the pooled items of a kind, creates the missing ones and hides those left over."""
+		pool = self._pools[kind]
+		for i, item in enumerate(items):
+			if i < len(pool):
+				configure(pool[i], item, i)
+			else:
+				tag = f"{self.name}_overlay_{kind}_{i}"
+				create(tag, item, i)
+				pool.append(tag)
+		for tag in pool[len(items):self._shown[kind]]:
+			dpg.configure_item(tag, show=False)
+		self._shown[kind] = len(items)
@@ -0,0 +1,56 @@
+import numpy as np
+
+
+class TextureConverter:
+	"""
+	Writes frames straight into persistent float32 RGB texture buffers.
+
+	- Gray (and mask) frames are expanded to RGB by a single per-channel LUT gather,
+	  without going through an intermediate BGR copy.
+	- BGR(A) frames are scaled with one `np.multiply(..., out=)` on a channel-reversed
+	  view, so no float temporary or flattened copy is allocated per frame.
+	"""
+
+	def __init__(self):
+		self._luts = {}
+
+	def get_lut(self, dtype: np.dtype) -> np.ndarray:
+		"""Returns the (size, 3) float32 gray-to-RGB table for an integer (or bool) dtype."""
+		dtype = np.dtype(dtype)
+		lut = self._luts.get(dtype)
+		if lut is None:
+			if dtype == np.bool_:
+				levels = np.array([0.0, 1.0], dtype=np.float32)
+			else:
+				size = np.iinfo(dtype).max + 1
+				levels = np.arange(size, dtype=np.float32) / (size - 1)
+			lut = np.ascontiguousarray(np.repeat(levels[:, None], 3, axis=1))
+			self._luts[dtype] = lut
+		return lut
+
+	@staticmethod
+	def get_scale(dtype: np.dtype) -> float:
+		"""Returns the factor mapping the dtype range to [0, 1]."""
+		if np.issubdtype(dtype, np.integer):
+			return 1.0 / np.iinfo(dtype).max
+		return 1.0
+
+	def convert(self, frame: np.ndarray, out: np.ndarray) -> np.ndarray:
+		"""
+		Converts a gray, mask, BGR or BGRA frame into the (h, w, 3) float32 RGB buffer `out`.
+
+		Returns:
+			`out`, filled in place.
+		"""
+		if frame.ndim == 3 and frame.shape[2] == 1:
+			frame = frame[..., 0]
+
+		if frame.ndim == 2:
+			if frame.dtype in (np.uint8, np.uint16, np.bool_):
+				indices = frame.view(np.uint8) if frame.dtype == np.bool_ else frame
+				np.take(self.get_lut(frame.dtype), indices, axis=0, out=out, mode='clip')
+			else:
+				np.multiply(frame[..., None], self.get_scale(frame.dtype), out=out, casting="unsafe")
+		else:
+			np.multiply(frame[..., 2::-1], self.get_scale(frame.dtype), out=out, casting="unsafe")
+		return out
@@ -0,0 +1,162 @@
+import threading
+from collections import OrderedDict
+import dearpygui.dearpygui as dpg
+import numpy as np
+
+from core.ui_update_queue import ui_queue
+
+SLOTS_PER_SIZE = 3
+
+
+class TextureSlot:
+	"""One raw float RGB texture, its persistent buffer and the image series drawing it."""
+
+	def __init__(self, texture_tag: str, series_tag: str, width: int, height: int):
+		self.texture_tag = texture_tag
+		self.series_tag = series_tag
+		self.width = width
+		self.height = height
+		self.buffer = np.zeros((height, width, 3), dtype=np.float32)
+
+
+class TexturePool:
+	"""
+	Per-viewer pool of raw textures keyed by (width, height).
+
+	Each size owns three textures used in turn: a frame is always written into a
+	texture that is neither on screen nor waiting to be presented, then presented by
+	showing its image series and hiding the others. A present only takes effect when
+	the render loop drains the ui_queue, so two slots are not enough: a second frame
+	rendered before the drain would overwrite the texture still on screen. Switching stream or size
+	therefore never deletes or rebuilds widgets mid-stream.
+	Least recently used sizes are evicted beyond `max_sizes`.
+	"""
+
+	def __init__(self, name: str, axis_tag: str, max_sizes: int = 4):
+		"""
+		Args:
+			name: Unique prefix used for the DearPyGui tags.
+			axis_tag: Plot Y axis hosting the image series.
+			max_sizes: Number of distinct texture sizes kept alive.
+		"""
+		self.name = name
+		self.axis_tag = axis_tag
+		self.max_sizes = max_sizes
+		self.registry_tag = f"{name}_registry"
+		self.front = None  # Last slot scheduled for presentation
+		self.shown = None  # Slot on screen (set by the render loop)
+
+		self._lock = threading.Lock()
+		self._slots: OrderedDict[tuple[int, int], list[TextureSlot]] = OrderedDict()
+		self._back_index: dict[tuple[int, int], int] = {}
+		self._stale: set[int] = set()  # id() of slots to zero before their next use
+
+	def acquire(self, width: int, height: int) -> TextureSlot:
+		"""
+		Returns a back texture for this size, creating the slots if needed.
+		The returned slot is neither on screen nor pending presentation.
+		"""
+		key = (width, height)
+		with self._lock:
+			if key not in self._slots:
+				self._slots[key] = [self._create_slot(width, height, i) for i in range(SLOTS_PER_SIZE)]
+				self._back_index[key] = 0
+				self._evict()
+			self._slots.move_to_end(key)
+
+			slots = self._slots[key]
+			index = self._back_index[key]
+			while slots[index] is self.front or slots[index] is self.shown:
+				index = (index + 1) % SLOTS_PER_SIZE
+			self._back_index[key] = (index + 1) % SLOTS_PER_SIZE
+			if id(slots[index]) in self._stale:
+				self._stale.discard(id(slots[index]))
+				slots[index].buffer.fill(0)
+			return slots[index]
+
+	def present(self, slot: TextureSlot, bounds_min, bounds_max, on_top: bool = False) -> None:
+		"""
+		Schedules the slot to be displayed on the next frame, hiding every other slot of the pool.
+
+		Args:
+			bounds_min, bounds_max: Image series bounds in plot coordinates.
+			on_top: Keep the series drawn after the other series of the axis.
+		"""
+		self.front = slot
+		ui_queue.set_value(slot.texture_tag, slot.buffer.ravel())
+		ui_queue.submit((self.name, "present"), self._apply_present, slot, list(bounds_min), list(bounds_max), on_top)
+
+	def hide(self) -> None:
+		"""Schedules all the series of the pool to be hidden."""
+		self.front = None
+		ui_queue.submit((self.name, "present"), self._apply_present, None, None, None, False)
+
+	def clear_buffers(self) -> None:
+		"""
+		Zeroes the buffers of every pooled texture (e.g. after a layout change).
+		Each buffer is cleared when it is next acquired, so the texture on screen keeps its image until replaced.
+		"""
+		with self._lock:
+			self._stale.update(id(slot) for group in self._slots.values() for slot in group)
+
+	def clear(self) -> None:
+		"""Deletes every texture and series of the pool."""
+		with self._lock:
+			slots = [slot for group in self._slots.values() for slot in group]
+			self._slots.clear()
+			self._back_index.clear()
+			self._stale.clear()
+			self.front = None
+			self.shown = None
+		for slot in slots:
+			self._delete_slot(slot)
+		if dpg.does_item_exist(self.registry_tag):
+			dpg.delete_item(self.registry_tag)
+
+	def _create_slot(self, width: int, height: int, index: int) -> TextureSlot:
+		if not dpg.does_item_exist(self.registry_tag):
+			dpg.add_texture_registry(tag=self.registry_tag, show=False)
+
+		slot = TextureSlot(f"{self.name}_texture_{width}x{height}_{index}",
+						f"{self.name}_series_{width}x{height}_{index}", width, height)
+		dpg.add_raw_texture(width, height, default_value=slot.buffer.ravel(), tag=slot.texture_tag,
+						format=dpg.mvFormat_Float_rgb, parent=self.registry_tag)
+		dpg.add_image_series(slot.texture_tag, [0, 0], [width, height], tag=slot.series_tag,
+						parent=self.axis_tag, show=False)
+		return slot
+
+	def _evict(self) -> None:
+		"""Drops least recently used sizes (never the presented one). Deletion happens on the render loop."""
+		for key in list(self._slots.keys()):
+			if len(self._slots) <= self.max_sizes:
+				break
+			if self.front in self._slots[key] or self.shown in self._slots[key]:
+				continue
+			for slot in self._slots.pop(key):
+				self._stale.discard(id(slot))
+				ui_queue.submit((self.name, "delete", slot.texture_tag), self._delete_slot, slot)
+			self._back_index.pop(key, None)
+
+	@staticmethod
+	def _delete_slot(slot: TextureSlot) -> None:
+		for tag in (slot.series_tag, slot.texture_tag):
+			if dpg.does_item_exist(tag):
+				dpg.delete_item(tag)
+
+	def _apply_present(self, slot, bounds_min, bounds_max, on_top) -> None:
+		"""Runs on the render loop: shows the presented series and hides the others."""
+		with self._lock:
+			slots = [s for group in self._slots.values() for s in group]
+			self.shown = slot if slot in slots else None
+
+		for other in slots:
+			if other is not slot and dpg.does_item_exist(other.series_tag):
+				dpg.configure_item(other.series_tag, show=False)
+
+		if slot is None or not dpg.does_item_exist(slot.series_tag):
+			return
+		dpg.configure_item(slot.series_tag, show=True, bounds_min=bounds_min, bounds_max=bounds_max)
+		if on_top:
+			children = dpg.get_item_children(self.axis_tag, 1) or []
+			if children and children[-1] != dpg.get_alias_id(slot.series_tag):
+				dpg.move_item(slot.series_tag, parent=self.axis_tag)
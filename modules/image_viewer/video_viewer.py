@@ -1,12 +1,19 @@
 import dearpygui.dearpygui as dpg
-import numpy as np
 import threading
-from queue import Queue
 import cv2
 
 from core.window_base import WindowBase
 from core.input_ouput_types import IOTypes
+from core.ui_update_queue import ui_queue
+from core.frame_scheduler import frame_scheduler
 from modules.video_reader.fps_counter import FPSCounter
+from modules.image_viewer.viewport_lod import ViewportLOD
+from modules.image_viewer.texture_pool import TexturePool
+from modules.image_viewer.texture_converter import TextureConverter
+from modules.image_viewer.frame_mailbox import FrameMailbox
+from modules.image_viewer.overlay_layer import OverlayLayer
+from modules.image_viewer.mask_compositor import MaskCompositor
+from loguru import logger
 
 class Video_viewer_win(WindowBase):
 	def __init__(self,
@@ -17,26 +24,46 @@ class Video_viewer_win(WindowBase):
 				uuid=None,
 				outputs=None,
 				visible=True,
-				fps_counter=True):
+				fps_counter=True,
+				viewport_lod=True,
+				mask_alpha=0.4):
 
 		super().__init__(label=label, pos=pos, win_width=win_width, win_height=win_height,
 			uuid=uuid, outputs=outputs or [], visible=visible)
 
-		self.texture_tag = f"video_viewer_texture_{self.UUID}"
 		self.plot_tag = f"video_viewer_plot_{self.UUID}"
-		self.texture_width = 0
-		self.texture_height = 0
+		self.x_axis_tag = f"video_viewer_x_axis_{self.UUID}"
+		self.y_axis_tag = f"video_viewer_y_axis_{self.UUID}"
 		self.lock = threading.Lock()
 
+		# Double-buffered textures, reused across frame and plot sizes
+		self.overview_pool = TexturePool(f"video_viewer_overview_{self.UUID}", self.y_axis_tag)
+		self.detail_pool = TexturePool(f"video_viewer_detail_{self.UUID}", self.y_axis_tag)
+		self.overlay = OverlayLayer(f"video_viewer_{self.UUID}", self.plot_tag)
+
+		# Viewport-sized rendering
+		self.viewport_lod = viewport_lod
+		self.lod = ViewportLOD()
+		self.converter = TextureConverter()
+		self.mask_alpha = mask_alpha
+		self.compositor = MaskCompositor(alpha=mask_alpha)
+		self.frame_width = 0
+		self.frame_height = 0
+		self.detail_size = None
+		self.last_roi = None
+		self.last_frame = None
+		self.last_mask = None
+		self._persistent_fields = ["label", "fps_counter", "viewport_lod", "mask_alpha"]
+
 		# FPS tracking
 		self.fps_counter = fps_counter
 		self.fps_display_tag = f"video_viewer_display_fps_{self.UUID}"
-		self.fps_read_tag = f"video_viewer_read_fps_{self.UUID}"
-		
+		self.fps_received_tag = f"video_viewer_received_fps_{self.UUID}"
+
 		self.display_fps_counter = FPSCounter(smoothing_window=10)
-		self.read_fps_counter = FPSCounter(smoothing_window=10)
+		self.received_fps_counter = FPSCounter(smoothing_window=10)
 
-		self.accepted_input_types = [IOTypes.FRAME, IOTypes.MASK]
+		self.accepted_input_types = [IOTypes.FRAME, IOTypes.MASK, IOTypes.FRAME_MASK_PAIR, IOTypes.OVERLAY]
 		self.outputs = {
 			"Frame": IOTypes.FRAME,
 			"Mask": IOTypes.MASK
@@ -45,8 +72,9 @@ class Video_viewer_win(WindowBase):
 
 		self._build_interface(win_width, win_height, pos)
 
-		# Frame queue and render thread
-		self.frame_queue = Queue(maxsize=1)
+		# Latest-frame slot and render thread
+		self.mailbox = FrameMailbox()
+		self._render_running = True
 		self.worker_thread = threading.Thread(target=self._render_loop, daemon=True)
 		self.worker_thread.start()
 
@@ -54,68 +82,122 @@ class Video_viewer_win(WindowBase):
 		with dpg.window(label=self.label, width=width, height=height, pos=pos, tag=self.winID, show=self.visible):
 			if self.fps_counter:
 				with dpg.group(horizontal=True):
-					dpg.add_text("Read FPS: ")
-					dpg.add_text("0", tag=self.fps_read_tag)
-					dpg.add_text("Display FPS: ")
+					dpg.add_text("Received FPS: ")
+					dpg.add_text("0", tag=self.fps_received_tag)
+					dpg.add_text("Displayed FPS: ")
 					dpg.add_text("0", tag=self.fps_display_tag)
-			self.init_viewer(1280, 720)
+			self.init_viewer()
 
-	def update_image(self, frame):
-		dpg.set_value(self.fps_read_tag, f"{self.read_fps_counter.get_fps()[1]:.1f}")
+	def update_image(self, frame, mask=None, frame_id=None, source=None):
+		"""
+		Posts the frame (and optional mask) to the render thread. Frames arriving between two displayed frames replace each other.
+		`source` and `frame_id` pair the frame with the overlay computed from it (see OverlayLayer).
+		"""
 		if frame is None:
 			return
-
-		try:
-			self.frame_queue.put_nowait(frame)
-		except:
-			pass
+		if self.fps_counter:
+			ui_queue.set_value(self.fps_received_tag, f"{self.received_fps_counter.get_fps()[1]:.1f}")
+		self.mailbox.put((frame, mask, source, frame_id))
+		frame_scheduler.wake()
 
 	def _render_loop(self):
-		while True:
-			frame = self.frame_queue.get()
-			self._update_texture(frame)
-
-	def _update_texture(self, frame):
+		"""
+		Paced by the GUI: after each displayed frame, converts only the latest posted frame.
+		Frames that would never be shown are not converted.
+		"""
+		last_tick = frame_scheduler.frame_count
+		while self._render_running:
+			last_tick = frame_scheduler.wait_for_frame(last_tick, timeout=0.1)
+			item = self.mailbox.get_nowait()
+			redraw = item is None
+			if redraw:
+				# No new frame: re-render the last one if the user zoomed or panned the plot
+				if self.last_frame is None or self.get_visible_roi() == self.last_roi:
+					continue
+				item = (self.last_frame, self.last_mask, None, None)
+
+			frame, mask, source, frame_id = item
+			try:
+				self._update_texture(frame, mask)
+				if not redraw:
+					self.overlay.show_frame(frame_id, source)  # Re-renders (zoom, pan) keep the pairing
+			except Exception as e:
+				logger.warning(f"{self.winID} failed to render frame: {e}")
+
+	def _update_texture(self, frame, mask=None):
+		self.last_frame = frame
+		self.last_mask = mask
 		h, w = frame.shape[:2]
-		if h != self.texture_height or w != self.texture_width:
-			self.init_viewer(w, h)
-
-		texture_data = self.convert_to_texture(frame)
-		dpg.set_value(self.texture_tag, texture_data)
-		dpg.set_value(self.fps_display_tag, f"{self.display_fps_counter.get_fps()[1]:.1f}")
-
-	def convert_to_texture(self, frame: np.ndarray) -> np.ndarray:
-		rgb_frame = frame[..., ::-1]  # BGR to RGB (no copy)
-		return (rgb_frame.astype(np.float32) / 255.0).flatten()
-
-	def init_viewer(self, width, height):
-		if dpg.does_item_exist(self.texture_tag):
-			dpg.delete_item(self.texture_tag)
-		if dpg.does_item_exist(self.plot_tag):
-			dpg.delete_item(self.plot_tag)
-
-		default_img = np.zeros((height, width, 3), dtype=np.uint8)
-		texture = self.convert_to_texture(default_img)
-
-		dpg.push_container_stack(self.winID)
+		resized = (w, h) != (self.frame_width, self.frame_height)
+		self.frame_width, self.frame_height = w, h
+
+		if self.viewport_lod:
+			plot_w, plot_h = dpg.get_item_rect_size(self.plot_tag)
+			overview_size = self.lod.overview_size(w, h, plot_w, plot_h)
+			self.detail_size = self.lod.detail_size(plot_w, plot_h)
+		else:
+			overview_size, self.detail_size = (w, h), None
+
+		roi = None if resized else self.get_visible_roi()
+		if roi is None:
+			slot = self.overview_pool.acquire(*overview_size)
+			self.converter.convert(self.lod.resample(frame, overview_size), slot.buffer)
+			if mask is not None:
+				self.compositor.composite(slot.buffer, self.lod.resample(mask, overview_size, interpolation=cv2.INTER_NEAREST))
+			self.overview_pool.present(slot, [0, 0], [w, h])
+			if self.last_roi is not None or resized:
+				self.detail_pool.hide()
+		else:
+			slot = self.detail_pool.acquire(*self.detail_size)
+			self.converter.convert(self.lod.resample(frame, self.detail_size, roi), slot.buffer)
+			if mask is not None:
+				self.compositor.composite(slot.buffer, self.lod.resample(mask, self.detail_size, roi, cv2.INTER_NEAREST))
+			bounds_min, bounds_max = self.lod.roi_bounds(h, roi)
+			self.detail_pool.present(slot, bounds_min, bounds_max, on_top=True)
+
+		if resized:
+			ui_queue.submit((self.plot_tag, "fit"), self.fit_plot)
+		self.last_roi = roi
+		if self.fps_counter:
+			ui_queue.set_value(self.fps_display_tag, f"{self.display_fps_counter.get_fps()[1]:.1f}")
+
+	def get_visible_roi(self):
+		"""Returns the zoomed pixel region currently shown by the plot, or None if the whole frame is visible."""
+		if self.detail_size is None or not dpg.does_item_exist(self.x_axis_tag):
+			return None
+		return self.lod.visible_roi(self.frame_width, self.frame_height,
+			dpg.get_axis_limits(self.x_axis_tag), dpg.get_axis_limits(self.y_axis_tag))
+
+	def init_viewer(self):
+		"""Creates the plot once. Its textures and image series come from the texture pools."""
 		with dpg.plot(tag=self.plot_tag, no_menus=True, no_title=True, width=-1, height=-1):
-			with dpg.texture_registry(show=False):
-				dpg.add_raw_texture(width, height, default_value=texture, tag=self.texture_tag, format=dpg.mvFormat_Float_rgb)
 			dpg.add_plot_legend()
-			dpg.add_plot_axis(dpg.mvXAxis, no_gridlines=True, no_tick_labels=True, no_tick_marks=True)
-			with dpg.plot_axis(dpg.mvYAxis, no_gridlines=True, no_tick_labels=True, no_tick_marks=True):
-				dpg.add_image_series(self.texture_tag, [0, 0], [width, height])
-		dpg.pop_container_stack()
-		self.texture_width = width
-		self.texture_height = height
+			dpg.add_plot_axis(dpg.mvXAxis, no_gridlines=True, no_tick_labels=True, no_tick_marks=True, tag=self.x_axis_tag)
+			dpg.add_plot_axis(dpg.mvYAxis, no_gridlines=True, no_tick_labels=True, no_tick_marks=True, tag=self.y_axis_tag)
+
+	def fit_plot(self):
+		"""Fits the plot axes to the displayed frame."""
+		dpg.fit_axis_data(self.x_axis_tag)
+		dpg.fit_axis_data(self.y_axis_tag)
+
+	def close(self):
+		"""Stops the render thread and releases the pooled textures before closing the window."""
+		self._render_running = False
+		self.mailbox.close()
+		self.worker_thread.join(timeout=1)
+		self.overview_pool.clear()
+		self.detail_pool.clear()
+		super().close()
 
 	def input_cb(self, *args, **kwargs):
 		frame = kwargs.get("data") if "data" in kwargs else (args[0] if args else None)
-
-		if frame is not None and (len(frame.shape) == 2 or (len(frame.shape) == 3 and frame.shape[2] == 1)):
-			frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-
-		self.update_image(frame)
+		if kwargs.get("data_type") == IOTypes.OVERLAY:
+			self.overlay.update(frame, kwargs.get("source"))
+			return
+		if kwargs.get("data_type") == IOTypes.FRAME_MASK_PAIR:
+			self.update_image(frame[0], frame[1], kwargs.get("frame_id"), kwargs.get("source"))
+			return
+		self.update_image(frame, frame_id=kwargs.get("frame_id"), source=kwargs.get("source"))
 
 
 EXPORTED_CLASS = Video_viewer_win
@@ -0,0 +1,84 @@
+import numpy as np
+import cv2
+
+
+class ViewportLOD:
+	"""
+	Level-of-detail helper for plot-based viewers.
+
+	Instead of uploading textures at source resolution, frames are resampled to the
+	on-screen plot size:
+	- overview: the whole frame, downsampled (INTER_AREA) to fit the plot.
+	- detail: when the plot axes are zoomed, only the visible region of interest is
+	  rendered at native resolution (upsampled with INTER_NEAREST past 1:1).
+
+	Texture sizes are quantized so that small plot resizes do not reallocate textures.
+	"""
+
+	def __init__(self, quantum: int = 16):
+		self.quantum = quantum
+
+	def quantize(self, value: float) -> int:
+		"""Rounds a size up to the next multiple of the quantum."""
+		return max(self.quantum, int(np.ceil(value / self.quantum)) * self.quantum)
+
+	def overview_size(self, frame_w: int, frame_h: int, plot_w: float, plot_h: float) -> tuple[int, int]:
+		"""Returns the texture size of the whole frame fitted in the plot (never larger than the frame)."""
+		if plot_w <= 0 or plot_h <= 0:
+			return frame_w, frame_h
+		scale = min(plot_w / frame_w, plot_h / frame_h)
+		if scale >= 1:
+			return frame_w, frame_h
+		return min(frame_w, self.quantize(frame_w * scale)), min(frame_h, self.quantize(frame_h * scale))
+
+	def detail_size(self, plot_w: float, plot_h: float) -> tuple[int, int] | None:
+		"""Returns the texture size used for zoomed regions (the plot size), or None if unknown yet."""
+		if plot_w <= 0 or plot_h <= 0:
+			return None
+		return self.quantize(plot_w), self.quantize(plot_h)
+
+	@staticmethod
+	def visible_roi(frame_w: int, frame_h: int, x_limits, y_limits) -> tuple[int, int, int, int] | None:
+		"""
+		Converts plot axis limits into a pixel region of interest.
+
+		The image series spans [0, frame_w] x [0, frame_h] in plot coordinates, row 0 at the top.
+
+		Returns:
+			(x0, y0, x1, y1) in pixels, or None if the whole frame is visible or nothing usable is.
+		"""
+		x0 = max(0, int(np.floor(x_limits[0])))
+		x1 = min(frame_w, int(np.ceil(x_limits[1])))
+		y0 = max(0, int(np.floor(frame_h - y_limits[1])))
+		y1 = min(frame_h, int(np.ceil(frame_h - y_limits[0])))
+
+		if x1 - x0 < 2 or y1 - y0 < 2:
+			return None
+		if x0 == 0 and y0 == 0 and x1 == frame_w and y1 == frame_h:
+			return None
+		return x0, y0, x1, y1
+
+	@staticmethod
+	def roi_bounds(frame_h: int, roi: tuple[int, int, int, int]) -> tuple[list, list]:
+		"""Returns the (bounds_min, bounds_max) of an image series displaying the ROI."""
+		x0, y0, x1, y1 = roi
+		return [x0, frame_h - y1], [x1, frame_h - y0]
+
+	@staticmethod
+	def resample(frame: np.ndarray, size: tuple[int, int], roi=None, interpolation=None) -> np.ndarray:
+		"""
+		Crops the frame to the ROI (no copy) and resizes it to `size` (w, h).
+
+		Args:
+			interpolation: Forced cv2 interpolation (e.g. INTER_NEAREST for masks).
+				Defaults to INTER_AREA when shrinking and INTER_NEAREST when enlarging.
+		"""
+		if roi is not None:
+			x0, y0, x1, y1 = roi
+			frame = frame[y0:y1, x0:x1]
+		h, w = frame.shape[:2]
+		if (w, h) == tuple(size):
+			return frame
+		if interpolation is None:
+			interpolation = cv2.INTER_AREA if size[0] <= w and size[1] <= h else cv2.INTER_NEAREST
+		return cv2.resize(frame, tuple(size), interpolation=interpolation)
@@ -0,0 +1,119 @@
+import os
+import json
+import errno
+import shutil
+from typing import Optional
+import numpy as np
+from loguru import logger
+
+RECORDING_META = "recording.json"
+RECORDING_INDEX = "index.csv"
+
+
+class ChunkedRecording:
+	"""
+	Recording folder made of preallocated, memory-mapped `.npy` chunk files.
+
+	Each chunk holds `frames_per_chunk` frames and is allocated on disk up front, so
+	writing a frame is a memory copy into the mapping and the OS writes pages back
+	in the background. A sidecar `index.csv` (sequence id, timestamp, chunk, frame in
+	chunk) is appended as frames are written, and `recording.json` describes the
+	chunks once the recording is closed. Gaps in the sequence ids are dropped frames.
+	"""
+
+	def __init__(self, folder: str, frame_shape: tuple, dtype, frames_per_chunk: int = 256):
+		self.folder = folder
+		self.frame_shape = tuple(frame_shape)
+		self.dtype = np.dtype(dtype)
+		self.frames_per_chunk = max(1, frames_per_chunk)
+		self.chunks = []  # [{"file": name, "frames": n}]
+		self.frames = 0
+		self.nbytes = 0
+
+		os.makedirs(folder, exist_ok=True)
+		self._index = open(os.path.join(folder, RECORDING_INDEX), "w", buffering=1 << 16)
+		self._index.write("seq,timestamp,chunk,frame\n")
+		self._chunk: Optional[np.memmap] = None
+		self._chunk_fill = 0
+
+	def write(self, frame: np.ndarray, seq: int, timestamp: float) -> None:
+		if self._chunk is None:
+			self._open_chunk()
+		self._chunk[self._chunk_fill] = frame
+		self._index.write(f"{seq},{timestamp:.6f},{len(self.chunks) - 1},{self._chunk_fill}\n")
+		self._chunk_fill += 1
+		self.chunks[-1]["frames"] = self._chunk_fill
+		self.frames += 1
+		self.nbytes += frame.nbytes
+		if self._chunk_fill == self.frames_per_chunk:
+			self._finish_chunk()
+
+	def close(self, **extra) -> str:
+		"""
+		Flushes the last chunk and writes `recording.json`.
+
+		Args:
+			extra: Additional metadata (e.g. the drop count).
+
+		Returns:
+			Path of `recording.json`.
+		"""
+		self._finish_chunk()
+		self._index.close()
+		meta = {
+			"format": "npy_chunks",
+			"frame_shape": list(self.frame_shape),
+			"dtype": self.dtype.str,
+			"frames_per_chunk": self.frames_per_chunk,
+			"frames": self.frames,
+			"chunks": self.chunks,
+			**extra,
+		}
+		path = os.path.join(self.folder, RECORDING_META)
+		with open(path, "w") as f:
+			json.dump(meta, f, indent=1)
+		return path
+
+	def _open_chunk(self) -> None:
+		name = f"chunk_{len(self.chunks):05d}.npy"
+		path = os.path.join(self.folder, name)
+		chunk = np.lib.format.open_memmap(path, mode="w+", dtype=self.dtype,
+			shape=(self.frames_per_chunk,) + self.frame_shape)
+		try:
+			self._preallocate(path)
+		except OSError:
+			del chunk
+			os.remove(path)
+			raise
+		self._chunk = chunk
+		self._chunk_fill = 0
+		self.chunks.append({"file": name, "frames": 0})
+
+	def _finish_chunk(self) -> None:
+		if self._chunk is None:
+			return
+		self._chunk.flush()
+		self._chunk = None  # Unmapped once the last reference is gone
+		self._index.flush()
+
+	@staticmethod
+	def _preallocate(path: str) -> None:
+		"""
+		Reserves the chunk's blocks on disk (the memmap file is sparse otherwise).
+
+		Writing into an unbacked page of a full disk raises SIGBUS and kills the process, so
+		running out of space raises OSError here instead, before any frame is stored.
+		Where preallocation is unsupported, the free space is checked instead.
+		"""
+		size = os.path.getsize(path)
+		if hasattr(os, "posix_fallocate"):
+			try:
+				with open(path, "r+b") as f:
+					os.posix_fallocate(f.fileno(), 0, size)
+				return
+			except OSError as e:
+				if e.errno in (errno.ENOSPC, errno.EFBIG, errno.EDQUOT):
+					raise
+				logger.debug(f"Could not preallocate {path}: {e}")
+		if shutil.disk_usage(os.path.dirname(path) or ".").free < size:
+			raise OSError(errno.ENOSPC, "Not enough free space for the next chunk", path)
@@ -0,0 +1,140 @@
+import os
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+import numpy as np
+from loguru import logger
+
+from modules.recorder.chunked_recording import RECORDING_META, RECORDING_INDEX
+from tools.chunk_codec.chunk_codec import CODECS, compress_chunk
+
+
+class CompressedRecording:
+	"""
+	Recording folder of compressed chunks (`chunk_00000.zlib`, ...), one file per block of frames.
+
+	Frames are gathered into a block of `frames_per_chunk`, then compressed by a pool of
+	processes so compression scales across cores; compressed blocks are written in order
+	as they complete. Blocks are pickled whole to the workers, so a block is capped to
+	`max_block_bytes` (fewer frames per chunk for large frames) and the blocks in flight
+	to `max_pending_bytes` and two per worker: beyond that `write` waits, which backs up
+	the recorder's ring buffer (and drops are counted there).
+	Same index.csv / recording.json layout as ChunkedRecording, with the codec and the
+	compressed size of each chunk.
+	"""
+
+	def __init__(self, folder: str, frame_shape: tuple, dtype, frames_per_chunk: int = 64,
+				codec: str = "zlib", level: int = 3, workers: Optional[int] = None,
+				max_block_bytes: int = 32 << 20, max_pending_bytes: int = 256 << 20):
+		self.folder = folder
+		self.frame_shape = tuple(frame_shape)
+		self.dtype = np.dtype(dtype)
+		frame_nbytes = max(1, int(np.prod(self.frame_shape)) * self.dtype.itemsize)
+		self.frames_per_chunk = max(1, min(frames_per_chunk, max_block_bytes // frame_nbytes))
+		self.codec = codec if codec in CODECS else "zlib"
+		self.level = level
+		self.chunks = []  # [{"file": name, "frames": n, "nbytes": compressed size}]
+		self.frames = 0
+		self.nbytes = 0
+		self.compressed_nbytes = 0
+		self.compressed_frames = 0
+		self.error: Optional[str] = None  # Set once a chunk failed: later chunks are discarded
+
+		os.makedirs(folder, exist_ok=True)
+		self._index = open(os.path.join(folder, RECORDING_INDEX), "w", buffering=1 << 16)
+		self._index.write("seq,timestamp,chunk,frame\n")
+		workers = workers or max(1, (os.cpu_count() or 2) - 1)
+		self._pool = ProcessPoolExecutor(max_workers=workers)
+		block_nbytes = self.frames_per_chunk * frame_nbytes
+		self._max_pending = max(1, min(2 * workers, max_pending_bytes // block_nbytes))
+		self._pending = deque()  # (chunk number, frames, index rows, future), in chunk order
+		self._block_rows = []  # index.csv rows of the block being filled
+		self._block = self._new_block()
+		self._block_fill = 0
+
+	def write(self, frame: np.ndarray, seq: int, timestamp: float) -> None:
+		self._block[self._block_fill] = frame
+		# Rows go to index.csv only once their chunk is written, so the index never lists a discarded chunk
+		self._block_rows.append(f"{seq},{timestamp:.6f},{len(self.chunks) + len(self._pending)},{self._block_fill}\n")
+		self._block_fill += 1
+		self.frames += 1
+		self.nbytes += frame.nbytes
+		if self._block_fill == self.frames_per_chunk:
+			self._submit_block()
+		self._collect(wait=len(self._pending) >= self._max_pending)
+
+	def close(self, **extra) -> str:
+		"""
+		Compresses the last partial block, waits for all chunks and writes `recording.json`.
+		If compression failed, the metadata still describes the chunks written before the failure.
+		"""
+		if self.error is None:
+			try:
+				self._submit_block()
+				while self._pending:
+					self._collect(wait=True)
+			except Exception as e:
+				self.error = self.error or repr(e)
+				logger.error(f"Compressed recording {self.folder} truncated: {e}")
+		self._pool.shutdown(wait=self.error is None, cancel_futures=True)
+		self._index.close()
+		meta = {
+			"format": "compressed_chunks",
+			"codec": self.codec,
+			"frame_shape": list(self.frame_shape),
+			"dtype": self.dtype.str,
+			"frames_per_chunk": self.frames_per_chunk,
+			"frames": self.compressed_frames,
+			"chunks": self.chunks,
+			"compressed_nbytes": self.compressed_nbytes,
+			**extra,
+		}
+		if self.error is not None:
+			meta["error"] = self.error
+		path = os.path.join(self.folder, RECORDING_META)
+		with open(path, "w") as f:
+			json.dump(meta, f, indent=1)
+		return path
+
+	def compression_ratio(self) -> float:
+		"""Raw / compressed size of the chunks written so far."""
+		raw = self.compressed_frames * self._block[0].nbytes
+		return raw / self.compressed_nbytes if self.compressed_nbytes else 1.0
+
+	def _submit_block(self) -> None:
+		if self._block_fill == 0 or self.error is not None:
+			return
+		block = self._block[:self._block_fill]
+		number = len(self.chunks) + len(self._pending)
+		self._pending.append((number, self._block_fill, self._block_rows, self._pool.submit(compress_chunk, block, self.codec, self.level)))
+		# The pool pickles the block later, from its own thread: never refill a submitted buffer
+		self._block = self._new_block()
+		self._block_fill = 0
+		self._block_rows = []
+
+	def _new_block(self) -> np.ndarray:
+		return np.empty((self.frames_per_chunk,) + self.frame_shape, dtype=self.dtype)
+
+	def _collect(self, wait: bool) -> None:
+		"""
+		Writes the compressed chunks completed so far, in order (waiting for the oldest if `wait`).
+		A failed chunk (codec error, broken pool) discards the chunks after it, whose numbers would no longer match, and raises.
+		"""
+		while self._pending and (wait or self._pending[0][3].done()):
+			number, frames, rows, future = self._pending.popleft()
+			try:
+				blob = future.result()
+			except Exception as e:
+				self.error = f"chunk {number}: {e!r}"
+				self._pending.clear()
+				raise
+			name = f"chunk_{number:05d}.{self.codec}"
+			with open(os.path.join(self.folder, name), "wb") as f:
+				f.write(blob)
+			self.chunks.append({"file": name, "frames": frames, "nbytes": len(blob)})
+			self.compressed_nbytes += len(blob)
+			self.compressed_frames += frames
+			self._index.writelines(rows)
+			self._index.flush()
+			wait = False
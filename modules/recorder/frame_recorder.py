@@ -0,0 +1,143 @@
+import threading
+import time
+from collections import deque
+from typing import Optional
+import numpy as np
+from loguru import logger
+
+from modules.recorder.frame_ring import FrameRing
+from modules.recorder.chunked_recording import ChunkedRecording
+from modules.recorder.compressed_recording import CompressedRecording
+
+
+class FrameRecorder:
+	"""
+	Records frames without stalling the thread that delivers them.
+
+	`submit` (acquisition side) copies the frame into a FrameRing and returns; a writer
+	thread moves frames from the ring into a ChunkedRecording. If the disk cannot keep
+	up, the ring fills and new frames are dropped and counted instead of blocking the
+	camera. The recording geometry (shape, dtype) is taken from the first frame.
+	With a codec, frames go to a CompressedRecording instead (compressed in a process pool).
+	"""
+
+	def __init__(self, frames_per_chunk: int = 256, ring_frames: int = 64, codec: Optional[str] = None,
+				level: int = 3, smoothing_window: int = 60):
+		"""
+		Args:
+			frames_per_chunk: Frames per chunk file.
+			ring_frames: Frames buffered between acquisition and the writer.
+			codec: None for raw memory-mapped .npy chunks, or a compressed_recording codec ("zlib", "blosc").
+			level: Compression level.
+			smoothing_window: Number of samples averaged in the stats.
+		"""
+		self.frames_per_chunk = frames_per_chunk
+		self.ring_frames = ring_frames
+		self.codec = codec
+		self.level = level
+		self.folder: Optional[str] = None
+		self.ring: Optional[FrameRing] = None
+		self.recording = None  # ChunkedRecording or CompressedRecording
+		self._thread: Optional[threading.Thread] = None
+		self._lock = threading.Lock()
+		self._armed = False
+		self._running = False
+		self.seq = 0
+		self.rejected = 0
+		self.error: Optional[str] = None  # Set when the writer stopped on a failure (disk full, codec error)
+		self._write_times = deque(maxlen=smoothing_window)
+		self._started = 0.0
+
+	def arm(self, folder: str) -> None:
+		"""Starts a recording into `folder` with the next submitted frame."""
+		with self._lock:
+			self.folder = folder
+			self.seq = 0
+			self.rejected = 0
+			self._armed = True
+
+	def is_recording(self) -> bool:
+		return self._armed or self._running
+
+	def submit(self, frame: np.ndarray, timestamp: Optional[float] = None) -> bool:
+		"""
+		Queues a frame for writing (never blocks on the disk).
+
+		Returns:
+			True if queued, False if dropped (ring full or geometry differing from the recording).
+		"""
+		with self._lock:
+			if self._armed:
+				self._start(frame)
+			if not self._running:
+				return False
+			seq = self.seq
+			self.seq += 1
+		if frame.shape != self.ring.frame_shape or frame.dtype != self.ring.dtype:
+			self.rejected += 1
+			return False
+		return self.ring.push(frame, (seq, time.time() if timestamp is None else timestamp))
+
+	def stop(self) -> Optional[str]:
+		"""
+		Writes the buffered frames, then closes the recording.
+
+		Returns:
+			Path of the recording metadata file, or None if nothing was recorded.
+		"""
+		with self._lock:
+			self._armed = False
+			self._running = False
+			thread, self._thread = self._thread, None
+		if thread is None:
+			return None
+		thread.join()
+		return self.recording.close(dropped=self.ring.dropped + self.rejected, received=self.seq)
+
+	def get_stats(self) -> dict:
+		"""Returns written/dropped frame counts, ring fill, write time and throughput."""
+		if self.recording is None:
+			return {"written": 0, "dropped": 0, "buffered": 0, "capacity": self.ring_frames, "write_ms": 0.0, "mb_s": 0.0, "ratio": 1.0}
+		times = list(self._write_times)
+		elapsed = max(1e-6, time.perf_counter() - self._started)
+		return {
+			"written": self.recording.frames,
+			"dropped": self.ring.dropped + self.rejected,
+			"buffered": self.ring.fill(),
+			"capacity": self.ring.capacity,
+			"write_ms": sum(times) / len(times) * 1000 if times else 0.0,
+			"mb_s": self.recording.nbytes / elapsed / 2**20,
+			"ratio": self.recording.compression_ratio() if self.codec else 1.0,
+		}
+
+	def _start(self, frame: np.ndarray) -> None:
+		self._armed = False
+		self.ring = FrameRing(self.ring_frames, frame.shape, frame.dtype)
+		if self.codec:
+			self.recording = CompressedRecording(self.folder, frame.shape, frame.dtype, self.frames_per_chunk, self.codec, self.level)
+		else:
+			self.recording = ChunkedRecording(self.folder, frame.shape, frame.dtype, self.frames_per_chunk)
+		self._write_times.clear()
+		self._started = time.perf_counter()
+		self._running = True
+		self._thread = threading.Thread(target=self._writer_loop, daemon=True)
+		self._thread.start()
+		logger.info(f"Recording {frame.shape} {frame.dtype} frames into {self.folder}")
+
+	def _writer_loop(self) -> None:
+		while self._running or self.ring.fill():
+			item = self.ring.peek(timeout=0.1)
+			if item is None:
+				continue
+			frame, (seq, timestamp) = item
+			start = time.perf_counter()
+			try:
+				self.recording.write(frame, seq, timestamp)
+			except Exception as e:
+				logger.error(f"Recording write failed, recording stopped: {e}")
+				self.error = str(e)
+				self._running = False
+				break  # The frames still buffered are dropped; stop() closes what was written
+			finally:
+				self.ring.release()
+			self._write_times.append(time.perf_counter() - start)
@@ -0,0 +1,69 @@
+import threading
+from typing import Optional
+import numpy as np
+
+
+class FrameRing:
+	"""
+	Bounded ring of preallocated frame slots between an acquisition thread and a writer.
+
+	`push` copies the frame into a free slot and never blocks: when the ring is full
+	the frame is dropped and counted, so a slow disk never stalls acquisition.
+	The writer takes the oldest slot with `peek`, copies it out, then `release`s it.
+	"""
+
+	def __init__(self, capacity: int, frame_shape: tuple, dtype):
+		self.capacity = max(1, capacity)
+		self.frame_shape = tuple(frame_shape)
+		self.dtype = np.dtype(dtype)
+		self.slots = np.empty((self.capacity,) + self.frame_shape, dtype=self.dtype)
+		self._meta = [None] * self.capacity
+		self._head = 0  # Next slot to write
+		self._tail = 0  # Next slot to read
+		self._count = 0
+		self._cond = threading.Condition()
+		self._push_lock = threading.Lock()  # Several sources may push concurrently
+		self.dropped = 0
+
+	def push(self, frame: np.ndarray, meta) -> bool:
+		"""Copies a frame into the ring. Returns False (and counts a drop) if the ring is full."""
+		with self._push_lock:
+			with self._cond:
+				if self._count == self.capacity:
+					self.dropped += 1
+					return False
+				head = self._head
+			np.copyto(self.slots[head], frame, casting="unsafe")  # Outside the condition: the slot is not visible yet
+			with self._cond:
+				self._meta[head] = meta
+				self._head = (head + 1) % self.capacity
+				self._count += 1
+				self._cond.notify_all()
+		return True
+
+	def peek(self, timeout: Optional[float] = None):
+		"""
+		Waits for the oldest frame.
+
+		Returns:
+			(frame view, meta), or None on timeout. The view is valid until `release`.
+		"""
+		with self._cond:
+			if not self._cond.wait_for(lambda: self._count > 0, timeout):
+				return None
+			return self.slots[self._tail], self._meta[self._tail]
+
+	def release(self) -> None:
+		"""Frees the slot returned by the last `peek`."""
+		with self._cond:
+			self._meta[self._tail] = None
+			self._tail = (self._tail + 1) % self.capacity
+			self._count -= 1
+			self._cond.notify_all()
+
+	def fill(self) -> int:
+		return self._count
+
+	def wait_empty(self, timeout: Optional[float] = None) -> bool:
+		with self._cond:
+			return self._cond.wait_for(lambda: self._count == 0, timeout)
@@ -0,0 +1,154 @@
+import dearpygui.dearpygui as dpg
+from core.window_base import WindowBase
+from core.input_ouput_types import IOTypes
+from core.ui_update_queue import ui_queue
+from modules.recorder.frame_recorder import FrameRecorder
+from tools.chunk_codec.chunk_codec import CODECS
+import numpy as np
+import os, time, threading
+from loguru import logger
+
+class Recorder_win(WindowBase):
+	"""
+	Records incoming FRAME / FRAME16 data into chunked recordings.
+
+	Frames are copied into a ring buffer and written by a background thread into
+	preallocated memory-mapped .npy chunk files ("Raw"), or compressed by a process pool
+	into zlib/Blosc chunk files for long runs, so acquisition never waits for the disk.
+	Frames arriving while the ring is full are dropped and counted. Each recording is a
+	folder with the chunks, an index.csv of sequence ids and timestamps, and a
+	recording.json sent on the "Recording" output when stopped (readable by the Stack Reader).
+	"""
+
+	def __init__(self,
+				label="Recorder",
+				win_width=320,
+				win_height=200,
+				pos=(10, 10),
+				uuid=None,
+				outputs=None,
+				visible=True,
+				folder="recordings",
+				prefix="rec",
+				frames_per_chunk=256,
+				ring_frames=64,
+				record_format="Raw",
+				compression_level=3):
+
+		super().__init__(label=label, pos=pos, win_width=win_width, win_height=win_height, uuid=uuid, outputs=outputs, visible=visible)
+
+		self.folder = folder
+		self.prefix = prefix
+		self.frames_per_chunk = frames_per_chunk
+		self.ring_frames = ring_frames
+		self.record_format = record_format  # "Raw" or a codec name
+		self.compression_level = compression_level
+		self._persistent_fields = ["label", "folder", "prefix", "frames_per_chunk", "ring_frames", "record_format", "compression_level"]
+		self.accepted_input_types = [IOTypes.FRAME, IOTypes.FRAME16, IOTypes.TRIGGER]
+
+		self.outputs = {
+			"Recording": IOTypes.FILE_PATH,
+		}
+		self.connections = {k: [] for k in self.outputs}
+
+		self.winID = f"recorder_win_{self.UUID}"
+		self.folder_tag = f"recorder_folder_{self.UUID}"
+		self.record_tag = f"recorder_record_{self.UUID}"
+		self.stats_tag = f"recorder_stats_{self.UUID}"
+
+		self.recorder = None
+		self.stop_lock = threading.Lock()  # The GUI and the producer thread (writer failure) may both stop
+		self.last_stats = 0.0
+
+		with dpg.window(label=self.label, width=self.win_width, height=self.win_height,
+						pos=self.pos, tag=self.winID, show=self.visible):
+
+			dpg.add_input_text(label="Folder", tag=self.folder_tag, default_value=self.folder, width=-60,
+				callback=lambda s, a: setattr(self, "folder", a))
+			dpg.add_input_text(label="Prefix", default_value=self.prefix, width=-60, callback=lambda s, a: setattr(self, "prefix", a))
+			with dpg.group(horizontal=True):
+				dpg.add_input_int(label="Frames/chunk", default_value=self.frames_per_chunk, min_value=1, min_clamped=True, width=90,
+					callback=lambda s, a: setattr(self, "frames_per_chunk", a))
+				dpg.add_input_int(label="Ring", default_value=self.ring_frames, min_value=1, min_clamped=True, width=90,
+					callback=lambda s, a: setattr(self, "ring_frames", a))
+			with dpg.group(horizontal=True):
+				dpg.add_combo(["Raw"] + CODECS, label="Format", default_value=self.record_format if self.record_format in CODECS else "Raw",
+					width=90, callback=lambda s, a: setattr(self, "record_format", a))
+				dpg.add_input_int(label="Level", default_value=self.compression_level, min_value=1, max_value=9, min_clamped=True, max_clamped=True,
+					width=90, callback=lambda s, a: setattr(self, "compression_level", a))
+			dpg.add_button(label="RECORD", tag=self.record_tag, callback=self.toggle_recording)
+			dpg.add_text("", tag=self.stats_tag)
+
+	def toggle_recording(self, sender=None, app_data=None):
+		if self.recorder is not None:
+			self.stop_recording()  # Also finalizes a recording whose writer failed
+		else:
+			self.start_recording()
+
+	def start_recording(self):
+		"""Arms a new recording; it starts with the next frame received."""
+		if self.recorder is not None:
+			if self.recorder.is_recording():
+				return
+			self.stop_recording()  # Writer failed: close it (recording.json, output) before starting anew
+		path = os.path.join(self.folder, f"{self.prefix}_{time.strftime('%Y%m%d_%H%M%S')}")
+		codec = self.record_format if self.record_format in CODECS else None
+		self.recorder = FrameRecorder(frames_per_chunk=self.frames_per_chunk, ring_frames=self.ring_frames, codec=codec, level=self.compression_level)
+		self.recorder.arm(path)
+		ui_queue.configure_item(self.record_tag, label="STOP")
+		ui_queue.set_value(self.stats_tag, f"Waiting for frames -> {path}")
+
+	def stop_recording(self):
+		"""Writes the buffered frames, closes the recording and sends its path."""
+		with self.stop_lock:
+			recorder, self.recorder = self.recorder, None
+		if recorder is None:
+			return
+		meta_path = recorder.stop()
+		ui_queue.configure_item(self.record_tag, label="RECORD")
+		if meta_path is None:
+			ui_queue.set_value(self.stats_tag, "Nothing recorded")
+			return
+		self.update_stats(recorder)
+		logger.info(f"{self.winID} Recording saved: {meta_path}")
+		self.output_cb(meta_path)
+
+	def update_stats(self, recorder):
+		stats = recorder.get_stats()
+		ratio = f" | Ratio: {stats['ratio']:.1f}x" if recorder.codec else ""
+		error = f"\nStopped on error: {recorder.error}" if recorder.error else ""
+		ui_queue.set_value(self.stats_tag,
+			f"Written: {stats['written']} | Dropped: {stats['dropped']}\n"
+			f"Ring: {stats['buffered']}/{stats['capacity']} | Write: {stats['write_ms']:.2f} ms | {stats['mb_s']:.0f} MB/s{ratio}{error}")
+
+	def input_cb(self, *args, **kwargs):
+		data = kwargs.get("data", args[0] if args else None)
+		if isinstance(data, np.ndarray):
+			recorder = self.recorder
+			if recorder is None:
+				return
+			if recorder.error is not None:
+				self.stop_recording()  # Writer died: save what was written and reset the button
+				return
+			recorder.submit(data)  # Timestamped on arrival (wall clock)
+			now = time.perf_counter()
+			if now - self.last_stats >= 0.5:
+				self.last_stats = now
+				self.update_stats(recorder)
+		elif data == "START":
+			self.start_recording()
+		elif data == "STOP":
+			self.stop_recording()
+
+	def output_cb(self, path):
+		for output_key in self.outputs:
+			for module in self.connections.get(output_key, []):
+				module.input_cb(data=path)
+
+	def close(self):
+		"""Finishes the current recording before closing the window."""
+		self.stop_recording()
+		super().close()
+
+EXPORTED_CLASS = Recorder_win
+EXPORTED_NAME = "Recorder"
@@ -1,6 +1,7 @@
 import dearpygui.dearpygui as dpg
 from core.window_base import WindowBase
 from core.input_ouput_types import IOTypes
+from core.ui_update_queue import ui_queue
 from modules.seecam_win.seecam import Seecam
 import threading
 
@@ -142,9 +143,9 @@ class Seecam_win(WindowBase):
 					self.trigger_cb(frame, frame8_bit)
 
 					if dpg.get_value(self.auto_exposure_tag):
-						dpg.set_value(self.webcam_exposure_tag, self.seecam.auto_expos(frame8_bit))
+						ui_queue.set_value(self.webcam_exposure_tag, self.seecam.auto_expos(frame8_bit))
 					
-					dpg.set_value(self.frame_avg_tag, f"Frame avg. : {self.seecam.calc_exposure(frame8_bit):.0f}")
+					ui_queue.set_value(self.frame_avg_tag, f"Frame avg. : {self.seecam.calc_exposure(frame8_bit):.0f}")
 
 
 		self.cam_thread = threading.Thread(target=task)
@@ -170,9 +171,9 @@ class Seecam_win(WindowBase):
 			connected_modules = self.connections.get(output_key, [])
 			for module in connected_modules:
 				if idx == 0:
-					module.input_cb(args[1])
+					module.input_cb(args[1], source=self.UUID)
 				if idx == 1:
-					module.input_cb(args[0])
+					module.input_cb(args[0], source=self.UUID)
 
 EXPORTED_CLASS = Seecam_win
 EXPORTED_NAME = "Seecam"
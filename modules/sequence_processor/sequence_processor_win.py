@@ -1,6 +1,7 @@
 import dearpygui.dearpygui as dpg
 from core.window_base import WindowBase
 from core.input_ouput_types import IOTypes
+from core.ui_update_queue import ui_queue
 from modules.sequence_processor.sequence_processor import sequence_processor
 from loguru import logger
 import datetime
@@ -112,13 +113,13 @@ class Sequence_processor_win(WindowBase):
 
 					if not self.seq_running :
 						logger.info("Sequence aborted")
-						dpg.set_value(self.seq_remaining_tag, f"Duration : ABORTED")
+						ui_queue.set_value(self.seq_remaining_tag, f"Duration : ABORTED")
 						return
 
 					self.total_duration -= duration
-					dpg.set_value(self.seq_remaining_tag, f"Duration : {datetime.timedelta(seconds=int(self.total_duration))}")
+					ui_queue.set_value(self.seq_remaining_tag, f"Duration : {datetime.timedelta(seconds=int(self.total_duration))}")
 
-					dpg.highlight_table_row(self.table_tag, i,  [0,0,255,50])
+					ui_queue.submit((self.table_tag, i), dpg.highlight_table_row, self.table_tag, i, [0,0,255,50])
 
 					cmd_response = sequence_processor.trad_cmd(cmd)
 
@@ -135,12 +136,12 @@ class Sequence_processor_win(WindowBase):
 							if not self.seq_running:
 								logger.info("Sequence aborted")
 								self.trigger_cb(1,"KILLED")
-								dpg.set_value(self.seq_remaining_tag, f"Duration : ABORTED")
+								ui_queue.set_value(self.seq_remaining_tag, f"Duration : ABORTED")
 								return
 
-					dpg.highlight_table_row(self.table_tag, i,  [0,255,0,50])
+					ui_queue.submit((self.table_tag, i), dpg.highlight_table_row, self.table_tag, i, [0,255,0,50])
 
-				dpg.set_value(self.seq_remaining_tag, f"Duration : DONE")
+				ui_queue.set_value(self.seq_remaining_tag, f"Duration : DONE")
 				self.trigger_cb(1,"DONE")
 				self.seq_running = False
 
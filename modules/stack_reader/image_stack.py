@@ -0,0 +1,214 @@
+import os
+import json
+import mmap
+from typing import Optional
+import numpy as np
+import cv2
+from tools.chunk_codec.chunk_codec import decompress_chunk
+
+try:
+	import tifffile
+except ImportError:
+	tifffile = None
+
+STACK_EXTENSIONS = (".npy", ".raw", ".bin", ".tif", ".tiff", "recording.json")
+
+
+class ImageStack:
+	"""
+	Random-access stack of frames stored in a single file.
+
+	`frame(i)` returns the i-th frame. Memory-mapped stacks return read-only views
+	into the mapping (`zero_copy` is True): nothing is read until the pixels are
+	used, and the OS page cache does the buffering.
+	"""
+
+	zero_copy = True
+
+	def __init__(self, path: str):
+		self.path = path
+		self.frames: Optional[np.ndarray] = None  # (n, h, w[, c]) memmap, when memory-mapped
+
+	def __len__(self) -> int:
+		return len(self.frames)
+
+	@property
+	def frame_shape(self) -> tuple:
+		return self.frames.shape[1:]
+
+	@property
+	def dtype(self) -> np.dtype:
+		return self.frames.dtype
+
+	def frame(self, index: int) -> np.ndarray:
+		return self.frames[index]
+
+	def advise_sequential(self) -> None:
+		"""Asks the OS for aggressive read-ahead on the mapping (no-op where unsupported)."""
+		mapping = getattr(self.frames, "_mmap", None)
+		if mapping is not None and hasattr(mapping, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+			mapping.madvise(mmap.MADV_SEQUENTIAL)
+
+	def close(self) -> None:
+		# The mapping is never closed explicitly: frames sent downstream are views into it
+		# (numpy does not pin the buffer, so closing would leave them dangling). It is
+		# unmapped when the last view is released.
+		self.frames = None
+
+
+class NpyStack(ImageStack):
+	"""`.npy` file of shape (n, h, w[, c]), or a single (h, w) image."""
+
+	def __init__(self, path: str):
+		super().__init__(path)
+		frames = np.load(path, mmap_mode="r")
+		self.frames = frames[np.newaxis] if frames.ndim == 2 else frames
+
+
+class RawStack(ImageStack):
+	"""Headerless file of consecutive frames; the geometry must be given."""
+
+	def __init__(self, path: str, width: int, height: int, dtype: str = "uint16", channels: int = 1, offset: int = 0):
+		"""
+		Args:
+			width, height: Frame size in pixels.
+			dtype: Pixel type (e.g. "uint8", "uint16", "<u2", "float32").
+			channels: Values per pixel.
+			offset: Header bytes to skip at the start of the file.
+		"""
+		super().__init__(path)
+		shape = (height, width) if channels == 1 else (height, width, channels)
+		frame_bytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+		count = (os.path.getsize(path) - offset) // frame_bytes
+		if count <= 0:
+			raise ValueError(f"{path} is smaller than one {width}x{height}x{channels} {dtype} frame")
+		self.frames = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,) + shape)
+
+
+class TiffStack(ImageStack):
+	"""
+	Multi-page TIFF. Uncompressed contiguous files are memory-mapped through tifffile;
+	other files (or without tifffile) are decoded page by page.
+	"""
+
+	def __init__(self, path: str):
+		super().__init__(path)
+		self._tiff = None
+		self._count = 0
+		if tifffile is not None:
+			try:
+				frames = tifffile.memmap(path, mode="r")
+				self.frames = frames[np.newaxis] if frames.ndim == 2 else frames
+				return
+			except ValueError:
+				self._tiff = tifffile.TiffFile(path)
+				self._count = len(self._tiff.pages)
+		else:
+			self._count = cv2.imcount(path)
+		self.zero_copy = False
+		first = self.frame(0)
+		self._shape, self._dtype = first.shape, first.dtype
+
+	def __len__(self) -> int:
+		return self._count if self.frames is None else len(self.frames)
+
+	@property
+	def frame_shape(self) -> tuple:
+		return self._shape if self.frames is None else self.frames.shape[1:]
+
+	@property
+	def dtype(self) -> np.dtype:
+		return self._dtype if self.frames is None else self.frames.dtype
+
+	def frame(self, index: int) -> np.ndarray:
+		if self.frames is not None:
+			return self.frames[index]
+		if self._tiff is not None:
+			return self._tiff.pages[index].asarray()
+		ret, pages = cv2.imreadmulti(self.path, start=index, count=1, flags=cv2.IMREAD_UNCHANGED)
+		if not ret:
+			raise IOError(f"Could not read page {index} of {self.path}")
+		return pages[0]
+
+	def close(self) -> None:
+		if self._tiff is not None:
+			self._tiff.close()
+		super().close()
+
+
+class RecordingStack(ImageStack):
+	"""
+	Chunked recording written by the Recorder module, opened through its `recording.json`.
+
+	Raw recordings memory-map every .npy chunk. Compressed recordings decompress the
+	chunk holding the requested frame, keeping the last one decoded so sequential reads
+	decompress each chunk once.
+	"""
+
+	def __init__(self, path: str):
+		super().__init__(path)
+		with open(path) as f:
+			self.meta = json.load(f)
+		self._folder = os.path.dirname(path)
+		self._per_chunk = self.meta["frames_per_chunk"]
+		self._count = sum(chunk["frames"] for chunk in self.meta["chunks"])
+		self._compressed = self.meta.get("format") == "compressed_chunks"
+		self._decoded = (None, None)  # (chunk number, frames)
+		if self._compressed:
+			self.zero_copy = False
+			self._chunks = []
+		else:
+			self._chunks = [np.load(os.path.join(self._folder, chunk["file"]), mmap_mode="r")[:chunk["frames"]]
+				for chunk in self.meta["chunks"]]
+
+	def __len__(self) -> int:
+		return self._count
+
+	@property
+	def frame_shape(self) -> tuple:
+		return tuple(self.meta["frame_shape"])
+
+	@property
+	def dtype(self) -> np.dtype:
+		return np.dtype(self.meta["dtype"])
+
+	def frame(self, index: int) -> np.ndarray:
+		number, offset = divmod(index, self._per_chunk)
+		if not self._compressed:
+			return self._chunks[number][offset]
+		decoded_number, frames = self._decoded
+		if decoded_number != number:
+			chunk = self.meta["chunks"][number]
+			with open(os.path.join(self._folder, chunk["file"]), "rb") as f:
+				frames = decompress_chunk(f.read(), self.meta["codec"], (chunk["frames"],) + self.frame_shape, self.dtype)
+			self._decoded = (number, frames)
+		return frames[offset]
+
+	def advise_sequential(self) -> None:
+		for chunk in self._chunks:
+			mapping = getattr(chunk, "_mmap", None)
+			if mapping is not None and hasattr(mapping, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+				mapping.madvise(mmap.MADV_SEQUENTIAL)
+
+	def close(self) -> None:
+		self._chunks = []
+		super().close()
+
+
+def open_stack(path: str, **raw_params) -> ImageStack:
+	"""
+	Opens a stack by file extension.
+
+	Args:
+		raw_params: Geometry of headerless files (see RawStack).
+	"""
+	ext = os.path.splitext(path)[1].lower()
+	if os.path.basename(path).lower() == "recording.json":
+		return RecordingStack(path)
+	if ext == ".npy":
+		return NpyStack(path)
+	if ext in (".tif", ".tiff"):
+		return TiffStack(path)
+	if ext in (".raw", ".bin"):
+		return RawStack(path, **raw_params)
+	raise ValueError(f"Unsupported stack format: {path}")
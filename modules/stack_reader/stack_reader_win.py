@@ -0,0 +1,240 @@
+import dearpygui.dearpygui as dpg
+from core.window_base import WindowBase
+from core.input_ouput_types import IOTypes
+from core.ui_update_queue import ui_queue
+from modules.stack_reader.image_stack import open_stack, STACK_EXTENSIONS
+import threading, os, time
+from loguru import logger
+
+class Stack_reader_win(WindowBase):
+	"""
+	Source module streaming image stacks (.npy, headerless .raw/.bin, multi-page TIFF).
+
+	Stacks are memory-mapped: frames are sent as zero-copy read-only views, any frame
+	can be shown instantly with the scrub bar, and at FPS 0 playback streams as fast as
+	the disk (and the graph) allows. Enable "Copy frames" if a downstream module writes
+	into its input frames.
+	"""
+	RAW_DTYPES = ["uint8", "uint16", "float32"]
+
+	def __init__(self,
+				label="Stack Reader",
+				win_width=320,
+				win_height=260,
+				pos=(10, 10),
+				uuid=None,
+				outputs=None,
+				visible=True,
+				path="",
+				playback_fps=30,
+				loop=False,
+				copy_frames=False,
+				raw_width=640,
+				raw_height=480,
+				raw_dtype="uint16",
+				raw_channels=1,
+				raw_offset=0):
+
+		super().__init__(label=label, pos=pos, win_width=win_width, win_height=win_height, uuid=uuid, outputs=outputs, visible=visible)
+
+		self.path = path
+		self.playback_fps = playback_fps  # 0 = as fast as possible
+		self.loop = loop
+		self.copy_frames = copy_frames
+		self.raw_width = raw_width
+		self.raw_height = raw_height
+		self.raw_dtype = raw_dtype
+		self.raw_channels = raw_channels
+		self.raw_offset = raw_offset
+		self._persistent_fields = ["label", "path", "playback_fps", "loop", "copy_frames",
+			"raw_width", "raw_height", "raw_dtype", "raw_channels", "raw_offset"]
+		self.accepted_input_types = [IOTypes.FILE_PATH, IOTypes.TRIGGER]
+
+		self.outputs = {
+			"Frame": IOTypes.FRAME,
+			"Trigger": IOTypes.TRIGGER,
+		}
+		self.connections = {k: [] for k in self.outputs}
+
+		self.winID = f"stack_reader_win_{self.UUID}"
+		self.path_tag = f"stack_reader_path_{self.UUID}"
+		self.info_tag = f"stack_reader_info_{self.UUID}"
+		self.scrub_tag = f"stack_reader_scrub_{self.UUID}"
+		self.fps_tag = f"stack_reader_fps_{self.UUID}"
+		self.stats_tag = f"stack_reader_stats_{self.UUID}"
+
+		self.stack = None
+		self.position = 0
+		self.seek_target = None
+		self.running = False
+		self.play_thread = None
+
+		with dpg.window(label=self.label, width=self.win_width, height=self.win_height,
+						pos=self.pos, tag=self.winID, show=self.visible):
+
+			dpg.add_input_text(label="Path", tag=self.path_tag, default_value=self.path, on_enter=True, width=-40,
+				callback=lambda s, a: self.open(a))
+			with dpg.group(horizontal=True):
+				dpg.add_button(label="START", callback=self.start)
+				dpg.add_button(label="STOP", callback=lambda s, a: setattr(self, "running", False))
+				dpg.add_button(label="<", callback=lambda s, a: self.show_frame(self.position - 1))
+				dpg.add_button(label=">", callback=lambda s, a: self.show_frame(self.position + 1))
+				dpg.add_input_int(label="FPS", tag=self.fps_tag, default_value=self.playback_fps, min_value=0, min_clamped=True, width=80,
+					callback=lambda s, a: setattr(self, "playback_fps", a))
+			with dpg.group(horizontal=True):
+				dpg.add_checkbox(label="Loop", default_value=self.loop, callback=lambda s, a: setattr(self, "loop", a))
+				dpg.add_checkbox(label="Copy frames", default_value=self.copy_frames, callback=lambda s, a: setattr(self, "copy_frames", a))
+			dpg.add_slider_int(label="Frame", tag=self.scrub_tag, min_value=0, max_value=0, width=-50, callback=self.scrub_cb)
+			dpg.add_text("", tag=self.info_tag)
+			dpg.add_text("", tag=self.stats_tag)
+
+			with dpg.collapsing_header(label="Raw geometry"):
+				dpg.add_input_int(label="Width", default_value=self.raw_width, min_value=1, min_clamped=True, width=100,
+					callback=lambda s, a: setattr(self, "raw_width", a))
+				dpg.add_input_int(label="Height", default_value=self.raw_height, min_value=1, min_clamped=True, width=100,
+					callback=lambda s, a: setattr(self, "raw_height", a))
+				dpg.add_combo(self.RAW_DTYPES, label="Type", default_value=self.raw_dtype, width=100,
+					callback=lambda s, a: setattr(self, "raw_dtype", a))
+				dpg.add_input_int(label="Channels", default_value=self.raw_channels, min_value=1, min_clamped=True, width=100,
+					callback=lambda s, a: setattr(self, "raw_channels", a))
+				dpg.add_input_int(label="Header bytes", default_value=self.raw_offset, min_value=0, min_clamped=True, width=100,
+					callback=lambda s, a: setattr(self, "raw_offset", a))
+				dpg.add_button(label="Reopen", callback=lambda s, a: self.open(self.path))
+
+		if self.path:
+			self.open(self.path)
+
+	def open(self, path):
+		"""Opens a stack file and shows its first frame."""
+		self.running = False
+		if self.play_thread is not None:
+			self.play_thread.join(timeout=1)
+		if self.stack is not None:
+			self.stack.close()
+			self.stack = None
+
+		self.path = path
+		dpg.set_value(self.path_tag, path)
+		try:
+			self.stack = open_stack(path, width=self.raw_width, height=self.raw_height, dtype=self.raw_dtype,
+				channels=self.raw_channels, offset=self.raw_offset)
+		except Exception as e:
+			logger.warning(f"{self.winID} Could not open {path}: {e}")
+			dpg.set_value(self.info_tag, f"Could not open: {e}")
+			return
+
+		dpg.configure_item(self.scrub_tag, max_value=max(0, len(self.stack) - 1))
+		dpg.set_value(self.info_tag, f"{len(self.stack)} frames {'x'.join(map(str, self.stack.frame_shape))} {self.stack.dtype}"
+			f"{'' if self.stack.zero_copy else ' (decoded per page)'}")
+		self.show_frame(0)
+
+	def show_frame(self, index):
+		"""Sends one frame (stopped) or seeks (playing)."""
+		if self.stack is None:
+			return
+		index = min(max(0, index), len(self.stack) - 1)
+		if self.running:
+			self.seek_target = index
+			return
+		self.position = index
+		dpg.set_value(self.scrub_tag, index)
+		self.frame_cb(self.read(index))
+
+	def scrub_cb(self, sender, app_data):
+		self.show_frame(app_data)
+
+	def read(self, index):
+		frame = self.stack.frame(index)
+		return frame.copy() if self.copy_frames else frame
+
+	def start(self, sender=None, app_data=None):
+		if self.stack is None:
+			logger.warning(f"{self.winID} No stack opened.")
+			return
+		if self.play_thread is not None and self.play_thread.is_alive():
+			return
+		if self.position >= len(self.stack) - 1:
+			self.position = 0
+		self.running = True
+		self.trigger_cb(event="START")
+		self.play_thread = threading.Thread(target=self.play_loop, daemon=True)
+		self.play_thread.start()
+
+	def play_loop(self):
+		"""Streams frames from the current position, paced at playback_fps (0 = disk bandwidth)."""
+		self.stack.advise_sequential()
+		next_frame_time = time.perf_counter()
+		last_stats = time.perf_counter()
+		sent_bytes, sent_frames = 0, 0
+		index = self.position
+
+		while self.running:
+			if self.seek_target is not None:
+				index, self.seek_target = self.seek_target, None
+			if index >= len(self.stack):
+				if not self.loop:
+					break
+				index = 0
+
+			if not self.is_outputs_ready():
+				time.sleep(0.001)
+				continue
+
+			if self.playback_fps > 0:
+				now = time.perf_counter()
+				if now < next_frame_time:
+					time.sleep(next_frame_time - now)
+					continue
+				next_frame_time = max(next_frame_time + 1.0 / self.playback_fps, time.perf_counter())
+
+			frame = self.read(index)
+			self.frame_cb(frame)
+			self.position = index
+			index += 1
+
+			sent_bytes += frame.nbytes
+			sent_frames += 1
+			now = time.perf_counter()
+			if now - last_stats >= 0.5:
+				ui_queue.set_value(self.scrub_tag, self.position)
+				ui_queue.set_value(self.stats_tag, f"{sent_frames / (now - last_stats):.1f} fps | {sent_bytes / (now - last_stats) / 2**20:.0f} MB/s")
+				sent_bytes, sent_frames, last_stats = 0, 0, now
+
+		ui_queue.set_value(self.scrub_tag, self.position)
+		self.running = False
+		self.trigger_cb(event="STOP")
+
+	def input_cb(self, *args, **kwargs):
+		data = kwargs.get("data") or (args[0] if args else None)
+		if isinstance(data, str) and os.path.isfile(data) and data.lower().endswith(STACK_EXTENSIONS):
+			self.open(data)
+		elif data == "START":
+			self.start()
+		elif data == "STOP":
+			self.running = False
+
+	def frame_cb(self, frame):
+		for idx, output_key in enumerate(self.outputs):
+			connected_modules = self.connections.get(output_key, [])
+			for module in connected_modules:
+				if idx == 0:
+					module.input_cb(data=frame, source=self.UUID)
+
+	def trigger_cb(self, event=None):
+		for idx, output_key in enumerate(self.outputs):
+			connected_modules = self.connections.get(output_key, [])
+			for module in connected_modules:
+				if idx == 1:
+					module.input_cb(event)
+
+	def close(self):
+		"""Stops streaming and unmaps the stack before closing the window."""
+		self.running = False
+		if self.play_thread is not None:
+			self.play_thread.join(timeout=1)
+		if self.stack is not None:
+			self.stack.close()
+		super().close()
+
+EXPORTED_CLASS = Stack_reader_win
+EXPORTED_NAME = "Stack Reader"
@@ -0,0 +1,92 @@
+import threading
+from collections import OrderedDict
+from typing import Optional
+import numpy as np
+import cv2
+
+
+class FrameCache:
+	"""
+	Memory-bounded LRU cache of decoded frames, keyed by (file path, frame number).
+
+	Stepping back and forth over the same frames then costs a dictionary lookup
+	instead of a seek and a decode. Frames are stored by reference (no copy) unless
+	`gray` is set, in which case color frames are converted to 8-bit grayscale,
+	fitting three times more frames in the same budget.
+	"""
+
+	def __init__(self, max_bytes: int = 512 * 2**20, gray: bool = False):
+		"""
+		Args:
+			max_bytes: Memory budget of the cached frames.
+			gray: Store frames as grayscale (returned frames are then grayscale too).
+		"""
+		self.max_bytes = max_bytes
+		self.gray = gray
+		self._frames: OrderedDict = OrderedDict()
+		self._lock = threading.Lock()
+		self.nbytes = 0
+		self.hits = 0
+		self.misses = 0
+
+	def get(self, path: str, frame_no: int) -> Optional[np.ndarray]:
+		"""Returns the cached frame, or None."""
+		key = (path, frame_no)
+		with self._lock:
+			frame = self._frames.get(key)
+			if frame is None:
+				self.misses += 1
+				return None
+			self._frames.move_to_end(key)
+			self.hits += 1
+			return frame
+
+	def put(self, path: str, frame_no: int, frame: np.ndarray) -> np.ndarray:
+		"""
+		Caches a frame, evicting the least recently used ones beyond the budget.
+
+		Returns:
+			The frame as stored (grayscale in gray mode).
+		"""
+		if self.gray and frame.ndim == 3:
+			frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+		if frame.nbytes > self.max_bytes:
+			return frame
+
+		key = (path, frame_no)
+		with self._lock:
+			previous = self._frames.pop(key, None)
+			if previous is not None:
+				self.nbytes -= previous.nbytes
+			self._frames[key] = frame
+			self.nbytes += frame.nbytes
+			while self.nbytes > self.max_bytes:
+				_, evicted = self._frames.popitem(last=False)
+				self.nbytes -= evicted.nbytes
+		return frame
+
+	def configure(self, max_bytes: Optional[int] = None, gray: Optional[bool] = None) -> None:
+		"""Changes the budget or storage mode. Switching mode drops the cached frames."""
+		if gray is not None and gray != self.gray:
+			self.gray = gray
+			self.clear()
+		if max_bytes is not None:
+			with self._lock:
+				self.max_bytes = max_bytes
+				while self.nbytes > self.max_bytes and self._frames:
+					_, evicted = self._frames.popitem(last=False)
+					self.nbytes -= evicted.nbytes
+
+	def clear(self) -> None:
+		with self._lock:
+			self._frames.clear()
+			self.nbytes = 0
+
+	def get_stats(self) -> dict:
+		"""Returns the number of cached frames, their size (MB) and the hit rate."""
+		lookups = self.hits + self.misses
+		return {
+			"frames": len(self._frames),
+			"mb": self.nbytes / 2**20,
+			"hit_rate": self.hits / lookups if lookups else 0.0,
+		}
@@ -0,0 +1,117 @@
+import os
+from typing import Optional
+import numpy as np
+import cv2
+from loguru import logger
+
+
+class FrameIndex:
+	"""
+	Per-file frame index: frame count, per-frame timestamps and keyframe positions.
+
+	The index is built once by walking the file packet by packet (raw stream mode,
+	no decoding when the backend supports it) and cached next to the video as
+	`<video>.idx.npz`. It lets the reader seek to any frame by jumping to the closest
+	preceding keyframe and decoding forward only from there.
+	"""
+
+	VERSION = 1
+
+	def __init__(self, path: str, frame_count: int = 0, fps: float = 0.0,
+				keyframes: Optional[np.ndarray] = None, timestamps: Optional[np.ndarray] = None, exact: bool = False):
+		"""
+		Args:
+			path: Video file path.
+			frame_count: Number of frames in the file.
+			fps: Nominal frame rate.
+			keyframes: Sorted frame numbers of the keyframes.
+			timestamps: Presentation time of every frame, in milliseconds.
+			exact: True if keyframes were read from the stream, False if unknown (only frame 0 listed).
+		"""
+		self.path = path
+		self.frame_count = frame_count
+		self.fps = fps
+		self.keyframes = np.asarray(keyframes if keyframes is not None else [0], dtype=np.int64)
+		self.timestamps = np.asarray(timestamps if timestamps is not None else [], dtype=np.float64)
+		self.exact = exact
+
+	@staticmethod
+	def cache_path(path: str) -> str:
+		return f"{path}.idx.npz"
+
+	@staticmethod
+	def _file_signature(path: str) -> np.ndarray:
+		stat = os.stat(path)
+		return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+	@classmethod
+	def load(cls, path: str) -> Optional["FrameIndex"]:
+		"""Loads the cached index, or returns None if missing or outdated."""
+		cache = cls.cache_path(path)
+		if not os.path.exists(cache):
+			return None
+		try:
+			with np.load(cache) as data:
+				if int(data["version"]) != cls.VERSION or not np.array_equal(data["signature"], cls._file_signature(path)):
+					return None
+				return cls(path, int(data["frame_count"]), float(data["fps"]), data["keyframes"], data["timestamps"], bool(data["exact"]))
+		except Exception as e:
+			logger.warning(f"Invalid frame index {cache}: {e}")
+			return None
+
+	def save(self) -> None:
+		"""Writes the index next to the video (silently skipped on read-only folders)."""
+		try:
+			np.savez(self.cache_path(self.path), version=self.VERSION, signature=self._file_signature(self.path),
+				frame_count=self.frame_count, fps=self.fps, keyframes=self.keyframes, timestamps=self.timestamps, exact=self.exact)
+		except OSError as e:
+			logger.warning(f"Could not cache frame index of {self.path}: {e}")
+
+	@classmethod
+	def build(cls, path: str) -> "FrameIndex":
+		"""Walks the whole file once, reading packets without decoding when supported."""
+		capture = cv2.VideoCapture(path, cv2.CAP_FFMPEG)
+		fps = capture.get(cv2.CAP_PROP_FPS)
+		raw = capture.set(cv2.CAP_PROP_FORMAT, -1)
+		key_prop = getattr(cv2, "CAP_PROP_LRF_HAS_KEY_FRAME", None) if raw else None
+
+		keyframes, timestamps = [], []
+		while capture.grab():
+			if key_prop is not None and capture.get(key_prop):
+				keyframes.append(len(timestamps))
+			timestamps.append(capture.get(cv2.CAP_PROP_POS_MSEC))
+		capture.release()
+
+		exact = bool(keyframes)
+		return cls(path, len(timestamps), fps, keyframes if exact else [0], timestamps, exact)
+
+	@classmethod
+	def load_or_build(cls, path: str) -> "FrameIndex":
+		"""Returns the cached index, building and caching it if needed."""
+		index = cls.load(path)
+		if index is None:
+			index = cls.build(path)
+			index.save()
+		return index
+
+	def keyframe_before(self, frame_no: int) -> Optional[int]:
+		"""
+		Returns the last keyframe at or before `frame_no`,
+		or None when keyframes are unknown (the backend then seeks on its own).
+		"""
+		if not self.exact:
+			return None
+		i = np.searchsorted(self.keyframes, frame_no, side="right") - 1
+		return int(self.keyframes[max(0, i)])
+
+	def time_of(self, frame_no: int) -> float:
+		"""Returns the timestamp (ms) of a frame."""
+		if len(self.timestamps):
+			return float(self.timestamps[min(max(0, frame_no), len(self.timestamps) - 1)])
+		return frame_no * 1000.0 / self.fps if self.fps else 0.0
+
+	def frame_at(self, time_ms: float) -> int:
+		"""Returns the frame displayed at a given time (ms)."""
+		if len(self.timestamps):
+			return int(np.clip(np.searchsorted(self.timestamps, time_ms, side="right") - 1, 0, len(self.timestamps) - 1))
+		return int(time_ms * self.fps / 1000.0)
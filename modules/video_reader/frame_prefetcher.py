@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+class FramePrefetcher:
+	"""
+	Decoder stage running ahead of playback.
+
+	A background thread calls `read_func` (e.g. `cv2.VideoCapture.read`) and stores the
+	decoded frames into a bounded ring. Playback only pops frames on schedule, so decode
+	time spikes (keyframes, high-bitrate segments) are absorbed by the ring instead of
+	delaying frame dispatch. The decoder waits while the ring is full.
+	"""
+
+	def __init__(self, read_func: Callable[[], tuple], capacity: int = 8, smoothing_window: int = 60):
+		"""
+		Args:
+			read_func: Returns (ret, frame) like cv2.VideoCapture.read.
+			capacity: Maximum number of decoded frames kept ahead of playback.
+			smoothing_window: Number of samples averaged in the stats.
+		"""
+		self._read = read_func
+		self.capacity = max(1, capacity)
+		self._ring = deque()
+		self._cond = threading.Condition()
+		self._running = False
+		self._eof = False
+		self._thread: Optional[threading.Thread] = None
+
+		self.decoded = 0
+		self.underruns = 0
+		self._decode_times = deque(maxlen=smoothing_window)
+
+	def start(self) -> None:
+		"""Starts decoding ahead in a background thread."""
+		self._running = True
+		self._eof = False
+		self._thread = threading.Thread(target=self._decode_loop, daemon=True)
+		self._thread.start()
+
+	def stop(self) -> None:
+		"""
+		Stops the decoder thread and drops the buffered frames.
+		Waits for a read in progress to finish (no timeout), so the caller can seek or reuse
+		the capture, and its position state, as soon as this returns.
+		"""
+		with self._cond:
+			self._running = False
+			self._ring.clear()
+			self._cond.notify_all()
+		if self._thread is not None and self._thread is not threading.current_thread():
+			self._thread.join()
+		self._thread = None
+
+	def pop(self, timeout: Optional[float] = None):
+		"""
+		Takes the next decoded frame.
+
+		Returns:
+			(True, frame), (False, None) once the video is exhausted, or None on timeout (decoder late).
+		"""
+		with self._cond:
+			if not self._ring and not self._eof:
+				self.underruns += 1
+			if not self._cond.wait_for(lambda: self._ring or self._eof or not self._running, timeout):
+				return None
+			if self._ring:
+				frame = self._ring.popleft()
+				self._cond.notify_all()
+				return True, frame
+			return False, None
+
+	def buffered(self) -> int:
+		"""Returns the number of decoded frames waiting."""
+		return len(self._ring)
+
+	def get_stats(self) -> dict:
+		"""Returns the average decode time (ms), ring fill and underrun count."""
+		times = list(self._decode_times)
+		return {
+			"decode_ms": sum(times) / len(times) * 1000 if times else 0.0,
+			"buffered": len(self._ring),
+			"capacity": self.capacity,
+			"underruns": self.underruns,
+			"decoded": self.decoded,
+		}
+
+	def _decode_loop(self) -> None:
+		while True:
+			with self._cond:
+				self._cond.wait_for(lambda: len(self._ring) < self.capacity or not self._running)
+				if not self._running:
+					return
+
+			start = time.perf_counter()
+			ret, frame = self._read()
+			self._decode_times.append(time.perf_counter() - start)
+
+			with self._cond:
+				if not self._running:
+					return
+				if not ret or frame is None:
+					self._eof = True
+					self._cond.notify_all()
+					return
+				self._ring.append(frame)
+				self.decoded += 1
+				self._cond.notify_all()
@@ -0,0 +1,152 @@
+import os
+import json
+import queue
+import hashlib
+import threading
+from typing import Callable, Optional
+import numpy as np
+import cv2
+from loguru import logger
+
+
+class MediaInfoCache:
+	"""
+	Background extractor of video metadata (duration, resolution, FPS, codec) and thumbnails.
+
+	Results are cached in memory and on disk (`<cache_dir>/<hash>.json` + `.jpg`), keyed by
+	the file path and validated against its size and modification time, so a folder is only
+	probed once. Extraction runs in worker threads: callers queue files with `request` and
+	get the info through a callback as it becomes available.
+	"""
+
+	def __init__(self, cache_dir: str = "cache/media_info", thumb_size=(160, 90), workers: int = 2):
+		"""
+		Args:
+			cache_dir: Folder of the persistent cache.
+			thumb_size: (width, height) of the letterboxed thumbnails.
+			workers: Number of extraction threads.
+		"""
+		self.cache_dir = cache_dir
+		self.thumb_size = thumb_size
+		self._memory = {}
+		self._lock = threading.Lock()
+		self._queue: queue.Queue = queue.Queue()
+		self._generation = 0
+		self._workers = [threading.Thread(target=self._worker, daemon=True) for _ in range(max(1, workers))]
+		for worker in self._workers:
+			worker.start()
+
+	def request(self, path: str, callback: Callable[[str, dict], None]) -> None:
+		"""Queues a file; `callback(path, info)` is called from a worker thread once known."""
+		self._queue.put((self._generation, path, callback))
+
+	def cancel(self) -> None:
+		"""Drops the pending requests (e.g. when another folder is opened)."""
+		self._generation += 1
+
+	def close(self) -> None:
+		"""Drops the pending requests and stops the workers."""
+		self.cancel()
+		for _ in self._workers:
+			self._queue.put(None)
+
+	def peek(self, path: str) -> Optional[dict]:
+		"""Returns the info already in memory, without any file access."""
+		with self._lock:
+			return self._memory.get(path)
+
+	def get(self, path: str) -> Optional[dict]:
+		"""Returns the info of a file, from memory, disk or by probing the file (blocking)."""
+		try:
+			stat = os.stat(path)
+		except OSError:
+			return None
+		signature = (stat.st_size, stat.st_mtime_ns)
+
+		with self._lock:
+			info = self._memory.get(path)
+		if info is None or (info["size"], info["mtime_ns"]) != signature:
+			info = self._load(path, signature)
+			if info is None:
+				info = self._extract(path, signature)
+				self._save(info)
+			with self._lock:
+				self._memory[path] = info
+		return info
+
+	def _entry_path(self, path: str) -> str:
+		return os.path.join(self.cache_dir, hashlib.sha1(os.path.abspath(path).encode()).hexdigest())
+
+	def _load(self, path: str, signature) -> Optional[dict]:
+		entry = self._entry_path(path)
+		try:
+			with open(entry + ".json") as f:
+				info = json.load(f)
+		except (OSError, ValueError):
+			return None
+		if (info.get("size"), info.get("mtime_ns")) != signature:
+			return None
+		info["thumbnail"] = cv2.imread(entry + ".jpg") if os.path.exists(entry + ".jpg") else None
+		return info
+
+	def _save(self, info: dict) -> None:
+		entry = self._entry_path(info["path"])
+		try:
+			os.makedirs(self.cache_dir, exist_ok=True)
+			if info["thumbnail"] is not None:
+				cv2.imwrite(entry + ".jpg", info["thumbnail"])
+			with open(entry + ".json", "w") as f:
+				json.dump({k: v for k, v in info.items() if k != "thumbnail"}, f)
+		except OSError as e:
+			logger.warning(f"Could not cache media info of {info['path']}: {e}")
+
+	def _extract(self, path: str, signature) -> dict:
+		"""Probes the file: container properties and a letterboxed thumbnail of the first frame."""
+		capture = cv2.VideoCapture(path, cv2.CAP_FFMPEG)
+		fps = capture.get(cv2.CAP_PROP_FPS)
+		frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+		fourcc = int(capture.get(cv2.CAP_PROP_FOURCC))
+		info = {
+			"path": path,
+			"size": signature[0],
+			"mtime_ns": signature[1],
+			"width": int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+			"height": int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+			"fps": fps,
+			"frame_count": frame_count,
+			"duration": frame_count / fps if fps else 0.0,
+			"codec": "".join(chr((fourcc >> 8 * i) & 0xFF) for i in range(4)).strip("\x00 "),
+		}
+		ret, frame = capture.read()
+		capture.release()
+		info["thumbnail"] = self._make_thumbnail(frame) if ret else None
+		return info
+
+	def _make_thumbnail(self, frame: np.ndarray) -> np.ndarray:
+		tw, th = self.thumb_size
+		h, w = frame.shape[:2]
+		scale = min(tw / w, th / h)
+		nw, nh = max(1, int(w * scale)), max(1, int(h * scale))
+		thumbnail = np.zeros((th, tw, 3), dtype=np.uint8)
+		small = cv2.resize(frame, (nw, nh), interpolation=cv2.INTER_AREA)
+		if small.ndim == 2:
+			small = cv2.cvtColor(small, cv2.COLOR_GRAY2BGR)
+		y, x = (th - nh) // 2, (tw - nw) // 2
+		thumbnail[y:y + nh, x:x + nw] = small[..., :3]
+		return thumbnail
+
+	def _worker(self) -> None:
+		while True:
+			job = self._queue.get()
+			if job is None:
+				return
+			generation, path, callback = job
+			if generation != self._generation:
+				continue
+			try:
+				info = self.get(path)
+			except Exception as e:
+				logger.warning(f"Could not probe {path}: {e}")
+				continue
+			if info is not None and generation == self._generation:
+				callback(path, info)
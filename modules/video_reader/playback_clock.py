@@ -0,0 +1,57 @@
+import time
+
+LATE_POLICIES = ["Show all", "Drop late", "Skip ahead"]
+
+
+class PlaybackClock:
+	"""
+	Maps media timestamps (container PTS, in ms) to wall-clock presentation times.
+
+	The clock is anchored on a (wall time, media time) pair; a frame is due at
+	`anchor_wall + (pts - anchor_media) / speed`. Variable frame rate files therefore
+	play at their true speed, and changing the speed re-anchors on the current media
+	time so playback does not jump. A speed of 0 means "as fast as possible".
+	"""
+
+	def __init__(self, speed: float = 1.0, late_tolerance: float = 0.05):
+		"""
+		Args:
+			speed: Playback speed multiplier, 0 for as fast as possible.
+			late_tolerance: Seconds after its due time before a frame counts as late.
+		"""
+		self.speed = speed
+		self.late_tolerance = late_tolerance
+		self._anchor_wall = time.perf_counter()
+		self._anchor_media = 0.0
+
+	def start(self, media_ms: float) -> None:
+		"""Anchors the clock: `media_ms` is due now."""
+		self._anchor_wall = time.perf_counter()
+		self._anchor_media = media_ms
+
+	def media_time(self) -> float:
+		"""Returns the media time (ms) due now."""
+		if self.speed <= 0:
+			return self._anchor_media
+		return self._anchor_media + (time.perf_counter() - self._anchor_wall) * 1000.0 * self.speed
+
+	def set_speed(self, speed: float) -> None:
+		"""Changes the speed without jumping in media time."""
+		if self.speed > 0:
+			self._anchor_media = self.media_time()
+		self._anchor_wall = time.perf_counter()
+		self.speed = speed
+
+	def due(self, media_ms: float) -> float:
+		"""Returns the wall time (perf_counter) at which a frame with this timestamp is due."""
+		if self.speed <= 0:
+			self.start(media_ms)  # As fast as possible: the clock follows the frames
+			return self._anchor_wall
+		return self._anchor_wall + (media_ms - self._anchor_media) / 1000.0 / self.speed
+
+	def lateness(self, media_ms: float) -> float:
+		"""Returns how late (s, positive) or early (negative) a frame is."""
+		return time.perf_counter() - self.due(media_ms)
+
+	def is_late(self, media_ms: float) -> bool:
+		return self.speed > 0 and self.lateness(media_ms) > self.late_tolerance
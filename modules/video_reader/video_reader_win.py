@@ -1,12 +1,30 @@
 import dearpygui.dearpygui as dpg
 from core.window_base import WindowBase
 from core.input_ouput_types import IOTypes
-from modules.video_reader.video_tools import video
-from modules.video_reader.folder_tools import folder_tools
-import threading, os, time
+from modules.video_reader.video_tools import Video_tools, Process_video_tools
+from tools.folder_index.folder_index import FolderIndex
+from modules.video_reader.frame_prefetcher import FramePrefetcher
+from modules.video_reader.frame_index import FrameIndex
+from modules.video_reader.frame_cache import FrameCache
+from modules.video_reader.media_info import MediaInfoCache
+from modules.video_reader.playback_clock import PlaybackClock, LATE_POLICIES
+from core.ui_update_queue import ui_queue
+from collections import deque
+import threading, os, time, math
+import numpy as np
+import cv2
 from loguru import logger
 
 class VideoReader_win(WindowBase):
+	MAX_BACKFILL = 300  # Frames decoded into the cache when stepping backward from a keyframe
+	INFO_COLUMNS = ["Duration", "Resolution", "FPS", "Codec"]
+	OUTPUT_SCALES = {"Full": 1, "Half": 2, "Quarter": 4}
+	SPEEDS = {"0.25x": 0.25, "0.5x": 0.5, "1x": 1.0, "2x": 2.0, "4x": 4.0, "8x": 8.0, "16x": 16.0, "Max": 0.0}
+	VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv")
+	SKIP_AHEAD_LATENESS = 0.5  # Seconds behind the clock before "Skip ahead" seeks forward
+	MAX_DROP_LATENESS = 0.5  # Seconds behind the clock before "Drop late" shows a frame anyway and re-anchors
+	MAX_DROPS_IN_ROW = 10  # Consecutive frames "Drop late" may drop before showing one and re-anchoring
+
 	def __init__(self,
 				label="Video Reader",
 				win_width=300,
@@ -14,11 +32,41 @@ class VideoReader_win(WindowBase):
 				pos=(10, 10),
 				uuid=None,
 				outputs=None,
-				visible=True):
+				visible=True,
+				prefetch_frames=8,
+				decode_in_process=False,
+				cache_mb=512,
+				cache_gray=False,
+				frame_step=1,
+				max_output_fps=0.0,
+				range_start=0.0,
+				range_end=0.0,
+				output_gray=False,
+				output_scale=1,
+				roi=(0, 0, 0, 0),
+				decode_threads=0,
+				playback_speed=1.0,
+				late_policy="Drop late"):
 
 		super().__init__(label=label,pos=pos,win_width=win_width,win_height=win_height,uuid=uuid,outputs=outputs,visible=visible)
 
-		self._persistent_fields = ["label"]
+		self.prefetch_frames = prefetch_frames
+		self.decode_in_process = decode_in_process
+		self.cache_mb = cache_mb
+		self.cache_gray = cache_gray
+		self.frame_step = frame_step          # Dispatch every Nth frame
+		self.max_output_fps = max_output_fps  # Cap in video time (0 = off), e.g. 3 fps out of a 30 fps video
+		self.range_start = range_start        # Seconds
+		self.range_end = range_end            # Seconds, 0 = until the end
+		self.output_gray = output_gray
+		self.output_scale = output_scale    # 1, 2 or 4
+		self.roi = list(roi)                # (x, y, w, h) in source pixels, w or h = 0 disables the crop
+		self.decode_threads = decode_threads
+		self.playback_speed = playback_speed  # 0 = as fast as possible
+		self.late_policy = late_policy
+		self._persistent_fields = ["label", "prefetch_frames", "decode_in_process", "cache_mb", "cache_gray",
+			"frame_step", "max_output_fps", "range_start", "range_end", "output_gray", "output_scale", "roi", "decode_threads",
+			"playback_speed", "late_policy"]
 		self.accepted_input_types = [IOTypes.FOLDER_PATH, IOTypes.FILE_PATH]
 
 		self.outputs = {
@@ -30,26 +78,76 @@ class VideoReader_win(WindowBase):
 		self.winID = f"video_reader_win_{self.UUID}"
 		self.table_tag = f"video_reader_table_{self.UUID}"
 		self.child_win_table_tag = f"video_reader_child_table_{self.UUID}"
-		self.fps_tag = f"video_reader_fps_{self.UUID}"
+		self.speed_tag = f"video_reader_speed_{self.UUID}"
+		self.late_policy_tag = f"video_reader_late_policy_{self.UUID}"
 		self.start_tag = f"video_reader_start_{self.UUID}"
 		self.stop_tag = f"video_reader_stop_{self.UUID}"
 		self.video_group_tag = f"video_reader_group_{self.UUID}"
+		self.stats_tag = f"video_reader_stats_{self.UUID}"
+		self.process_tag = f"video_reader_process_{self.UUID}"
+		self.scrub_tag = f"video_reader_scrub_{self.UUID}"
+		self.position_tag = f"video_reader_position_{self.UUID}"
+		self.cache_mb_tag = f"video_reader_cache_mb_{self.UUID}"
+		self.cache_gray_tag = f"video_reader_cache_gray_{self.UUID}"
+		self.cache_stats_tag = f"video_reader_cache_stats_{self.UUID}"
+		self.thumb_registry_tag = f"video_reader_thumb_registry_{self.UUID}"
+		self.thumb_texture_tag = f"video_reader_thumb_texture_{self.UUID}"
+		self.thumb_image_tag = f"video_reader_thumb_image_{self.UUID}"
+		self.hover_handler_tag = f"video_reader_hover_handler_{self.UUID}"
+		self.frame_step_tag = f"video_reader_frame_step_{self.UUID}"
+		self.max_output_fps_tag = f"video_reader_max_output_fps_{self.UUID}"
+		self.range_start_tag = f"video_reader_range_start_{self.UUID}"
+		self.range_end_tag = f"video_reader_range_end_{self.UUID}"
+		self.output_gray_tag = f"video_reader_output_gray_{self.UUID}"
+		self.output_scale_tag = f"video_reader_output_scale_{self.UUID}"
+		self.roi_tag = f"video_reader_roi_{self.UUID}"
+		self.threads_tag = f"video_reader_threads_{self.UUID}"
 
 		self.last_selectable = None
 		self.last_video_selected = None
 		self.enabled = False
 		self.folder = ""
+		self.folder_index = None  # FolderIndex of self.folder, rescanned incrementally
 
 		self.currentvid = 0
 		self.video_running = False
 		self.video_thread = None
+		self.prefetcher = None
+		self.video = None  # Decoder owned by this reader, created on START
+		self._dispatch_times = deque(maxlen=60)
+
+		self.position = 0         # Number of the next frame to play
+		self.seek_target = None   # Frame requested with the scrub bar while playing
+		self.frame_index = None   # FrameIndex of the selected video, once loaded
+		self.index_thread = None
+		self.preview = Video_tools()  # Decoder for the selected video while stopped (first frame, scrubbing)
+		self.preview_request = None   # (path, frame_no) waiting to be shown
+		self.preview_thread = None
+		self.preview_lock = threading.Lock()
+		self.frame_cache = FrameCache(max_bytes=self.cache_mb * 2**20, gray=self.cache_gray)
+		self.playing_path = None
+		self.source_fps = 0.0
+		self.end_frame = None     # Exclusive end of the playback range
+		self.decode_position = 0  # Next frame the playback decoder returns
+		self.decode_skip = 0      # Frames grabbed without retrieval before the next kept one
+		self.media_info = MediaInfoCache()
+		self.row_of = {}  # path -> table row, for the lazily filled info columns
+		self.thumb_shown = None
+		self.thumb_buffer = np.zeros((self.media_info.thumb_size[1], self.media_info.thumb_size[0], 3), dtype=np.float32)
 
 		self.path_index = 0
-		self.video_keys = []  # ordered list of video base names
-		self.videos = {}      # dict: base_name -> {path, data}
+		self.video_keys = []  # ordered list of video file names, extension included (e.g. "run1.mp4")
+		self.videos = {}      # dict: file_name -> {path, data}
+
+		self.clock = PlaybackClock(speed=self.playback_speed)
+		self.dropped = 0
+
+		with dpg.texture_registry(tag=self.thumb_registry_tag, show=False):
+			dpg.add_raw_texture(self.thumb_buffer.shape[1], self.thumb_buffer.shape[0], default_value=self.thumb_buffer.ravel(),
+				format=dpg.mvFormat_Float_rgb, tag=self.thumb_texture_tag)
 
-		self.playback_fps = 30  # default value
-		self.frame_interval = 1.0 / self.playback_fps
+		with dpg.item_handler_registry(tag=self.hover_handler_tag):
+			dpg.add_item_hover_handler(callback=self.on_row_hover)
 
 		with dpg.window(label=self.label,
 						width=self.win_width,
@@ -61,7 +159,42 @@ class VideoReader_win(WindowBase):
 			with dpg.group(horizontal=True):
 				dpg.add_button(label="START", tag=self.start_tag, callback=self.start_video)
 				dpg.add_button(label="STOP", tag=self.stop_tag, callback=lambda s, a: setattr(self, "video_running", False))
-				dpg.add_input_int(label="FPS", tag=self.fps_tag, default_value=30, min_value=1, min_clamped=True, width=-1, callback=self.set_playback_fps)
+				dpg.add_button(label="<", callback=lambda s, a: self.step(-1))
+				dpg.add_button(label=">", callback=lambda s, a: self.step(1))
+				speed_names = {v: k for k, v in self.SPEEDS.items()}
+				dpg.add_combo(list(self.SPEEDS), label="Speed", tag=self.speed_tag, default_value=speed_names.get(self.playback_speed, "1x"),
+					width=70, callback=self.set_playback_speed)
+				dpg.add_combo(LATE_POLICIES, tag=self.late_policy_tag, default_value=self.late_policy, width=-1,
+					callback=lambda s, a: setattr(self, "late_policy", a))
+			dpg.add_checkbox(label="Decode in separate process", tag=self.process_tag, default_value=self.decode_in_process,
+				callback=lambda s, a: setattr(self, "decode_in_process", a))
+			with dpg.group(horizontal=True):
+				dpg.add_input_int(label="Every N", tag=self.frame_step_tag, default_value=self.frame_step, min_value=1, min_clamped=True, width=80,
+					callback=lambda s, a: setattr(self, "frame_step", a))
+				dpg.add_input_float(label="Max FPS", tag=self.max_output_fps_tag, default_value=self.max_output_fps, min_value=0, min_clamped=True,
+					width=80, step=0, format="%.1f", callback=lambda s, a: setattr(self, "max_output_fps", a))
+			with dpg.group(horizontal=True):
+				dpg.add_input_float(label="From (s)", tag=self.range_start_tag, default_value=self.range_start, min_value=0, min_clamped=True,
+					width=80, step=0, format="%.2f", callback=lambda s, a: setattr(self, "range_start", a))
+				dpg.add_input_float(label="To (s)", tag=self.range_end_tag, default_value=self.range_end, min_value=0, min_clamped=True,
+					width=80, step=0, format="%.2f", callback=lambda s, a: setattr(self, "range_end", a))
+			with dpg.group(horizontal=True):
+				dpg.add_checkbox(label="Gray output", tag=self.output_gray_tag, default_value=self.output_gray, callback=self.set_output_options)
+				scale_names = {v: k for k, v in self.OUTPUT_SCALES.items()}
+				dpg.add_combo(list(self.OUTPUT_SCALES), label="Size", tag=self.output_scale_tag, default_value=scale_names.get(self.output_scale, "Full"),
+					width=80, callback=self.set_output_options)
+				dpg.add_input_int(label="Threads", tag=self.threads_tag, default_value=self.decode_threads, min_value=0, min_clamped=True, width=80,
+					callback=self.set_output_options)
+			dpg.add_input_intx(label="ROI (x, y, w, h)", tag=self.roi_tag, size=4, default_value=self.roi, width=200, callback=self.set_output_options)
+			dpg.add_slider_int(label="Frame", tag=self.scrub_tag, min_value=0, max_value=0, width=-50, callback=self.scrub_cb)
+			dpg.add_text("", tag=self.position_tag)
+			dpg.add_text("", tag=self.stats_tag)
+			with dpg.group(horizontal=True):
+				dpg.add_input_int(label="Cache (MB)", tag=self.cache_mb_tag, default_value=self.cache_mb, min_value=0, min_clamped=True, width=100,
+					callback=self.set_cache_options)
+				dpg.add_checkbox(label="Gray", tag=self.cache_gray_tag, default_value=self.cache_gray, callback=self.set_cache_options)
+				dpg.add_text("", tag=self.cache_stats_tag)
+			dpg.add_image(self.thumb_texture_tag, tag=self.thumb_image_tag)
 
 			with dpg.group(tag=self.video_group_tag):
 				with dpg.child_window(tag=self.child_win_table_tag):
@@ -69,12 +202,21 @@ class VideoReader_win(WindowBase):
 						dpg.add_table_column(label="Filename")
 
 	def update_file_list(self, path):
+		if self.folder_index is None or self.folder_index.folder != path:
+			self.folder_index = FolderIndex(path, self.VIDEO_EXTENSIONS)
+		added, changed, removed = self.folder_index.scan()
+		if self.videos and not (added or changed or removed):
+			return  # Same folder, nothing new: keep the table and the selection
+
 		self.last_selectable = None
 		self.last_video_selected = None
 
-		filepaths, filenames = folder_tools.list_files(path, file_extension="mp4", sort_by="name")
+		filepaths = self.folder_index.files(sort_by="name")
+		filenames = [os.path.basename(fp) for fp in filepaths]  # With extension: several video types can share a name
 		self.videos = {name: {"path": fp} for name, fp in zip(filenames, filepaths)}
 		self.video_keys = list(self.videos.keys())
+		self.row_of = {fp: i for i, fp in enumerate(filepaths)}
+		self.media_info.cancel()
 
 		dpg.delete_item(self.child_win_table_tag)
 
@@ -86,13 +228,56 @@ class VideoReader_win(WindowBase):
 						row_background=True, policy=dpg.mvTable_SizingStretchProp):
 
 				dpg.add_table_column(label="Name")
+				for column in self.INFO_COLUMNS:
+					dpg.add_table_column(label=column)
 
 				for i, name in enumerate(self.video_keys):
 					with dpg.table_row():
-						dpg.add_selectable(label=name, callback=self.on_row_click, user_data=i)
+						selectable = dpg.add_selectable(label=name, callback=self.on_row_click, user_data=i, span_columns=True)
+						dpg.bind_item_handler_registry(selectable, self.hover_handler_tag)
+						for column in self.INFO_COLUMNS:
+							dpg.add_text("", tag=self.info_tag(i, column))
 		
 		dpg.pop_container_stack()
 
+		# Metadata and thumbnails are probed in the background and filled in as they come
+		for fp in filepaths:
+			self.media_info.request(fp, self.on_media_info)
+
+	def info_tag(self, row, column):
+		return f"video_reader_info_{self.UUID}_{row}_{column}"
+
+	def on_media_info(self, path, info):
+		"""Fills the info columns of a file (called from a MediaInfoCache worker)."""
+		row = self.row_of.get(path)
+		if row is None:
+			return
+		minutes, seconds = divmod(info["duration"], 60)
+		values = {
+			"Duration": f"{int(minutes)}:{seconds:05.2f}",
+			"Resolution": f"{info['width']}x{info['height']}",
+			"FPS": f"{info['fps']:.2f}",
+			"Codec": info["codec"],
+		}
+		for column, value in values.items():
+			ui_queue.set_value(self.info_tag(row, column), value)
+		if path == self.last_video_selected:
+			self.show_thumbnail(path)
+
+	def on_row_hover(self, sender, app_data):
+		row = dpg.get_item_user_data(app_data)
+		if row is not None and row < len(self.video_keys):
+			self.show_thumbnail(self.videos[self.video_keys[row]]["path"])
+
+	def show_thumbnail(self, path):
+		"""Shows the cached thumbnail of a file, if already probed."""
+		info = self.media_info.peek(path)
+		if path == self.thumb_shown or info is None or info["thumbnail"] is None:
+			return
+		self.thumb_shown = path
+		np.multiply(info["thumbnail"][..., ::-1], 1.0 / 255.0, out=self.thumb_buffer, casting="unsafe")
+		ui_queue.set_value(self.thumb_texture_tag, self.thumb_buffer)
+
 	def on_row_click(self, sender, app_data, user_data):
 		if self.last_selectable is not None:
 			dpg.set_value(self.last_selectable, False)
@@ -100,53 +285,342 @@ class VideoReader_win(WindowBase):
 		self.last_selectable = sender
 		name = self.video_keys[user_data]
 		self.last_video_selected = self.videos[name]["path"]
-		self.frame_cb(frame=video.read_first_frame(self.last_video_selected))
+		self.show_thumbnail(self.last_video_selected)
+		self.frame_index = None
+		self.position = 0
+		dpg.set_value(self.scrub_tag, 0)
+		self.request_preview(0)
+		self.request_index()
+
+	def request_index(self):
+		"""Loads (or builds and caches) the frame index of the selected video in the background."""
+		if self.index_thread is None or not self.index_thread.is_alive():
+			self.index_thread = threading.Thread(target=self.index_loop, daemon=True)
+			self.index_thread.start()
+
+	def index_loop(self):
+		"""Indexes the selected video, again if the selection changed meanwhile."""
+		while self.last_video_selected and (self.frame_index is None or self.frame_index.path != self.last_video_selected):
+			path = self.last_video_selected
+			try:
+				index = FrameIndex.load_or_build(path)
+			except Exception as e:
+				logger.warning(f"{self.winID} Could not index {path}: {e}")
+				return
+			if path == self.last_video_selected:
+				self.frame_index = index
+				ui_queue.configure_item(self.scrub_tag, max_value=max(0, index.frame_count - 1))
+				self.update_position(self.position)
+		self.index_thread = None
+
+	def keyframe_before(self, frame_no):
+		"""Returns the keyframe to seek from, or None if the selected video is not indexed (yet)."""
+		index = self.frame_index
+		if index is None or index.path != self.last_video_selected:
+			return None
+		return index.keyframe_before(frame_no)
+
+	def update_position(self, frame_no):
+		"""Moves the scrub bar and shows the frame time."""
+		ui_queue.set_value(self.scrub_tag, frame_no)
+		index = self.frame_index
+		if index is not None and index.path == self.last_video_selected:
+			ui_queue.set_value(self.position_tag, f"{index.time_of(frame_no) / 1000:.3f} s / {index.frame_count} frames")
+
+	def scrub_cb(self, sender, app_data):
+		"""Seeks the playing video, or previews the frame when stopped."""
+		if self.video_running:
+			self.seek_target = app_data
+		else:
+			self.position = app_data
+			self.request_preview(app_data)
+
+	def step(self, delta):
+		"""Shows the previous/next frame of the selected video (stopped only)."""
+		if self.video_running or not self.last_video_selected:
+			return
+		last = dpg.get_item_configuration(self.scrub_tag)["max_value"]
+		self.position = min(max(0, self.position + delta), last)
+		dpg.set_value(self.scrub_tag, self.position)
+		self.request_preview(self.position)
+
+	def set_cache_options(self, sender=None, app_data=None):
+		self.cache_mb = dpg.get_value(self.cache_mb_tag)
+		self.cache_gray = dpg.get_value(self.cache_gray_tag)
+		self.frame_cache.configure(max_bytes=self.cache_mb * 2**20, gray=self.cache_gray)
+		self.update_cache_stats()
+
+	def set_output_options(self, sender=None, app_data=None):
+		"""Output mode of the reader (applied from the next START while playing). Cached frames of the old mode are dropped."""
+		self.output_gray = dpg.get_value(self.output_gray_tag)
+		self.output_scale = self.OUTPUT_SCALES.get(dpg.get_value(self.output_scale_tag), 1)
+		self.roi = list(dpg.get_value(self.roi_tag))[:4]
+		self.decode_threads = dpg.get_value(self.threads_tag)
+		self.frame_cache.clear()
+		if not self.video_running and self.last_video_selected:
+			self.request_preview(self.position)
+
+	def apply_output(self, decoder):
+		decoder.set_output(self.output_gray, self.output_scale, self.roi, self.decode_threads)
+
+	def update_cache_stats(self):
+		stats = self.frame_cache.get_stats()
+		ui_queue.set_value(self.cache_stats_tag, f"{stats['frames']} frames, {stats['mb']:.0f} MB, {stats['hit_rate']:.0%} hits")
+
+	def request_preview(self, frame_no):
+		"""Shows a frame of the selected video from a background thread (latest request wins)."""
+		with self.preview_lock:
+			self.preview_request = (self.last_video_selected, frame_no)
+			if self.preview_thread is None:
+				self.preview_thread = threading.Thread(target=self.preview_loop, daemon=True)
+				self.preview_thread.start()
+
+	def preview_loop(self):
+		opened = None
+		while True:
+			with self.preview_lock:
+				request, self.preview_request = self.preview_request, None
+				if request is None:
+					self.preview.release()
+					self.preview_thread = None
+					return
+			path, frame_no = request
+			self.apply_output(self.preview)
+			if path != opened:
+				self.preview.set_video(path)
+				opened = path
+				if self.frame_index is None:
+					ui_queue.configure_item(self.scrub_tag, max_value=max(0, int(self.preview.video.get(cv2.CAP_PROP_FRAME_COUNT)) - 1))
+			frame = self.frame_cache.get(path, frame_no)
+			if frame is None:
+				frame = self.decode_preview(path, frame_no)
+			if frame is not None and not self.video_running:
+				index = self.frame_index
+				self.frame_cb(frame=frame, timestamp=index.time_of(frame_no) if index is not None and index.path == path else None)
+				self.update_position(frame_no)
+			self.update_cache_stats()
+
+	def decode_preview(self, path, frame_no):
+		"""
+		Decodes a frame with the preview capture and caches it.
+		Stepping backward decodes the whole span from the keyframe, so the next steps back are cache hits.
+		"""
+		keyframe = self.keyframe_before(frame_no)
+		start = frame_no
+		if keyframe is not None and frame_no < self.preview.position and frame_no - keyframe <= self.MAX_BACKFILL:
+			start = keyframe
+		self.preview.seek(start, keyframe)
+		frame = None
+		for n in range(start, frame_no + 1):
+			ret, frame = self.preview.read()
+			if not ret:
+				return None
+			frame = self.frame_cache.put(path, n, frame)
+		return frame
 
 	def play_loop(self):
-		next_frame_time = time.perf_counter()
+		"""
+		Dispatches decoded frames when their timestamp is due on the playback clock.
+		Decoding runs ahead in the prefetcher thread; late frames are handled by the late policy.
+		"""
+		self.start_decoding(self.position)
+		self.clock.start(self.frame_time(self.position))
+		self._dispatch_times.clear()
+		self.dropped = 0
+		drops_in_row = 0
+		ended = False
 
 		while self.video_running:
 			if not self.is_outputs_ready():
 				time.sleep(0.001)
 				continue
 
-			now = time.perf_counter()
-			if now < next_frame_time:
-				time.sleep(next_frame_time - now)
-				continue
+			if self.seek_target is not None:
+				self.position, self.seek_target = self.seek_target, None
+				self.start_decoding(self.position)
+				self.clock.start(self.frame_time(self.position))
 
-			ret, frame = video.read()
+			item = self.prefetcher.pop(timeout=0.5)
+			if item is None:
+				continue  # Decoder late: nothing to dispatch yet
+			ret, numbered = item
 			if not ret:
+				ended = True
 				break
-			if frame is not None:
-				self.frame_cb(frame=frame)
-
-			frame_interval = self.frame_interval
-			next_frame_time += frame_interval
-
-			if next_frame_time < time.perf_counter():
-				next_frame_time = time.perf_counter()
-
+			frame_no, frame = numbered
+			timestamp = self.frame_time(frame_no)
+
+			if self.clock.is_late(timestamp):
+				if self.late_policy == "Drop late":
+					if drops_in_row < self.MAX_DROPS_IN_ROW and self.clock.lateness(timestamp) <= self.MAX_DROP_LATENESS:
+						self.dropped += 1
+						drops_in_row += 1
+						continue
+					self.clock.start(timestamp)  # Decoding slower than the speed: show this one and follow the decoder
+				elif self.late_policy == "Skip ahead":
+					target = self.time_to_frame(self.clock.media_time() / 1000.0)
+					if self.clock.lateness(timestamp) > self.SKIP_AHEAD_LATENESS and target > frame_no:
+						self.dropped += target - frame_no
+						self.start_decoding(target)
+						continue
+				else:
+					self.clock.start(timestamp)  # Show all: slow down instead of dropping
+
+			if not self.wait_until(self.clock.due(timestamp)) or not self.wait_outputs_ready():
+				continue  # Stopped or seeking while waiting
+			drops_in_row = 0
+
+			if not self.frame_cache.gray:
+				self.frame_cache.put(self.playing_path, frame_no, frame)  # By reference: free in color mode
+
+			start = time.perf_counter()
+			self.frame_cb(frame=frame, timestamp=timestamp)
+			self._dispatch_times.append(time.perf_counter() - start)
+			self.update_position(frame_no)
+			self.position = frame_no + 1
+			self.update_stats()
+
+		self.prefetcher.stop()
+		if ended:
+			self.position = 0  # Reached the end: next START plays from the beginning
+		else:
+			self.position = max(0, self.position - 1)  # Back on the last shown frame, for stepping
+		self.update_cache_stats()
 		self.trigger_cb(event="STOP")
 		self.video_running = False
 		self.video_thread = None
 
+	def wait_until(self, due):
+		"""Sleeps until `due` (perf_counter). Returns False if playback stopped or a seek was requested meanwhile."""
+		while self.video_running and self.seek_target is None:
+			wait = due - time.perf_counter()
+			if wait <= 0:
+				return True
+			time.sleep(min(wait, 0.05))
+		return False
+
+	def wait_outputs_ready(self):
+		"""Waits until the connected modules accept a frame. Returns False if playback stopped or a seek was requested meanwhile."""
+		while self.video_running and self.seek_target is None:
+			if self.is_outputs_ready():
+				return True
+			time.sleep(0.001)
+		return False
+
+	def frame_time(self, frame_no):
+		"""Returns the presentation timestamp (ms) of a frame of the playing video."""
+		index = self.frame_index
+		if index is not None and index.path == self.playing_path and len(index.timestamps):
+			return index.time_of(frame_no)
+		return frame_no * 1000.0 / (self.source_fps or 30.0)
+
+	def start_decoding(self, frame_no):
+		"""(Re)starts the prefetcher from a frame."""
+		if self.prefetcher is not None:
+			self.prefetcher.stop()
+		self.video.seek(frame_no, self.keyframe_before(frame_no))
+		self.decode_position, self.decode_skip = frame_no, 0
+		self.prefetcher = FramePrefetcher(self.read_decimated, capacity=self.prefetch_frames)
+		self.prefetcher.start()
+
+	def read_decimated(self):
+		"""
+		Prefetcher read function: returns (ret, (frame_no, frame)) for the next kept frame.
+		Skipped frames are only grabbed, never retrieved, so they cost no color conversion or memory.
+		"""
+		frame_no = self.decode_position + self.decode_skip
+		if self.end_frame is not None and frame_no >= self.end_frame:
+			return False, None
+		ret, frame = self.video.read(skip=self.decode_skip)
+		self.decode_position = frame_no + 1
+		self.decode_skip = self.decimation_step() - 1
+		return ret, (frame_no, frame) if ret else None
+
+	def decimation_step(self):
+		"""Returns the distance between dispatched frames, from "Every N" and "Max FPS"."""
+		step = max(1, self.frame_step)
+		if self.max_output_fps > 0 and self.source_fps > 0:
+			step = max(step, math.ceil(self.source_fps / self.max_output_fps))
+		return step
+
+	def time_to_frame(self, seconds):
+		index = self.frame_index
+		if index is not None and index.path == self.playing_path:
+			return index.frame_at(seconds * 1000.0)
+		return int(round(seconds * self.source_fps))
+
+	def get_source_fps(self, path):
+		"""Returns the frame rate of a file, from its index or probed metadata when available."""
+		index = self.frame_index
+		if index is not None and index.path == path and index.fps:
+			return index.fps
+		info = self.media_info.peek(path)
+		if info is not None and info["fps"]:
+			return info["fps"]
+		capture = cv2.VideoCapture(path, cv2.CAP_FFMPEG)
+		fps = capture.get(cv2.CAP_PROP_FPS)
+		capture.release()
+		return fps
+
+	def update_stats(self):
+		"""Shows decode time vs dispatch time and the prefetch ring fill."""
+		stats = self.prefetcher.get_stats()
+		dispatch_ms = sum(self._dispatch_times) / len(self._dispatch_times) * 1000 if self._dispatch_times else 0.0
+		ui_queue.set_value(self.stats_tag,
+			f"Decode: {stats['decode_ms']:.1f} ms | Dispatch: {dispatch_ms:.1f} ms | "
+			f"Buffer: {stats['buffered']}/{stats['capacity']} | Underruns: {stats['underruns']} | Dropped: {self.dropped}")
+
 	def start_video(self):
 		if not self.last_video_selected:
 			logger.warning(f"{self.winID} No video selected to play.")
 			return
 
+		if self.video_thread is not None and self.video_thread.is_alive():
+			logger.warning(f"{self.winID} Video already playing.")
+			return
+
 		self.trigger_cb(event="START")
-		video.set_video(self.last_video_selected)
+		self.playing_path = self.last_video_selected
+		self.source_fps = self.get_source_fps(self.playing_path)
+		start_frame = self.time_to_frame(self.range_start)
+		self.end_frame = self.time_to_frame(self.range_end) if self.range_end > self.range_start else None
+		if self.position < start_frame or (self.end_frame is not None and self.position >= self.end_frame):
+			self.position = start_frame
+		decoder = self.get_decoder()
+		self.apply_output(decoder)
+		decoder.set_video(self.playing_path)
 		self.video_running = True
 
 		if self.video_thread is None or not self.video_thread.is_alive():
 			self.video_thread = threading.Thread(target=self.play_loop, daemon=True)
 			self.video_thread.start()
 
-	def set_playback_fps(self, sender, app_data):
-		self.playback_fps = app_data
-		self.frame_interval = 1.0 / max(1, self.playback_fps)
+	def get_decoder(self):
+		"""Returns this reader's decoder, (re)created if the decoding mode changed."""
+		decoder_class = Process_video_tools if self.decode_in_process else Video_tools
+		if type(self.video) is not decoder_class:
+			if self.video is not None:
+				self.video.close()
+			self.video = decoder_class()
+		return self.video
+
+	def close(self):
+		"""Stops playback and releases this reader's decoder before closing the window."""
+		self.video_running = False
+		if self.video_thread is not None:
+			self.video_thread.join(timeout=1)
+		if self.video is not None:
+			self.video.close()
+		self.preview_request = None
+		self.media_info.close()
+		super().close()
+		for tag in (self.thumb_registry_tag, self.hover_handler_tag):
+			if dpg.does_item_exist(tag):
+				dpg.delete_item(tag)
+
+	def set_playback_speed(self, sender, app_data):
+		self.playback_speed = self.SPEEDS.get(app_data, 1.0)
+		self.clock.set_speed(self.playback_speed)
 
 	def input_cb(self, *args, **kwargs):
 		path = kwargs.get("data") or (args[0] if args else None)
@@ -158,13 +632,13 @@ class VideoReader_win(WindowBase):
 			self.processing_required = False
 			self.processing_running = False
 
-	def frame_cb(self,frame):
-		"""Sends the last known status as STATUS_DICT to all outputs."""
+	def frame_cb(self, frame, timestamp=None):
+		"""Sends a frame and its media timestamp (ms) to the Frame output."""
 		for idx, output_key in enumerate(self.outputs):
 			connected_modules = self.connections.get(output_key, [])
 			for module in connected_modules:
 				if idx == 0:
-					module.input_cb(data=frame)
+					module.input_cb(data=frame, timestamp=timestamp, source=self.UUID)
 
 	def trigger_cb(self, event = None):
 		for idx, output_key in enumerate(self.outputs):
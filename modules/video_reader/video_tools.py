@@ -1,27 +1,178 @@
 import cv2
-import time 
+import time
+import queue
+from core.processing_base import ProcessingBase
 
 class Video_tools() :
+	'''Video decoder owned by a single reader (one cv2.VideoCapture per instance).'''
 	def __init__(self):
 		self.video = None
 		self.last_frame = None
+		self.position = 0  # Number of the next frame read() returns
+
+		# Output mode, applied right after decoding: ROI crop -> grayscale -> downscale
+		self.gray = False
+		self.scale = 1      # 1, 2 (half) or 4 (quarter)
+		self.roi = None     # (x, y, w, h) in source pixels
+		self.threads = 0    # FFmpeg decoding threads, 0 = backend default
 
 		self.fps = 30
 		self.playback_fps = 30
 		self.last_read_ts = time.perf_counter()
 
 	def set_video(self, path):
-		self.video = cv2.VideoCapture(path, cv2.CAP_FFMPEG)
+		self.release()
+		params = [cv2.CAP_PROP_N_THREADS, self.threads] if self.threads > 0 and hasattr(cv2, "CAP_PROP_N_THREADS") else []
+		self.video = cv2.VideoCapture(path, cv2.CAP_FFMPEG, params)
+		self.position = 0
+
+	def set_output(self, gray=False, scale=1, roi=None, threads=0):
+		'''Sets the output mode of the next reads. `threads` applies from the next set_video.'''
+		self.gray = gray
+		self.scale = max(1, int(scale))
+		self.roi = tuple(roi) if roi and roi[2] > 0 and roi[3] > 0 else None
+		self.threads = threads
+
+	def convert(self, frame):
+		'''Applies the output mode, cheapest first: the crop is a view, then each step shrinks the data for the next.'''
+		if self.roi is not None:
+			x, y, w, h = self.roi
+			frame = frame[y:y + h, x:x + w]
+		if self.gray and frame.ndim == 3:
+			frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+		if self.scale > 1:
+			frame = cv2.resize(frame, (max(1, frame.shape[1] // self.scale), max(1, frame.shape[0] // self.scale)), interpolation=cv2.INTER_AREA)
+		if not frame.flags.c_contiguous:
+			frame = frame.copy()  # Crop only: do not keep the full frame alive behind a view
+		return frame
 
-	def read(self):
+	def read(self, skip=0):
+		'''Reads the next frame, after grabbing `skip` frames without retrieving them (no color conversion).'''
 		if self.video is not None:
-			return self.video.read()
+			for _ in range(skip):
+				if not self.video.grab():
+					return False, None
+				self.position += 1
+			self.position += 1
+			ret, frame = self.video.read()
+			if ret and (self.gray or self.scale > 1 or self.roi is not None):
+				frame = self.convert(frame)
+			return ret, frame
 		return False, None
 
-	def read_first_frame(self, file) :
+	def seek(self, frame_no, keyframe=None):
+		'''
+		Positions the capture so the next read returns `frame_no`.
+		With a known keyframe (see FrameIndex), jumps there and grabs forward without color conversion,
+		otherwise lets the backend seek on its own. Targets between the keyframe and the current
+		position (e.g. stepping forward) are reached by grabbing from the current position.
+		'''
+		if self.video is None:
+			return False
+		if frame_no == self.position:
+			return True
+		if keyframe is None:
+			self.position = frame_no
+			return self.video.set(cv2.CAP_PROP_POS_FRAMES, frame_no)
+		if not keyframe <= self.position <= frame_no:
+			self.video.set(cv2.CAP_PROP_POS_FRAMES, keyframe)
+			self.position = keyframe
+		while self.position < frame_no:
+			if not self.video.grab():
+				return False
+			self.position += 1
+		return True
+
+	def release(self):
+		if self.video is not None:
+			self.video.release()
+			self.video = None
+
+	def close(self):
+		self.release()
+
+	@staticmethod
+	def read_first_frame(file) :
 		'''Get the first frame of the video'''
 		video = cv2.VideoCapture(file, cv2.CAP_FFMPEG)
 		ret , frame = video.read()
+		video.release()
 		return frame
 
-video = Video_tools() 
\ No newline at end of file
+
+class Video_decoder(ProcessingBase):
+	'''Worker process owning a Video_tools. Requests are (seq, cmd, arg) with cmd/arg ("open", path), ("read", skip),
+	("seek", (frame_no, keyframe)), ("output", (gray, scale, roi, threads)) or ("release", None); replies are (seq, result)
+	so the caller can pair them with its requests.
+	Frames are converted to the output mode in the worker, so only the reduced data crosses the process boundary.'''
+	def _process_data(self, data, p):
+		seq, cmd, arg = data
+		return seq, self._run(cmd, arg)
+
+	def _run(self, cmd, arg):
+		if not hasattr(self, "tools"):
+			self.tools = Video_tools()
+		if cmd == "open":
+			self.tools.set_video(arg)
+			return self.tools.video.isOpened(), None
+		if cmd == "read":
+			return self.tools.read(arg or 0)
+		if cmd == "seek":
+			return self.tools.seek(*arg), None
+		if cmd == "output":
+			self.tools.set_output(*arg)
+		if cmd == "release":
+			self.tools.release()
+		return False, None
+
+
+class Process_video_tools(Video_tools) :
+	'''Same interface as Video_tools, but decoding happens in a separate process (one per reader).'''
+	def __init__(self, timeout=5.0):
+		super().__init__()
+		self.timeout = timeout
+		self.seq = 0
+		self.decoder = Video_decoder(buffer_size=1, drop_policy='block')
+		self.decoder.start()
+
+	def set_video(self, path):
+		self._request(("open", path))
+
+	def read(self, skip=0):
+		return self._request(("read", skip))
+
+	def seek(self, frame_no, keyframe=None):
+		return self._request(("seek", (frame_no, keyframe)))[0]
+
+	def set_output(self, gray=False, scale=1, roi=None, threads=0):
+		self._request(("output", (gray, scale, roi, threads)))
+
+	def release(self):
+		self._request(("release", None))
+
+	def close(self):
+		self.decoder.stop()
+
+	def _request(self, request):
+		'''
+		Sends a request to the decoder process and waits for its answer.
+		Late replies to earlier requests that timed out are discarded, so a timeout never shifts the following answers.
+		'''
+		self.seq += 1
+		cmd, arg = request
+		try:
+			if not self.decoder.submit((self.seq, cmd, arg), timeout=self.timeout):
+				return False, None
+		except queue.Full:
+			return False, None
+		deadline = time.perf_counter() + self.timeout
+		while True:
+			remaining = deadline - time.perf_counter()
+			if remaining <= 0:
+				return False, None
+			reply = self.decoder.get(timeout=remaining)
+			if reply is None:
+				return False, None
+			seq, result = reply
+			if seq == self.seq:
+				return result
@@ -0,0 +1,87 @@
+import sys
+import types
+
+import numpy as np
+import pytest
+
+# The layer only needs DearPyGui inside _apply, which these tests replace: allow running without a GUI stack
+for name in ("dearpygui", "loguru"):
+	try:
+		__import__(name)
+	except ImportError:
+		if name == "dearpygui":
+			package = types.ModuleType("dearpygui")
+			package.dearpygui = types.ModuleType("dearpygui.dearpygui")
+			sys.modules["dearpygui"] = package
+			sys.modules["dearpygui.dearpygui"] = package.dearpygui
+		else:
+			module = types.ModuleType("loguru")
+			module.logger = types.SimpleNamespace(warning=print, info=print, error=print, debug=print)
+			sys.modules["loguru"] = module
+
+from core.ui_update_queue import ui_queue
+from modules.image_viewer.overlay_layer import OverlayLayer
+from tools.overlay.overlay import make_overlay
+
+
+@pytest.fixture
+def layer(monkeypatch):
+	"""OverlayLayer whose drawn overlays are recorded instead of applied to DearPyGui."""
+	ui_queue.drain()
+	layer = OverlayLayer("test", "plot")
+	layer.drawn = []
+	monkeypatch.setattr(layer, "_apply", lambda prepared: layer.drawn.append(prepared))
+	yield layer
+	ui_queue.drain()
+
+
+def overlay(frame_id, x=1.0):
+	return make_overlay((100, 100), points=[(x, 10)], frame_id=frame_id)
+
+
+def drawn_points(layer):
+	ui_queue.drain()
+	return [prepared["points"][0][0] for prepared in layer.drawn if prepared]
+
+
+def test_overlay_with_id_drawn_on_raw_frames(layer):
+	# Raw reader frames carry a source but no id: a Contour Detection overlay is drawn at once
+	layer.show_frame(None, "reader")
+	layer.update(overlay(frame_id=7), source="contour")
+	assert drawn_points(layer) == [1.0]
+
+
+def test_overlay_waits_for_its_frame(layer):
+	layer.show_frame(3, "contour")
+	layer.update(overlay(frame_id=4, x=4.0), source="contour")
+	assert drawn_points(layer) == []
+	layer.show_frame(4, "contour")
+	assert drawn_points(layer) == [4.0]
+
+
+def test_overlay_after_its_frame_drawn_at_once(layer):
+	layer.show_frame(5, "contour")
+	layer.update(overlay(frame_id=5, x=5.0), source="contour")
+	assert drawn_points(layer) == [5.0]
+
+
+def test_restarted_ids_are_not_dropped(layer):
+	layer.show_frame(500, "contour")
+	layer.update(overlay(frame_id=0, x=0.0), source="contour")  # Processor restarted: ids back to 0
+	layer.show_frame(0, "contour")
+	assert drawn_points(layer) == [0.0]
+
+
+def test_other_source_drawn_at_once(layer):
+	layer.show_frame(10, "contour")
+	layer.update(overlay(frame_id=2, x=2.0), source="tracker")
+	assert drawn_points(layer) == [2.0]
+
+
+def test_older_pending_overlays_pruned(layer):
+	layer.show_frame(1, "contour")
+	layer.update(overlay(frame_id=2, x=2.0), source="contour")
+	layer.update(overlay(frame_id=3, x=3.0), source="contour")
+	layer.show_frame(3, "contour")
+	assert drawn_points(layer) == [3.0]
+	assert not layer._pending
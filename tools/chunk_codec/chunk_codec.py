@@ -0,0 +1,36 @@
+import zlib
+import numpy as np
+
+try:
+	import blosc
+except ImportError:
+	blosc = None
+
+CODECS = ["zlib", "blosc"] if blosc is not None else ["zlib"]
+
+
+def compress_chunk(chunk: np.ndarray, codec: str, level: int) -> bytes:
+	"""
+	Compresses a block of frames (runs in a pool process).
+
+	Multi-byte pixels are byte-shuffled first (all low bytes, then all high bytes),
+	which makes 16-bit camera data far more compressible.
+	"""
+	if codec == "blosc" and blosc is not None:
+		return blosc.compress(chunk.tobytes(), typesize=chunk.dtype.itemsize, clevel=level, shuffle=blosc.SHUFFLE)
+	itemsize = chunk.dtype.itemsize
+	data = chunk.reshape(-1).view(np.uint8)
+	if itemsize > 1:
+		data = data.reshape(-1, itemsize).T.copy()
+	return zlib.compress(data.tobytes(), level)
+
+
+def decompress_chunk(blob: bytes, codec: str, shape: tuple, dtype) -> np.ndarray:
+	"""Inverse of compress_chunk, returns an array of `shape`."""
+	dtype = np.dtype(dtype)
+	if codec == "blosc":
+		return np.frombuffer(blosc.decompress(blob), dtype=dtype).reshape(shape)
+	data = np.frombuffer(zlib.decompress(blob), dtype=np.uint8)
+	if dtype.itemsize > 1:
+		data = data.reshape(dtype.itemsize, -1).T.copy()
+	return data.view(dtype).reshape(shape)
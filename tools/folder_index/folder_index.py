@@ -0,0 +1,85 @@
+import os
+from typing import Dict, Iterable, List, Tuple
+from natsort import natsorted
+
+
+def normalize_extensions(extensions) -> Tuple[str, ...]:
+	"""Accepts "mp4", ".mp4", "mp4,tif" or an iterable, returns (".mp4", ".tif")."""
+	if isinstance(extensions, str):
+		extensions = extensions.split(",")
+	return tuple("." + e.strip().lower().lstrip(".") for e in extensions if e.strip())
+
+
+class FolderIndex:
+	"""
+	Incremental index of the files of a folder, built on `os.scandir`.
+
+	Each `scan` lists the folder once and compares (size, mtime) with the previous
+	scan, so growing acquisition folders are never re-processed as a whole: only
+	added, changed and removed files are reported. Stat results come from the
+	directory entries (free on Windows, one stat per matching file elsewhere) and are
+	cached for sorting.
+
+	With `settle`, a new or modified file is only reported once its size and mtime
+	stayed the same for one whole scan interval, i.e. once the writer is done with it.
+	"""
+
+	def __init__(self, folder: str, extensions: Iterable[str] = (".mp4",), settle: bool = False):
+		"""
+		Args:
+			folder: Folder to index (not recursive).
+			extensions: Extensions to keep, e.g. (".mp4", ".avi") or "mp4,avi". Empty keeps every file.
+			settle: Report files only once they stopped changing.
+		"""
+		self.folder = folder
+		self.extensions = normalize_extensions(extensions)
+		self.settle = settle
+		self.entries: Dict[str, Tuple[int, int]] = {}   # Reported files: path -> (size, mtime_ns)
+		self._unsettled: Dict[str, Tuple[int, int]] = {}  # Seen but still changing
+
+	def scan(self) -> Tuple[List[str], List[str], List[str]]:
+		"""
+		Lists the folder and updates the index.
+
+		Returns:
+			(added, changed, removed) paths since the previous scan.
+		"""
+		current = {}
+		with os.scandir(self.folder) as it:
+			for entry in it:
+				if self.extensions and not entry.name.lower().endswith(self.extensions):
+					continue
+				try:
+					if not entry.is_file():
+						continue
+					stat = entry.stat()
+				except OSError:
+					continue  # Deleted meanwhile
+				current[entry.path] = (stat.st_size, stat.st_mtime_ns)
+
+		added, changed = [], []
+		for path, signature in current.items():
+			known = self.entries.get(path)
+			if known == signature:
+				continue
+			if self.settle and self._unsettled.get(path) != signature:
+				self._unsettled[path] = signature  # Report at the next scan if unchanged
+				continue
+			self._unsettled.pop(path, None)
+			(changed if known is not None else added).append(path)
+			self.entries[path] = signature
+
+		removed = [path for path in self.entries if path not in current]
+		for path in removed:
+			del self.entries[path]
+		for path in [p for p in self._unsettled if p not in current]:
+			del self._unsettled[path]
+		return added, changed, removed
+
+	def files(self, sort_by: str = "name") -> List[str]:
+		"""Returns the indexed paths, sorted naturally by name or by modification time."""
+		if sort_by == "name":
+			return natsorted(self.entries)
+		if sort_by == "date":
+			return sorted(self.entries, key=lambda path: self.entries[path][1])
+		raise ValueError("sort_by must be 'name' or 'date'")
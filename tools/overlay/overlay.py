@@ -0,0 +1,44 @@
+import numpy as np
+
+def make_overlay(shape,
+				boxes=None,
+				points=None,
+				polylines=None,
+				labels=None,
+				box_color=(0, 255, 0),
+				point_color=(255, 0, 0),
+				polyline_colors=None,
+				label_color=(0, 255, 0),
+				frame_id=None) -> dict:
+	"""
+	Builds an OVERLAY payload: vector annotations drawn by the viewers on top of the frame,
+	instead of being burned into the pixels.
+
+	Coordinates are in frame pixels (x, row), row 0 at the top. Colors are RGB 0-255.
+
+	Args:
+		shape: Shape of the annotated frame (only height and width are used).
+		boxes: (N, 4, 2) corners of (rotated) boxes.
+		points: (N, 2) point positions (e.g. centroids).
+		polylines: List of (M, 2) arrays (e.g. tracking trails).
+		labels: List of (x, y, text).
+		polyline_colors: One RGB color per polyline (defaults to box_color).
+		frame_id: Sequence number of the annotated frame, sent with it as `frame_id=` so viewers
+			show the overlay on the frame it was computed from. None draws it on whatever is displayed.
+
+	Returns:
+		dict with compact float32 arrays, cheap to pickle between processes.
+	"""
+	polylines = [np.asarray(line, dtype=np.float32).reshape(-1, 2) for line in (polylines or [])]
+	return {
+		"shape": tuple(shape[:2]),
+		"boxes": np.asarray(boxes if boxes is not None else [], dtype=np.float32).reshape(-1, 4, 2),
+		"points": np.asarray(points if points is not None else [], dtype=np.float32).reshape(-1, 2),
+		"polylines": polylines,
+		"labels": list(labels or []),
+		"box_color": tuple(box_color),
+		"point_color": tuple(point_color),
+		"polyline_colors": list(polyline_colors) if polyline_colors is not None else [tuple(box_color)] * len(polylines),
+		"label_color": tuple(label_color),
+		"frame_id": frame_id,
+	}